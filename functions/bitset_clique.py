@@ -0,0 +1,875 @@
+"""
+Bitset helpers used by the clique algorithms.
+Nodes are relabeled to 0..n-1 and every set of nodes is stored as a single int,
+where bit i is set if and only if node i is in the set.
+"""
+import heapq
+import random
+import time
+
+def to_bitsets(G, order=None):
+    """
+    Relabels the nodes of G to 0..n-1 and builds one adjacency int per node.
+    Parameters:
+        G (networkx.Graph): The graph.
+        order (list): optional, the node order used for the relabeling.
+    Returns:
+        nodes (list): nodes[i] is the original node that was given label i.
+        index (dict): Maps every original node to its label.
+        adj (list): adj[i] is an int with bit j set if and only if i and j are adjacent.
+    """
+    nodes = list(order) if order is not None else list(G)
+    index = {u: i for i, u in enumerate(nodes)}
+    adj = [0] * len(nodes)
+    for u, i in index.items():
+        row = 0
+        for v in G[u]:
+            if v != u:
+                row |= 1 << index[v]
+        adj[i] = row
+    return nodes, index, adj
+
+def start_state(G, nodes=None, order=None):
+    """
+    Builds the bitsets of G and the starting clique and candidates of a search.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in the clique.
+        order (list): optional, the node order used for the relabeling.
+    Returns:
+        node_list (list): node_list[i] is the node with label i.
+        adj (list): Bitset adjacency rows.
+        Q (list): Labels of the given nodes.
+        cand (int): Bitset of the nodes adjacent to every node in Q.
+    """
+    node_list, index, adj = to_bitsets(G, order)
+    Q = []
+    cand = (1 << len(node_list)) - 1
+
+    # If user provided initial clique nodes, verify they form a clique
+    for node in (nodes or []):
+        if node not in index or not cand >> index[node] & 1:
+            raise ValueError(f"The given `nodes` {nodes} do not form a clique")
+        Q.append(index[node])
+        cand &= adj[index[node]] # Intersect candidates with neighbors of current node
+    return node_list, adj, Q, cand
+
+def iter_bits(x):
+    """
+    Iterates over the labels stored in a bitset, lowest label first.
+    Parameters:
+        x (int): The bitset.
+    """
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+def to_nodes(nodes, x):
+    """
+    Maps a bitset (or an iterable of labels) back to the original nodes.
+    Parameters:
+        nodes (list): nodes[i] is the original node with label i.
+        x (int or iterable): The labels.
+    Returns:
+        list: The original nodes.
+    """
+    if isinstance(x, int):
+        x = iter_bits(x)
+    return [nodes[i] for i in x]
+
+def color_classes(P, adj, strategy=None):
+    """
+    Greedily colours the nodes in P and returns the colour classes.
+    Parameters:
+        P (int): Bitset of the nodes to colour.
+        adj (list): Bitset adjacency rows.
+        strategy (str): optional, None colours the nodes in label order,
+                        "largest_first" and "random_sequential" follow the networkX strategies.
+    Returns:
+        classes (list): One bitset per colour, classes[k] holds the nodes given colour k.
+    """
+    classes = []
+    if strategy is None:
+        # Build one maximal independent set at a time, scanning in label order
+        uncolored = P
+        while uncolored:
+            color = 0
+            Q = uncolored
+            while Q:
+                low = Q & -Q
+                color |= low
+                Q &= ~(adj[low.bit_length() - 1] | low)
+            uncolored &= ~color
+            classes.append(color)
+        return classes
+
+    if strategy == "largest_first":
+        order = sorted(iter_bits(P), key=lambda v: (adj[v] & P).bit_count(), reverse=True)
+    elif strategy == "random_sequential":
+        order = list(iter_bits(P))
+        random.shuffle(order)
+    else:
+        raise ValueError(f"Unknown colouring strategy {strategy}")
+
+    # Assign each node the smallest colour not used by its neighbours
+    for v in order:
+        nv = adj[v]
+        for k, color in enumerate(classes):
+            if not color & nv:
+                classes[k] = color | (1 << v)
+                break
+        else:
+            classes.append(1 << v)
+    return classes
+
+def pivot_search(adj, cand, Q=None, coloring=None, partial=False, incremental=False, stats=None,
+                 subg=None, incumbent=None, ext_u=None, donor=None, deadline=None, seed=None,
+                 eliminate=False, maxsat_depth=None):
+    """
+    The pivoting search loop of max_clique() run on bitsets.
+    Sets of nodes are ints, so intersections are a single & and sizes are bit_count().
+    Parameters:
+        adj (list): Bitset adjacency rows.
+        cand (int): Bitset of the candidate nodes.
+        Q (list): optional, labels of nodes already in the clique (all adjacent to cand).
+        coloring (function): optional, maps a candidate bitset to its colour classes, the number
+                             of classes is used as the bound. Defaults to the number of candidates.
+        partial (bool): optional, only colour every 3 iterations.
+        incremental (bool): optional, first try the parent's colour classes restricted to the
+                            child candidates (plus Re-NUMBER) and only recolour if they cannot prune.
+        stats (dict): optional, filled with the "colorings" run and the "recolors_avoided".
+        subg (int): optional, bitset of the subgraph nodes when resuming a branch. Defaults to cand.
+        incumbent (multiprocessing.Value): optional, size of the best clique found by any process.
+                                           It is read every 256 steps and raised on improvement.
+        ext_u (int): optional, bitset of the nodes still to branch on when resuming a frame.
+                     Defaults to the candidates that are not neighbours of the pivot.
+        donor (object): optional, every 256 steps donor.wanted() is asked whether another worker is
+                        idle, and if so the oldest frame with unexplored branches is handed over with
+                        donor.give(Q, subg, cand, ext_u) and dropped from this search.
+        deadline (float): optional, time.perf_counter() value after which the search stops early.
+                          stats then gets the "upper_bound" proven so far and whether it is "optimal".
+        seed (list): optional, labels of a clique found beforehand (by a heuristic), the search
+                     starts with it as the largest clique and only looks for larger ones.
+        eliminate (bool): optional, remove the nodes eliminate_nodes() proves useless at the start and
+                          every time a larger clique is found, stats gets the number "eliminated".
+        maxsat_depth (int): optional, when the colour classes of a search node at most this many levels
+                            below the root can not prune it, try the tighter maxsat_bound() on them.
+                            stats gets the "maxsat_calls" and "maxsat_prunes".
+    Returns:
+        max_clique (list): Labels of the largest clique found (only cliques larger than the
+                           incumbent are recorded).
+        steps (int): The number of steps taken by the search.
+    """
+    Q = Q[:] if Q is not None else []
+    max_clique = Q[:]
+    if seed is not None and len(seed) > len(max_clique):
+        max_clique = list(seed)
+    best = len(max_clique)
+    if incumbent is not None:
+        best = max(best, incumbent.value)
+    colorings = recolors_avoided = 0
+    maxsat_calls = maxsat_prunes = 0
+    if not cand:
+        _record(stats, colorings, recolors_avoided)
+        return max_clique, 0
+
+    if subg is None:
+        subg = cand
+    stack = [] # Stack to simulate recursion
+    classes = None # Colour classes of cand, when it was coloured
+
+    # Nodes that may still be in a larger clique, every clique found extends the base nodes
+    base = len(Q)
+    alive = start_nodes = subg
+    if eliminate:
+        alive = eliminate_nodes(adj, alive, best - base)
+        subg &= alive
+        cand &= alive
+        if ext_u is not None:
+            ext_u &= alive
+
+    Q.append(None) # Place holder for new nodes
+
+    if ext_u is None:
+        u = choose_pivot(subg, cand, adj)
+        ext_u = cand & ~adj[u]
+    steps = 0
+    timed_out = False
+
+    while True:
+        steps += 1
+        if steps & 255 == 0:
+            if deadline is not None and time.perf_counter() > deadline:
+                timed_out = True
+                break
+            if incumbent is not None:
+                best = max(best, incumbent.value)
+            if donor is not None and donor.wanted():
+                # Hand the oldest frame with unexplored branches to an idle worker
+                base = len(Q) - 1 - len(stack)
+                for j, (f_subg, f_cand, f_ext_u, f_classes) in enumerate(stack):
+                    if f_ext_u:
+                        if donor.give(Q[:base + j], f_subg, f_cand, f_ext_u):
+                            stack[j] = (f_subg, f_cand, 0, f_classes)
+                        break
+                else:
+                    if ext_u and donor.give(Q[:-1], subg, cand, ext_u):
+                        ext_u = 0
+        if ext_u:
+            # Pick the lowest node from ext_u to try adding to clique
+            low = ext_u & -ext_u
+            ext_u ^= low
+            cand ^= low
+            q = low.bit_length() - 1
+            Q[-1] = q
+
+            adj_q = adj[q]
+            subg_q = subg & adj_q
+
+            if not subg_q:
+                if len(Q) > best:
+                    max_clique = Q[:] # Found larger clique
+                    best = len(Q)
+                    if incumbent is not None:
+                        share_incumbent(incumbent, best)
+                    if eliminate:
+                        # The larger clique can make more nodes useless, drop them from every level
+                        alive = eliminate_nodes(adj, alive, best - base)
+                        subg &= alive
+                        cand &= alive
+                        ext_u &= alive
+                        stack = [(f_subg & alive, f_cand & alive, f_ext_u & alive, f_classes)
+                                 for f_subg, f_cand, f_ext_u, f_classes in stack]
+            else:
+                # Reduce candidate set to only neighbors of q
+                cand_q = cand & adj_q
+                classes_q = None
+
+                limit = cand_q.bit_count()
+                if incremental and classes is not None:
+                    # The parent's colouring is still valid on the child candidates
+                    classes_q = inherit_classes(classes, cand_q, adj, best - len(Q))
+                    limit = min(limit, len(classes_q))
+                    if len(Q) + limit <= best:
+                        recolors_avoided += 1
+                        continue
+
+                if coloring is not None and not (partial and len(Q) % 3 != 0):
+                    classes_q = coloring(cand_q)
+                    colorings += 1
+                    limit = len(classes_q)
+
+                if (maxsat_depth is not None and len(stack) < maxsat_depth and classes_q is not None
+                        and len(Q) <= best < len(Q) + limit):
+                    # Every inconsistent subset of classes costs the bound one colour
+                    maxsat_calls += 1
+                    limit = maxsat_bound(classes_q, adj, len(classes_q) - (best - len(Q)))
+                    if len(Q) + limit <= best:
+                        maxsat_prunes += 1
+
+                if len(Q) + limit > best:
+                    stack.append((subg, cand, ext_u, classes))
+                    Q.append(None)
+
+                    #Update state for recursive call
+                    subg = subg_q
+                    cand = cand_q
+                    classes = classes_q
+                    u = choose_pivot(subg, cand, adj)
+                    ext_u = cand & ~adj[u]
+        else:
+            # Backtrack: no more extension nodes to try
+            Q.pop()
+            if not stack:
+                break
+            subg, cand, ext_u, classes = stack.pop()
+
+    _record(stats, colorings, recolors_avoided)
+    if maxsat_depth is not None:
+        _record_maxsat(stats, maxsat_calls, maxsat_prunes)
+    if eliminate and stats is not None:
+        stats["eliminated"] = stats.get("eliminated", 0) + start_nodes.bit_count() - alive.bit_count()
+    if deadline is not None:
+        upper_bound = best
+        if timed_out:
+            base = len(Q) - 1 - len(stack)
+            levels = [(base + j, f_cand, f_cand.bit_count()) for j, (_, f_cand, f_ext_u, _) in enumerate(stack)
+                      if f_ext_u]
+            if ext_u:
+                levels.append((len(Q) - 1, cand, cand.bit_count()))
+            upper_bound = open_bound(adj, levels, best)
+        _record_bound(stats, upper_bound, not timed_out)
+    return max_clique, steps
+
+def ranked_search(adj, cand, Q=None, k=None, stats=None):
+    """
+    The pivoting search loop of pivot_search() that keeps several cliques instead of one.
+    Every leaf is a maximal clique, and a branch is pruned when the clique plus the colour classes
+    of its candidates is smaller than the smallest size still kept: the maximum size found so far
+    (a >= comparison, so every optimum survives), or one more than the k-th largest size once k
+    cliques are kept.
+    Parameters:
+        adj (list): Bitset adjacency rows.
+        cand (int): Bitset of the candidate nodes.
+        Q (list): optional, labels of nodes already in the clique (all adjacent to cand).
+        k (int): optional, keep the k largest maximal cliques. Defaults to every maximum clique.
+        stats (dict): optional, filled with the "colorings" run.
+    Returns:
+        cliques (list): Label lists of the cliques kept, largest first.
+        steps (int): The number of steps taken by the search.
+    """
+    Q = Q[:] if Q is not None else []
+    if not cand:
+        _record(stats, 0, 0)
+        return [Q], 0
+
+    kept = [] # Every maximum clique, or a min-heap of (size, count, clique) for the k largest
+    count = 0
+    floor = len(Q) + 1 # Smallest clique size still kept
+    subg = cand
+    stack = [] # Stack to simulate recursion
+    Q.append(None) # Place holder for new nodes
+    u = choose_pivot(subg, cand, adj)
+    ext_u = cand & ~adj[u]
+    steps = colorings = 0
+
+    while True:
+        steps += 1
+        if ext_u:
+            low = ext_u & -ext_u
+            ext_u ^= low
+            cand ^= low
+            q = low.bit_length() - 1
+            Q[-1] = q
+            adj_q = adj[q]
+            subg_q = subg & adj_q
+
+            if not subg_q:
+                if len(Q) >= floor:
+                    if k is None:
+                        if len(Q) > floor:
+                            kept = []
+                        kept.append(Q[:])
+                        floor = len(Q)
+                    else:
+                        count += 1
+                        if len(kept) < k:
+                            heapq.heappush(kept, (len(Q), count, Q[:]))
+                        else:
+                            heapq.heapreplace(kept, (len(Q), count, Q[:]))
+                        if len(kept) == k:
+                            floor = kept[0][0] + 1
+            else:
+                cand_q = cand & adj_q
+                limit = cand_q.bit_count()
+                if len(Q) + limit >= floor:
+                    limit = len(color_classes(cand_q, adj))
+                    colorings += 1
+                if len(Q) + limit >= floor:
+                    stack.append((subg, cand, ext_u))
+                    Q.append(None)
+                    subg = subg_q
+                    cand = cand_q
+                    u = choose_pivot(subg, cand, adj)
+                    ext_u = cand & ~adj[u]
+        else:
+            # Backtrack: no more extension nodes to try
+            Q.pop()
+            if not stack:
+                break
+            subg, cand, ext_u = stack.pop()
+
+    _record(stats, colorings, 0)
+    if k is not None:
+        kept = [clique for size, _, clique in sorted(kept, reverse=True)]
+    return kept, steps
+
+def eliminate_nodes(adj, alive, k):
+    """
+    Removes the nodes of alive that can not be in a clique of more than k nodes of alive.
+    Such a clique needs k neighbours inside it for every node, so nodes of core number below k
+    are peeled off, and a node whose neighbourhood can be coloured with k - 1 colours is removed.
+    Both rules are repeated until neither removes a node.
+    Parameters:
+        adj (list): Bitset adjacency rows.
+        alive (int): Bitset of the nodes still in the graph.
+        k (int): Size of the clique to beat, counted inside alive.
+    Returns:
+        alive (int): The nodes that are left.
+    """
+    if k <= 0:
+        return alive
+    queue = list(iter_bits(alive))
+    check = alive # Nodes whose neighbourhood changed since its colouring was checked
+    while check:
+        # Peel nodes of degree below k, rechecking the neighbours of every removed node
+        while queue:
+            v = queue.pop()
+            if alive >> v & 1 and (adj[v] & alive).bit_count() < k:
+                alive ^= 1 << v
+                queue.extend(iter_bits(adj[v] & alive))
+                check |= adj[v]
+
+        todo, check = check & alive, 0
+        for v in iter_bits(todo):
+            if _fewer_colors(adj[v] & alive, adj, k):
+                alive ^= 1 << v
+                queue.extend(iter_bits(adj[v] & alive))
+                check |= adj[v]
+    return alive
+
+def _fewer_colors(P, adj, k):
+    """
+    Returns True if the greedy colouring of color_classes() colours P with fewer than k colours.
+    Stops as soon as k - 1 colours are used.
+    """
+    for _ in range(k - 1):
+        if not P:
+            return True
+        # Build one maximal independent set, scanning in label order
+        Q = P
+        while Q:
+            low = Q & -Q
+            P ^= low
+            Q &= ~(adj[low.bit_length() - 1] | low)
+    return not P
+
+def inherit_classes(classes, P, adj, kmin):
+    """
+    Restricts a parent's colour classes to the child candidates P.
+    If more than kmin classes are left, Re-NUMBER tries to empty the classes above kmin.
+    Parameters:
+        classes (list): The parent's colour classes, they must cover P.
+        P (int): Bitset of the child candidates.
+        adj (list): Bitset adjacency rows.
+        kmin (int): Number of classes the child can afford without improving.
+    Returns:
+        list: The non-empty colour classes of P.
+    """
+    inherited = [color & P for color in classes if color & P]
+    if 0 < kmin < len(inherited):
+        inherited = renumber_classes(inherited, adj, kmin)
+    return inherited
+
+def open_bound(adj, levels, best):
+    """
+    Upper bound on the cliques a search that stopped early could still have found.
+    The unexplored branches of a level only add candidates of that level to its clique,
+    so a level can not beat its clique size plus the number of colours of its candidates.
+    Parameters:
+        adj (list): Bitset adjacency rows.
+        levels (list): (size, cand, limit) tuples, the clique size, candidate bitset and the bound
+                       the search already had on the candidates of every level with unexplored branches.
+        best (int): Size of the best clique found.
+    Returns:
+        int: No clique of the graph reachable from the open levels is larger than this.
+    """
+    bound = best
+    for size, cand, limit in levels:
+        if size + limit > bound:
+            bound = max(bound, size + min(limit, len(color_classes(cand, adj))))
+    return bound
+
+def share_incumbent(incumbent, size):
+    """
+    Raises a shared incumbent to size, unless another process already found a larger clique.
+    Parameters:
+        incumbent (multiprocessing.Value): The shared size of the best clique.
+        size (int): The size of the clique just found.
+    """
+    with incumbent.get_lock():
+        if size > incumbent.value:
+            incumbent.value = size
+
+def maxsat_bound(classes, adj, excess):
+    """
+    Tightens the colouring bound by reading the colour classes as soft clauses (MaxCLQ).
+    A clique holds at most one node of every class, and two nodes that are not adjacent can not
+    both be in it. Unit propagation from the classes down to one node finds a class that runs
+    empty, the classes that emptied it are an inconsistent subset (they can not all give a node).
+    When propagation finds none, a small class whose every node runs into a conflict (failed
+    literals) is inconsistent together with all those conflicts. Every subset found is set aside
+    before looking for the next, so each one lowers the bound by one.
+    Parameters:
+        classes (list): Colour classes of the candidate nodes, as bitsets.
+        adj (list): Bitset adjacency rows.
+        excess (int): How far the bound has to drop to prune, the search stops once it did.
+    Returns:
+        bound (int): No clique among the candidates has more nodes than this.
+    """
+    pool = list(classes)
+    found = 0
+    while found < excess:
+        conflict = _inconsistent_subset(pool, adj)
+        if not conflict:
+            break
+        pool = [c for k, c in enumerate(pool) if not conflict >> k & 1]
+        found += 1
+    return len(classes) - found
+
+def _inconsistent_subset(classes, adj, size=3):
+    """
+    Looks for an inconsistent subset of the classes, first by unit propagation and then by
+    testing every node of the classes of at most size nodes left (smallest first) as a failed literal.
+    Returns:
+        conflict (int): Bitset of the indices of the classes in the subset, 0 if none was found.
+    """
+    current = list(classes)
+    reason = [1 << k for k in range(len(classes))] # Classes that forced each class down to its nodes
+    fixed = [False] * len(classes)
+    queue = [k for k, c in enumerate(current) if not c & (c - 1)]
+    conflict = _propagate(current, reason, fixed, queue, adj)
+    if conflict:
+        return conflict
+
+    for i in sorted((k for k in range(len(classes)) if not fixed[k]), key=lambda k: current[k].bit_count()):
+        if current[i].bit_count() > size:
+            break
+        conflict = reason[i]
+        for v in iter_bits(current[i]):
+            # Propagate on top of the state the plain unit propagation left
+            tried = current[:]
+            tried[i] = 1 << v
+            failed = _propagate(tried, reason[:], fixed[:], [i], adj)
+            if not failed:
+                break
+            conflict |= failed
+        else:
+            return conflict
+    return 0
+
+def _propagate(current, reason, fixed, queue, adj):
+    """
+    Unit propagation, changes the lists in place. Every queued class is down to one node, which
+    goes in the clique and removes its non-neighbours from the classes not fixed yet.
+    Returns:
+        conflict (int): The reason of the first class that runs empty, 0 if none does.
+    """
+    while queue:
+        i = queue.pop()
+        if fixed[i]:
+            continue
+        fixed[i] = True
+        row = adj[current[i].bit_length() - 1]
+        r = reason[i]
+        for j, c in enumerate(current):
+            if c & ~row and not fixed[j]:
+                c &= row
+                current[j] = c
+                reason[j] |= r
+                if not c:
+                    return reason[j]
+                if not c & (c - 1):
+                    queue.append(j)
+    return 0
+
+def _record(stats, colorings, recolors_avoided):
+    """
+    Stores the colouring counters of a search in stats, when given.
+    """
+    if stats is not None:
+        stats["colorings"] = stats.get("colorings", 0) + colorings
+        stats["recolors_avoided"] = stats.get("recolors_avoided", 0) + recolors_avoided
+
+def _record_maxsat(stats, calls, prunes):
+    """
+    Stores the MaxSAT bound counters of a search in stats, when given.
+    """
+    if stats is not None:
+        stats["maxsat_calls"] = stats.get("maxsat_calls", 0) + calls
+        stats["maxsat_prunes"] = stats.get("maxsat_prunes", 0) + prunes
+
+def _record_bound(stats, upper_bound, optimal):
+    """
+    Stores the upper bound of a search with a deadline in stats, when given.
+    """
+    if stats is not None:
+        stats["upper_bound"] = upper_bound
+        stats["optimal"] = optimal
+
+def choose_pivot(subg, cand, adj):
+    """
+    Returns the node of subg with the most neighbours in cand.
+    """
+    best, best_count = -1, -1
+    while subg:
+        low = subg & -subg
+        subg ^= low
+        v = low.bit_length() - 1
+        count = (cand & adj[v]).bit_count()
+        if count > best_count:
+            best, best_count = v, count
+    return best
+
+def color_sort(P, adj, kmin, renumber=False, classes=None):
+    """
+    Colours P in label order and lists the nodes worth branching on (Tomita MCQ).
+    A node with colour k can only lead to a larger clique if k > kmin, so nodes in the
+    first kmin colour classes are left out.
+    Parameters:
+        P (int): Bitset of the candidate nodes.
+        adj (list): Bitset adjacency rows.
+        kmin (int): Number of colours the current clique can afford without improving.
+        renumber (bool): optional, try to move nodes out of the classes above kmin (MCS Re-NUMBER).
+        classes (list): optional, colour classes of P to use instead of colouring it again.
+    Returns:
+        verts (list): Nodes with colour > kmin, in increasing colour order.
+        cols (list): cols[i] is the colour (1-based) of verts[i].
+        classes (list): The colour classes of P.
+    """
+    if classes is None:
+        classes = color_classes(P, adj)
+    kmin = max(kmin, 0)
+    if renumber and 0 < kmin < len(classes):
+        classes = renumber_classes(classes, adj, kmin)
+
+    verts, cols = [], []
+    for k in range(kmin, len(classes)):
+        for v in iter_bits(classes[k]):
+            verts.append(v)
+            cols.append(k + 1)
+    return verts, cols, classes
+
+def renumber_classes(classes, adj, kmin):
+    """
+    MCS Re-NUMBER: tries to move every node coloured above kmin into one of the first kmin classes.
+    A node v fits class k1 directly if it has no neighbour there, or by swapping if it has
+    exactly one neighbour w there and w has no neighbour in a later class k2 <= kmin.
+    Parameters:
+        classes (list): Colour classes as bitsets, changed in place.
+        adj (list): Bitset adjacency rows.
+        kmin (int): Number of classes the nodes are moved into.
+    Returns:
+        classes (list): The colour classes with empty classes removed.
+    """
+    for k in range(kmin, len(classes)):
+        for v in iter_bits(classes[k]):
+            nv = adj[v]
+            for k1 in range(kmin):
+                conflict = classes[k1] & nv
+                if not conflict:
+                    classes[k1] |= 1 << v
+                    classes[k] ^= 1 << v
+                    break
+                if conflict & (conflict - 1) == 0:
+                    # Exactly one neighbour w in class k1
+                    nw = adj[conflict.bit_length() - 1]
+                    for k2 in range(k1 + 1, kmin):
+                        if not classes[k2] & nw:
+                            classes[k1] ^= conflict | (1 << v)
+                            classes[k2] |= conflict
+                            classes[k] ^= 1 << v
+                            break
+                    else:
+                        continue
+                    break
+    return [color for color in classes if color]
+
+def color_search(adj, cand, Q=None, renumber=False, partial=False, incremental=False, stats=None,
+                 deadline=None, seed=None, maxsat_depth=None):
+    """
+    Branch and bound that branches on the nodes of the highest colour class first (Tomita MCQ/MCR/MCS).
+    Every search node is coloured on the bitsets and the colour of a node is used as the bound
+    for the branch that starts with it.
+    Parameters:
+        adj (list): Bitset adjacency rows, labels should follow the initial ordering.
+        cand (int): Bitset of the candidate nodes.
+        Q (list): optional, labels of nodes already in the clique (all adjacent to cand).
+        renumber (bool): optional, apply MCS Re-NUMBER after every colouring.
+        partial (bool): optional, only colour every 3 iterations, the other levels
+                        give every candidate its own colour.
+        incremental (bool): optional, carry the parent's colour classes down the search stack.
+                            A child is pruned on them without recolouring when possible, and
+                            the levels skipped by partial branch on them instead of their own colours.
+        stats (dict): optional, filled with the "colorings" run and the "recolors_avoided".
+        deadline (float): optional, time.perf_counter() value after which the search stops early.
+                          stats then gets the "upper_bound" proven so far and whether it is "optimal".
+        seed (list): optional, labels of a clique found beforehand, the search only looks for larger ones.
+        maxsat_depth (int): optional, when a search node at most this many levels below the root still
+                            has nodes to branch on, try to prune it with maxsat_bound() on its colour classes.
+                            stats gets the "maxsat_calls" and "maxsat_prunes".
+    Returns:
+        max_clique (list): Labels of the largest clique found.
+        steps (int): The number of steps taken by the search.
+    """
+    Q = Q[:] if Q is not None else []
+    max_clique = Q[:]
+    if seed is not None and len(seed) > len(max_clique):
+        max_clique = list(seed)
+    colorings = recolors_avoided = 0
+    maxsat_calls = maxsat_prunes = 0
+    if not cand:
+        _record(stats, colorings, recolors_avoided)
+        return max_clique, 0
+
+    P = cand
+    verts, cols, classes = color_sort(P, adj, 0, renumber)
+    colorings += 1
+    stack = [] # Stack to simulate recursion
+    steps = 0
+    timed_out = False
+
+    while True:
+        steps += 1
+        if deadline is not None and steps & 255 == 0 and time.perf_counter() > deadline:
+            timed_out = True
+            break
+        if verts and len(Q) + cols[-1] > len(max_clique):
+            # Branch on the node with the highest colour
+            v = verts.pop()
+            cols.pop()
+            P ^= 1 << v
+            P_v = P & adj[v]
+            Q.append(v)
+
+            if not P_v:
+                if len(Q) > len(max_clique):
+                    max_clique = Q[:] # Found larger clique
+                Q.pop()
+                continue
+
+            kmin = len(max_clique) - len(Q)
+            P_classes = None
+            if incremental and classes is not None:
+                # The parent's colouring is still valid on the child candidates
+                P_classes = inherit_classes(classes, P_v, adj, kmin)
+                if len(Q) + len(P_classes) <= len(max_clique):
+                    recolors_avoided += 1
+                    Q.pop()
+                    continue
+
+            if partial and len(Q) % 3 != 0:
+                if P_classes is not None:
+                    P_verts, P_cols, P_classes = color_sort(P_v, adj, kmin, False, P_classes)
+                else:
+                    # Skip the colouring, every candidate gets its own colour
+                    P_verts = list(iter_bits(P_v))[max(kmin, 0):]
+                    P_cols = list(range(max(kmin, 0) + 1, P_v.bit_count() + 1))
+            else:
+                P_verts, P_cols, P_classes = color_sort(P_v, adj, kmin, renumber)
+                colorings += 1
+
+            if (P_verts and maxsat_depth is not None and len(stack) < maxsat_depth and P_classes is not None
+                    and kmin >= 0):
+                # Every inconsistent subset of classes costs the bound one colour
+                maxsat_calls += 1
+                if maxsat_bound(P_classes, adj, len(P_classes) - kmin) <= kmin:
+                    maxsat_prunes += 1
+                    P_verts = []
+
+            if P_verts:
+                stack.append((P, verts, cols, classes))
+                P, verts, cols, classes = P_v, P_verts, P_cols, P_classes
+            else:
+                Q.pop()
+        else:
+            # Backtrack: no branch left that can beat max_clique
+            if not stack:
+                break
+            P, verts, cols, classes = stack.pop()
+            Q.pop()
+
+    _record(stats, colorings, recolors_avoided)
+    if maxsat_depth is not None:
+        _record_maxsat(stats, maxsat_calls, maxsat_prunes)
+    if deadline is not None:
+        upper_bound = len(max_clique)
+        if timed_out:
+            # A level can not beat its clique size plus the highest colour left to branch on
+            base = len(Q) - len(stack)
+            levels = [(base + j, f_P, f_cols[-1]) for j, (f_P, _, f_cols, _) in enumerate(stack) if f_cols]
+            if cols:
+                levels.append((len(Q), P, cols[-1]))
+            upper_bound = open_bound(adj, levels, upper_bound)
+        _record_bound(stats, upper_bound, not timed_out)
+    return max_clique, steps
+
+def weighted_color_sort(P, adj, weights, wmin):
+    """
+    Colours P in label order and lists the nodes worth branching on by their weighted colour bound.
+    The bound of a node in colour class k is the sum of the heaviest weight of every class up to k,
+    no clique inside those classes can weigh more. Nodes whose bound is at most wmin are left out.
+    Parameters:
+        P (int): Bitset of the candidate nodes.
+        adj (list): Bitset adjacency rows.
+        weights (list): weights[i] is the weight of label i.
+        wmin (float): Weight the current clique can afford without improving.
+    Returns:
+        verts (list): Nodes with bound > wmin, in increasing bound order.
+        bounds (list): bounds[i] is the weighted bound of verts[i].
+    """
+    verts, bounds = [], []
+    total = 0
+    for color in color_classes(P, adj):
+        members = list(iter_bits(color))
+        total += max(weights[v] for v in members)
+        if total > wmin:
+            for v in members:
+                verts.append(v)
+                bounds.append(total)
+    return verts, bounds
+
+def weighted_search(adj, cand, weights, Q=None, stats=None, seed=None):
+    """
+    Branch and bound for the maximum weight clique, following color_search() with the weighted
+    colour bound of weighted_color_sort() in place of the number of colours.
+    Parameters:
+        adj (list): Bitset adjacency rows, labels should follow the initial ordering.
+        cand (int): Bitset of the candidate nodes.
+        weights (list): weights[i] is the (non-negative) weight of label i.
+        Q (list): optional, labels of nodes already in the clique (all adjacent to cand).
+        stats (dict): optional, filled with the "colorings" run.
+        seed (list): optional, labels of a clique found beforehand, the search only looks for heavier ones.
+    Returns:
+        max_clique (list): Labels of the heaviest clique found.
+        steps (int): The number of steps taken by the search.
+    """
+    Q = Q[:] if Q is not None else []
+    weight = sum(weights[v] for v in Q)
+    max_clique, best = Q[:], weight
+    if seed is not None and sum(weights[v] for v in seed) > best:
+        max_clique, best = list(seed), sum(weights[v] for v in seed)
+    colorings = 0
+    if not cand:
+        _record(stats, colorings, 0)
+        return max_clique, 0
+
+    P = cand
+    verts, bounds = weighted_color_sort(P, adj, weights, best - weight)
+    colorings += 1
+    stack = [] # Stack to simulate recursion
+    steps = 0
+
+    while True:
+        steps += 1
+        if verts and weight + bounds[-1] > best:
+            # Branch on the node with the highest bound
+            v = verts.pop()
+            bounds.pop()
+            P ^= 1 << v
+            P_v = P & adj[v]
+            Q.append(v)
+            weight += weights[v]
+
+            if weight > best:
+                max_clique, best = Q[:], weight # Found heavier clique
+            P_verts = []
+            if P_v:
+                P_verts, P_bounds = weighted_color_sort(P_v, adj, weights, best - weight)
+                colorings += 1
+            if P_verts:
+                stack.append((P, verts, bounds))
+                P, verts, bounds = P_v, P_verts, P_bounds
+            else:
+                Q.pop()
+                weight -= weights[v]
+        else:
+            # Backtrack: no branch left that can beat max_clique
+            if not stack:
+                break
+            P, verts, bounds = stack.pop()
+            weight -= weights[Q.pop()]
+
+    _record(stats, colorings, 0)
+    return max_clique, steps
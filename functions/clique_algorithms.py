@@ -5,62 +5,160 @@ import itertools
 from itertools import *
 import math
 import random
+import time
 from collections import defaultdict
 
 from functions.check_functions import *
 from functions.find_functions import *
+from functions.parallel_clique import parallel_max_clique
+from functions.clique_heuristics import heuristic_clique
+from functions.sparse_clique import sparse_max_clique
+from functions.maximal_cliques import pivot_cliques, degeneracy_cliques
+from functions.vertex_ordering import vertex_ordering
+from functions.clique_cache import cacheable
+from functions.symmetry import orbits
+from functions.vertex_cover_kernel import complement, kernelize as kernelize_complement, lift
+from functions.bitset_clique import start_state, to_nodes, color_classes, pivot_search, color_search, ranked_search, weighted_search
+
+# Colouring strategies computed by the solver itself, branching on the highest colour class first
+TOMITA_STRATEGIES = ("mcq", "mcr", "mcs")
+
+class CliqueResult(set):
+    """
+    The clique returned by the solvers when they are given a time_budget.
+    It is a set of nodes, so it can be used like the plain set they return otherwise.
+    Attributes:
+        upper_bound (int): No clique in the graph is larger than this.
+        optimal (bool): True if the search finished in time, so the clique is a maximum clique.
+    """
+    def __init__(self, nodes=(), upper_bound=None, optimal=True):
+        super().__init__(nodes)
+        self.upper_bound = len(self) if upper_bound is None else upper_bound
+        self.optimal = optimal
+
+    @property
+    def gap(self):
+        """Number of nodes the clique may be short of a maximum clique."""
+        return self.upper_bound - len(self)
+
+    def __repr__(self):
+        return f"CliqueResult({set(self)}, upper_bound={self.upper_bound}, optimal={self.optimal})"
 
-def branch_and_bound(G):
+@cacheable
+def branch_and_bound(G, ordering=None):
     """
     AI Generated method.
     Finds the maximum clique in an undirected graph using a branch-and-bound 
     algorithm with pruning based on a greedy coloring heuristic.
+    The search is iterative and every subproblem is coloured again, its candidates are kept in
+    buffers allocated once per depth, as large as the most candidates seen at that depth, and
+    reused by every later subproblem at that depth.
     Parameters:
         G (networkx.Graph): The graph.
+        ordering (str): optional, colour and branch on the nodes in a vertex_ordering() ("degeneracy",
+                        "max_degree", "min_width" or "color") instead of the node list sorted by colour.
     Returns:
         best_clique: A set of nodes representing the largest clique found in the G.
     """
-    # n = G.number_of_nodes()
+    if len(G) == 0:
+        return set()
+    if ordering is None:
+        order = list(G.nodes)  # Initial order can be simply the node list
+
+        coloring = greedy_coloring_heuristic(G, order)
+
+        # Sort nodes by color
+        order.sort(key=lambda x: coloring[x])
+    else:
+        order = vertex_ordering(G, ordering)
+
+    n = len(order)
+    index = {u: i for i, u in enumerate(order)}
+    adj = [{index[v] for v in G[u] if v != u} for u in order]
+
+    # Per depth buffers: the candidates sorted by colour, their colours and the next one to branch on
+    verts = [[0] * n]
+    colors = [[0] * n]
+    pos = [0]
+    scratch = list(range(n)) # Candidates of the subproblem being coloured
+    klass = [0] * n # Nodes of the colour class being built
+    clique = [0] * n
+    size = 0
     best_clique = []
-    order = list(G.nodes)  # Initial order can be simply the node list
-
-    coloring = greedy_coloring_heuristic(G, order)
-    
-    # Sort nodes by color
-    order.sort(key=lambda x: coloring[x])
+    best = 0
 
-    def extend(clique, candidates):
+    def color_sort(depth, m):
         """
-        Recursively attempts to grow a clique from the current set of candidates, using 
-        branch-and-bound to prune search paths that cannot yield a better solution than 
-        the current best.
-        Parameters:
-            clique: A list of nodes representing the current partial clique being explored.
-            candidates:  list of nodes that are potential extensions to the current clique.
+        Colours the m candidates in scratch greedily, one colour class at a time, and writes them
+        to the buffers of the depth sorted by colour.
         """
-        nonlocal best_clique
-        if not candidates:
-            if len(clique) > len(best_clique):
-                best_clique = clique[:]
-            return
-        
-        for node in candidates[:]:
-            new_clique = clique + [node]
-            new_candidates = [n for n in candidates
-                              if G.has_edge(node, n)]
-            
-            #Prune branched based on greedy coloring
-            max_color = max((coloring[n] for n in new_candidates), default = -1)
-            if len(new_clique) + max_color + 1 <= len(best_clique):
-                continue
-                
-            # Recur
-            extend(new_clique, new_candidates)
-
-    # Initialize recursive search
-    extend([], order)
-    
-    return set(best_clique)
+        out_verts, out_colors = verts[depth], colors[depth]
+        if len(out_verts) < m:
+            out_verts.extend([0] * (m - len(out_verts)))
+            out_colors.extend([0] * (m - len(out_colors)))
+        out = 0
+        color = 0
+        while m:
+            color += 1
+            k = rest = 0
+            for i in range(m):
+                v = scratch[i]
+                adj_v = adj[v]
+                for j in range(k):
+                    if klass[j] in adj_v:
+                        scratch[rest] = v # Conflicts with the class, colour it later
+                        rest += 1
+                        break
+                else:
+                    klass[k] = v
+                    k += 1
+            for j in range(k):
+                out_verts[out] = klass[j]
+                out_colors[out] = color
+                out += 1
+            m = rest
+        pos[depth] = out
+
+    depth = 0
+    color_sort(0, n)
+    while True:
+        i = pos[depth] - 1
+        # Candidates are sorted by colour, if the highest colour left can not beat the best neither can the rest
+        if i < 0 or size + colors[depth][i] <= best:
+            if depth == 0:
+                break
+            depth -= 1
+            size -= 1
+            continue
+        pos[depth] = i
+        v = verts[depth][i]
+        clique[size] = v
+        size += 1
+
+        # The candidates of the child are the earlier candidates adjacent to v
+        adj_v = adj[v]
+        level = verts[depth]
+        m = 0
+        for j in range(i):
+            w = level[j]
+            if w in adj_v:
+                scratch[m] = w
+                m += 1
+        if not m:
+            if size > best:
+                best = size
+                best_clique = clique[:size]
+            size -= 1
+            continue
+
+        depth += 1
+        if depth == len(verts):
+            verts.append([0] * m)
+            colors.append([0] * m)
+            pos.append(0)
+        color_sort(depth, m)
+
+    return {order[i] for i in best_clique}
 
 def greedy_coloring_heuristic(G, order):
     """
@@ -94,6 +192,7 @@ def greedy_coloring_heuristic(G, order):
 
     return coloring
 
+@cacheable
 def Bron_Kerbosch(G):
     """
     https://stackoverflow.com/questions/28406314/iterative-version-of-the-bron-kerbosch-algorithm
@@ -112,13 +211,14 @@ def Bron_Kerbosch(G):
     excluded_vertices = set()
     search_stack.append((clique, candidates, excluded_vertices))
 
-    maximal_cliques = []
+    maximum = set() # Only the largest maximal clique is kept, not every one found
 
     while search_stack:
         clique, candidates, excluded_vertices = search_stack.pop()
 
         if not candidates and not excluded_vertices:
-            maximal_cliques.append(clique)
+            if len(clique) > len(maximum):
+                maximum = clique
             continue
         if candidates:
             vertex = next(iter(candidates)) # Pick vertex from candidates
@@ -135,85 +235,235 @@ def Bron_Kerbosch(G):
                 excluded_vertices & set(G.neighbors(vertex)) # Excluded vertices that are neighbors of vertex
             ))
 
-    maximum = max(maximal_cliques, key=len)
     return set(maximum)
 
-def max_clique(G, nodes=None):
+def iter_maximal_cliques(G, max_only=False, backend="set", workers=None, min_size=0, max_size=None):
     """
-    AI Generated method.
-    Finds the maximum clique in an undirected graph using a bron-kerbosch 
-    algorithm with pruning based on a bounding function.
+    Yields the maximal cliques of an undirected graph one at a time, using an iterative
+    Bron-Kerbosch search with Tomita pivoting (the pivot u in P | X has the most neighbours in P).
+    Only the path to the current branch is stored, so memory does not grow with the number of cliques.
     Parameters:
         G (networkx.Graph): The graph.
-        nodes (list): optional
+        max_only (bool): optional, only yield cliques larger than every clique yielded before, and
+                         prune every branch with |R| + |P| <= the size of the largest one.
+                         The last clique yielded is a maximum clique.
+        backend (str): optional, "set" (default) searches the whole graph, "sparse" runs one search
+                       per node of a degeneracy ordering over its later neighbours (for large graphs
+                       of low degeneracy).
+        workers (int): optional, "sparse" only, run the per-node searches in this many processes.
+        min_size (int): optional, only yield cliques of at least this size, branches that can not
+                        reach it are pruned.
+        max_size (int): optional, only yield cliques of at most this size, branches whose clique
+                        already has this size and can still grow are pruned.
+    Yields:
+        clique (set): A set of nodes forming a maximal clique.
+    """
+    if backend not in ("set", "sparse"):
+        raise ValueError(f"Unknown backend {backend}")
+    if backend == "sparse":
+        yield from degeneracy_cliques(G, workers, max_only, min_size=min_size, max_size=max_size)
+        return
+    if workers is not None:
+        raise ValueError("workers is only supported by the sparse backend")
+    adj = {u: set(G[u]) - {u} for u in G} # Self-loops are not part of any clique
+    yield from pivot_cliques(adj, [], set(adj), set(), max_only, min_size=min_size, max_size=max_size)
+
+def count_maximal_cliques(G, min_size=0, max_size=None, backend="set"):
+    """
+    Counts the maximal cliques of an undirected graph by their size, walking the search of
+    iter_maximal_cliques() without keeping any clique, so memory only grows with the search depth.
+    Parameters:
+        G (networkx.Graph): The graph.
+        min_size (int): optional, only count cliques of at least this size.
+        max_size (int): optional, only count cliques of at most this size.
+        backend (str): optional, "set" (default) or "sparse", see iter_maximal_cliques().
     Returns:
-        set(max_clique): A set of nodes representing the largest clique found in the G.
+        total (int): The number of maximal cliques counted.
+        histogram (dict): Maps every clique size to the number of maximal cliques of that size.
     """
-    if len(G) == 0:
-        return set()
-
-    adj = {u: {v for v in G[u] if v != u} for u in G}
-    Q = nodes[:] if nodes is not None else []
-    cand = set(G)
-
-    # If user provided initial clique nodes, verify they form a clique
-    for node in Q:
-        if node not in cand:
-            raise ValueError(f"The given `nodes` {nodes} do not form a clique")
-        cand &= adj[node] # Intersect candidates with neighbors of current node
-
-    # If no candidates left - return what we have in Q
-    if not cand:
-        return set(Q[:])
-
-    subg = cand.copy()
-    stack = [] # Stack to simulate recursion
-
-    Q.append(None) # Place holder for new nodes
-
-    u = max(subg, key=lambda u: len(cand & adj[u]))
-    ext_u = cand - adj[u]
-    max_clique = Q[:-1]
-
-    try:
-        while True:
-            if ext_u:
-                # Pick a node from ext_u to try adding to clique
-                q = ext_u.pop()
-                cand.remove(q)
-                Q[-1] = q 
-
-                adj_q = adj[q] 
-                subg_q = subg & adj_q 
+    histogram = defaultdict(int)
+    for clique in iter_maximal_cliques(G, backend=backend, min_size=min_size, max_size=max_size):
+        histogram[len(clique)] += 1
+    return sum(histogram.values()), dict(sorted(histogram.items()))
 
-                if not subg_q:
-                    if len(Q) > len(max_clique):
-                        max_clique = Q[:] # Found larger clique
-                else:
-                    # Reduce candidate set to only neighbors of q
-                    cand_q = cand & adj_q
+@cacheable
+def Bron_Kerbosch_Pivoting(G):
+    """
+    Finds the maximum clique in an undirected graph with the max_only mode of iter_maximal_cliques(),
+    keeping only the largest clique found so far.
+    Parameters:
+        G (networkx.Graph): the graph
+    Returns:
+        maximum (set): A set of all nodes in the maximum clique found.
+    """
+    maximum = set()
+    for maximum in iter_maximal_cliques(G, max_only=True):
+        pass
+    return maximum
 
-                    if len(Q) + len(cand_q) > len(max_clique):
-                        stack.append((subg, cand, ext_u))
-                        Q.append(None)
+def all_maximum_cliques(G, nodes=None, stats=None):
+    """
+    Finds every maximum clique in an undirected graph in one branch-and-bound search.
+    The search prunes with a colouring bound like max_clique(), but keeps branches that can
+    equal the best clique found so far instead of only those that can beat it.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in every clique.
+        stats (dict): optional, filled with the "colorings" run and the "steps" taken.
+    Returns:
+        cliques (list): One set of nodes per maximum clique.
+    """
+    return [set(clique) for clique in _ranked_cliques(G, nodes, None, stats)]
 
-                        #Update state for recursive call
-                        subg = subg_q
-                        cand = cand_q
-                        u = max(subg, key=lambda u: len(cand & adj[u]))
-                        ext_u = cand - adj[u]
-            else:
-                # Backtrack: no more extension nodes to try
-                Q.pop()
-                if not stack:
-                    break 
-                subg, cand, ext_u = stack.pop()
-    except IndexError:
-        pass
+def top_k_cliques(G, k, nodes=None, stats=None):
+    """
+    Finds the k largest maximal cliques in an undirected graph in one branch-and-bound search.
+    Once k cliques are kept, branches that can not beat the k-th largest are pruned.
+    Ties at the k-th size are broken arbitrarily.
+    Parameters:
+        G (networkx.Graph): The graph.
+        k (int): Number of cliques to return.
+        nodes (list): optional, nodes that must be in every clique.
+        stats (dict): optional, filled with the "colorings" run and the "steps" taken.
+    Returns:
+        cliques (list): Sets of nodes, largest first (fewer than k if G has fewer maximal cliques).
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, not {k}")
+    return [set(clique) for clique in _ranked_cliques(G, nodes, k, stats)]
 
-    return set(max_clique)
+def weighted_max_clique(G, weight="weight", nodes=None, stats=None):
+    """
+    Finds the clique of largest total node weight in an undirected graph.
+    The search colours every search node like MCQ and bounds a branch by the sum of the heaviest
+    weight in each colour class up to it. Nodes are labeled heaviest first (ties by degree), so
+    the heavy nodes open the colour classes and the bound stays tight.
+    Not cached, the cache key only covers the edges of G and not its node weights.
+    Parameters:
+        G (networkx.Graph): The graph.
+        weight (str): optional, the node attribute holding the (non-negative) weight,
+                      None gives every node weight 1 (a maximum clique).
+        nodes (list): optional, nodes that must be in the clique.
+        stats (dict): optional, filled with the "colorings" run and the "steps" taken.
+    Returns:
+        set(max_clique): A set of nodes forming the heaviest clique found in G.
+    """
+    if len(G) == 0:
+        return set()
+    weights = {u: 1 if weight is None else G.nodes[u][weight] for u in G}
+    for u, w in weights.items():
+        if w < 0:
+            raise ValueError(f"Node {u} has negative weight {w}")
+    order = sorted(G, key=lambda u: (weights[u], len(G[u])), reverse=True)
+    node_list, adj, Q, cand = start_state(G, nodes, order)
+    clique, steps = weighted_search(adj, cand, [weights[u] for u in node_list], Q, stats)
+    if stats is not None:
+        stats["steps"] = stats.get("steps", 0) + steps
+    return set(to_nodes(node_list, clique))
+
+def prefix_max_cliques(G, sizes=None, order=None, time_budget=None, eliminate=False, hooks=None):
+    """
+    Finds the maximum clique of every prefix subgraph G[order[:k]] for k in sizes, in one search.
+    The prefixes are the dolls of russian_doll_search(): the clique of a prefix is the incumbent of
+    the next one, which only searches the cliques through its new nodes. Solving the largest prefix
+    solves all the smaller ones on the way.
+    Parameters:
+        G (networkx.Graph): The graph.
+        sizes (list): optional, the numbers of nodes k of the prefixes (every k from 1 to len(G) by default).
+        order (list): optional, the nodes in prefix order (the node order of G by default, so the nodes
+                      1..k of a graph from read_dimacs_clq(), G.subgraph(range(k + 1))).
+        time_budget (float): optional, seconds after which the search stops, the prefixes left get the
+                             best clique found so far with the upper bound proven for them.
+        eliminate, hooks: As for max_clique().
+    Returns:
+        table (list): One dict per prefix in increasing order of k, with the "nodes" k, the "clique" and
+                      its "size", the "upper_bound", whether it is "optimal", and the "steps" and
+                      "seconds" the search had taken when the prefix was solved.
+    """
+    order = list(G) if order is None else list(order)
+    sizes = range(1, len(order) + 1) if sizes is None else sorted(set(sizes))
+    for k in sizes:
+        if not 1 <= k <= len(order):
+            raise ValueError(f"Prefix size {k} is not between 1 and {len(order)}")
+    if not sizes:
+        return []
+
+    last = sizes[-1]
+    H = G.subgraph(order[:last])
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    dolls = []
+    start = time.perf_counter()
+    clique, steps, _, optimal = russian_doll_search(H, order=order[:last], deadline=deadline, eliminate=eliminate,
+                                                    hooks=hooks, dolls=dolls)
+    table = []
+    for k in sizes:
+        if k <= len(dolls):
+            prefix, prefix_steps, finished = dolls[k - 1]
+            upper_bound, solved = len(prefix), True
+        else:
+            # Stopped in the doll of order[len(dolls)], no node after it is in the clique yet
+            prefix, prefix_steps, finished = clique, steps, time.perf_counter()
+            done = len(dolls[-1][0]) if dolls else 0
+            upper_bound = _doll_bound(H, [], order[:k], len(dolls), done, len(prefix))
+            solved = len(prefix) == upper_bound
+        table.append({"nodes": k, "clique": set(prefix), "size": len(prefix), "upper_bound": upper_bound,
+                      "optimal": solved, "steps": prefix_steps, "seconds": finished - start})
+    return table
+
+@cacheable
+def max_clique(G, nodes=None, backend="set", workers=None, time_budget=None, heuristic=False,
+               heuristic_share=0.1, eliminate=False, ordering=None, hooks=None, symmetry=False, kernelize=False,
+               russian_doll=False, schedule="static", stats=None):
+    """
+    AI Generated method.
+    Finds the maximum clique in an undirected graph using a bron-kerbosch 
+    algorithm with pruning based on a bounding function.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional
+        backend (str): optional, "set" (default) or "bitset" to run the search on integer bitsets,
+                       or "sparse" to solve one small subproblem per node of a degeneracy ordering
+                       (for large graphs of low degeneracy).
+        workers (int): optional, split the root branches over this many processes that share
+                       the size of the best clique (always uses the bitset backend, or solves the
+                       "sparse" subproblems in parallel).
+        time_budget (float): optional, seconds after which the search stops and returns the best clique
+                             found so far as a CliqueResult, with the upper bound proven so far and
+                             whether it is optimal.
+        heuristic (bool): optional, seed the search with the clique found by heuristic_clique(),
+                          so the bound prunes from the first branch.
+        heuristic_share (float): optional, share of the time_budget given to the heuristic.
+        eliminate (bool): optional, remove the nodes that can not be in a larger clique (core number
+                          or neighbourhood colouring too small) at the start and whenever the best
+                          clique grows.
+        ordering (str): optional, branch on the nodes in a vertex_ordering() ("degeneracy", "max_degree",
+                        "min_width" or "color") instead of set iteration order (ignored by "sparse").
+        hooks (SearchHooks): optional, instrumentation called by the set backend, see search_engine().
+        symmetry (bool): optional, compute vertex orbits up front and branch on one node per orbit at the
+                         root and per orbit of its stabilizer one level below (set backend only),
+                         see symmetric_search().
+        kernelize (bool): optional, shrink the minimum vertex cover problem of the complement graph first
+                          and solve its kernel, see kernel_clique(). Pays off on dense graphs; not supported
+                          together with workers, symmetry or russian_doll.
+        russian_doll (bool): optional, search the nested subgraphs of the ordering one node at a time and bound
+                             by their clique sizes instead of colourings (set backend only),
+                             see russian_doll_search().
+        schedule (str): optional, how the branches are handed to the workers (bitset backend only),
+                        "static" or "stealing", see parallel_max_clique().
+        stats (dict): optional, filled with the busy and idle time of every worker of a parallel search
+                      under "workers" (see parallel_max_clique()), or by the "sparse" backend
+                      (see sparse_max_clique()).
+    Returns:
+        set(max_clique): A set of nodes representing the largest clique found in the G
+                         (a CliqueResult when time_budget is given).
+    """
+    return _max_clique(G, nodes, backend, workers, time_budget, heuristic, heuristic_share, eliminate,
+                       ordering, hooks, symmetry, kernelize, russian_doll, schedule, stats)[0]
 
-def max_clique_with_steps(G, nodes=None):
+@cacheable
+def max_clique_with_steps(G, nodes=None, backend="set", workers=None, time_budget=None, heuristic=False,
+                          heuristic_share=0.1, eliminate=False, ordering=None, hooks=None,
+                          symmetry=False, kernelize=False, russian_doll=False, schedule="static", stats=None):
     """
     AI Generated method.
     Finds the maximum clique in an undirected graph using a bron-kerbosch 
@@ -222,78 +472,49 @@ def max_clique_with_steps(G, nodes=None):
     Parameters:
         G (networkx.Graph): The graph.
         nodes (list): optional
+        backend (str): optional, "set" (default) or "bitset" to run the search on integer bitsets,
+                       or "sparse" to solve one small subproblem per node of a degeneracy ordering
+                       (for large graphs of low degeneracy).
+        workers (int): optional, split the root branches over this many processes that share
+                       the size of the best clique (always uses the bitset backend, or solves the
+                       "sparse" subproblems in parallel).
+        time_budget (float): optional, seconds after which the search stops and returns the best clique
+                             found so far as a CliqueResult, with the upper bound proven so far and
+                             whether it is optimal.
+        heuristic (bool): optional, seed the search with the clique found by heuristic_clique(),
+                          so the bound prunes from the first branch.
+        heuristic_share (float): optional, share of the time_budget given to the heuristic.
+        eliminate (bool): optional, remove the nodes that can not be in a larger clique (core number
+                          or neighbourhood colouring too small) at the start and whenever the best
+                          clique grows.
+        ordering (str): optional, branch on the nodes in a vertex_ordering() ("degeneracy", "max_degree",
+                        "min_width" or "color") instead of set iteration order (ignored by "sparse").
+        hooks (SearchHooks): optional, instrumentation called by the set backend, see search_engine().
+        symmetry (bool): optional, compute vertex orbits up front and branch on one node per orbit at the
+                         root and per orbit of its stabilizer one level below (set backend only),
+                         see symmetric_search().
+        kernelize (bool): optional, shrink the minimum vertex cover problem of the complement graph first
+                          and solve its kernel, see kernel_clique(). Pays off on dense graphs; not supported
+                          together with workers, symmetry or russian_doll.
+        russian_doll (bool): optional, search the nested subgraphs of the ordering one node at a time and bound
+                             by their clique sizes instead of colourings (set backend only),
+                             see russian_doll_search().
+        schedule (str): optional, how the branches are handed to the workers (bitset backend only),
+                        "static" or "stealing", see parallel_max_clique().
+        stats (dict): optional, filled with the busy and idle time of every worker of a parallel search
+                      under "workers" (see parallel_max_clique()), or by the "sparse" backend
+                      (see sparse_max_clique()).
     Returns:
-        set(max_clique): A set of nodes representing the largest clique found in the G.
+        set(max_clique): A set of nodes representing the largest clique found in the G
+                         (a CliqueResult when time_budget is given).
         step_count (int): The number of steps taken by the algorithm.
     """
-    if len(G) == 0:
-        return set(), 0
-
-    adj = {u: {v for v in G[u] if v != u} for u in G}
-
-    Q = nodes[:] if nodes is not None else []
-    cand = set(G)
-
-    # If user provided initial clique nodes, verify they form a clique
-    for node in Q:
-        if node not in cand:
-            raise ValueError(f"The given `nodes` {nodes} do not form a clique")
-        cand &= adj[node] # Intersect candidates with neighbors of current node
-
-    # If no candidates left - return what we have in Q
-    if not cand:
-        return set(Q[:]), 0
-
-    subg = cand.copy()
-    stack = [] # Stack to simulate recursion
-
-    Q.append(None) # Place holder for new nodes
-
-    u = max(subg, key=lambda u: len(cand & adj[u]))
-    ext_u = cand - adj[u]
-    max_clique = Q[:-1]  
-    step_count = 0
-
-    try:
-        while True:
-            step_count += 1
-            if ext_u:
-                # Pick a node from ext_u to try adding to clique
-                q = ext_u.pop()
-                cand.remove(q)
-                Q[-1] = q 
-
-                adj_q = adj[q] 
-                subg_q = subg & adj_q 
-
-                if not subg_q:
-                    if len(Q) > len(max_clique):
-                        max_clique = Q[:] # Found larger clique
-                else:
-                    # Reduce candidate set to only neighbors of q
-                    cand_q = cand & adj_q
-
-                    if len(Q) + len(cand_q) > len(max_clique):
-                        stack.append((subg, cand, ext_u))
-                        Q.append(None)
-
-                        #Update state for recursive call
-                        subg = subg_q
-                        cand = cand_q
-                        u = max(subg, key=lambda u: len(cand & adj[u]))
-                        ext_u = cand - adj[u]
-            else:
-                # Backtrack: no more extension nodes to try
-                Q.pop()
-                if not stack:
-                    break 
-                subg, cand, ext_u = stack.pop()
-    except IndexError:
-        pass
+    return _max_clique(G, nodes, backend, workers, time_budget, heuristic, heuristic_share, eliminate,
+                       ordering, hooks, symmetry, kernelize, russian_doll, schedule, stats)
 
-    return set(max_clique), step_count
-
-def custom_with_greedy(G, str_mode, nodes=None):
+@cacheable
+def custom_with_greedy(G, str_mode, nodes=None, backend="set", incremental=False, time_budget=None,
+                       maxsat_depth=None, hooks=None):
     """
     Based off the AI Generated method max_clique().
     Finds the maximum clique in an undirected graph using a bron-kerbosch 
@@ -301,182 +522,218 @@ def custom_with_greedy(G, str_mode, nodes=None):
     Parameters:
         G (networkx.Graph): The graph.
         str_mode (string): The colouring strategy used by the greedy colouring function.
+                           "mcq", "mcr" and "mcs" colour on the solver's own bitsets and branch
+                           on the highest colour class first (always uses the bitset backend).
         nodes (list): optional
+        backend (str): optional, "set" (default) or "bitset" to run the search on integer bitsets.
+        incremental (bool): optional, carry the parent node's colour classes down the search and only
+                            recolour when they cannot prune (always uses the bitset backend).
+        time_budget (float): optional, seconds after which the search stops and returns the best clique
+                             found so far as a CliqueResult, with the upper bound proven so far and
+                             whether it is optimal.
+        maxsat_depth (int): optional, search nodes at most this many levels below the root that the colouring
+                            can not prune try the tighter MaxSAT bound on their colour classes
+                            (always uses the bitset backend).
+        hooks (SearchHooks): optional, instrumentation called by the set backend, see search_engine().
     Returns:
-        set(max_clique): A set of nodes representing the largest clique found in the G.
+        set(max_clique): A set of nodes representing the largest clique found in the G
+                         (a CliqueResult when time_budget is given).
     """
-    if len(G) == 0:
-        return set()
-
-    adj = {u: {v for v in G[u] if v != u} for u in G}
-    Q = nodes[:] if nodes is not None else []
-    cand = set(G)
-
-    # If user provided initial clique nodes, verify they form a clique
-    for node in Q:
-        if node not in cand:
-            raise ValueError(f"The given `nodes` {nodes} do not form a clique")
-        cand &= adj[node] # Intersect candidates with neighbors of current node
-
-    # If no candidates left - return what we have in Q
-    if not cand:
-        return set(Q[:])
-
-    subg = cand.copy()
-    stack = [] # Stack to simulate recursion
+    return _custom_clique(G, str_mode, "always", nodes, backend, incremental, None, time_budget,
+                          maxsat_depth, hooks)[0]
 
-    Q.append(None) # Place holder for new nodes
-
-    u = max(subg, key=lambda u: len(cand & adj[u]))
-    ext_u = cand - adj[u]
-    max_clique = Q[:-1]
-
-    try:
-        while True:
-            if ext_u:
-                # Pick a node from ext_u to try adding to clique
-                q = ext_u.pop()
-                cand.remove(q)
-                Q[-1] = q 
-
-                adj_q = adj[q] 
-                subg_q = subg & adj_q 
-
-                if not subg_q:
-                    if len(Q) > len(max_clique):
-                        max_clique = Q[:] # Found larger clique
-                else:
-                    # Reduce candidate set to only neighbors of q
-                    cand_q = cand & adj_q
-
-                    if len(Q) + max(greedy_color(G.subgraph(cand_q), strategy=str_mode).values(), default=-1) + 1 > len(max_clique):
-                        stack.append((subg, cand, ext_u))
-                        Q.append(None)
-
-                        #Update state for recursive call
-                        subg = subg_q
-                        cand = cand_q
-                        u = max(subg, key=lambda u: len(cand & adj[u]))
-                        ext_u = cand - adj[u]
-            else:
-                # Backtrack: no more extension nodes to try
-                Q.pop()
-                if not stack:
-                    break 
-                subg, cand, ext_u = stack.pop()
-    except IndexError:
-        pass
-
-    return set(max_clique)
-
-def custom_with_partial_greedy(G, str_mode, nodes=None):
+@cacheable
+def custom_with_partial_greedy(G, str_mode, nodes=None, backend="set", incremental=False, time_budget=None,
+                               maxsat_depth=None, hooks=None, schedule=None):
     """
     Based off the AI Generated method max_clique().
     Finds the maximum clique in an undirected graph using a bron-kerbosch 
     algorithm with pruning based on a greedy colouring function provided by networkX.
-    Greedy colouring function only runs every 3 iterations.
+    On the set backend the greedy colouring function only runs at the depths where it prunes enough
+    to pay for itself, on the bitset backend it runs every 3 iterations.
     Parameters:
         G (networkx.Graph): The graph.
         str_mode (string): The colouring strategy used by the greedy colouring function.
+                           "mcq", "mcr" and "mcs" colour on the solver's own bitsets and branch
+                           on the highest colour class first (always uses the bitset backend).
         nodes (list): optional
+        backend (str): optional, "set" (default) or "bitset" to run the search on integer bitsets.
+        incremental (bool): optional, carry the parent node's colour classes down the search and only
+                            recolour when they cannot prune (always uses the bitset backend).
+        time_budget (float): optional, seconds after which the search stops and returns the best clique
+                             found so far as a CliqueResult, with the upper bound proven so far and
+                             whether it is optimal.
+        maxsat_depth (int): optional, search nodes at most this many levels below the root that the colouring
+                            can not prune try the tighter MaxSAT bound on their colour classes
+                            (always uses the bitset backend).
+        hooks (SearchHooks): optional, instrumentation called by the set backend, see search_engine().
+        schedule (str): optional, "adaptive" or "partial" to colour every 3 iterations. By default "adaptive"
+                        on the set backend and "partial" on the bitset backend, which does not support
+                        "adaptive" ("mcq", "mcr", "mcs", incremental and maxsat_depth all run on it).
     Returns:
-        set(max_clique): A set of nodes representing the largest clique found in the G.
+        set(max_clique): A set of nodes representing the largest clique found in the G
+                         (a CliqueResult when time_budget is given).
     """
-    if len(G) == 0:
-        return set()
-
-    adj = {u: {v for v in G[u] if v != u} for u in G}
-    Q = nodes[:] if nodes is not None else []
-    cand = set(G)
-
-    # If user provided initial clique nodes, verify they form a clique
-    for node in Q:
-        if node not in cand:
-            raise ValueError(f"The given `nodes` {nodes} do not form a clique")
-        cand &= adj[node] # Intersect candidates with neighbors of current node
-
-    # If no candidates left - return what we have in Q
-    if not cand:
-        return set(Q[:])
-
-    subg = cand.copy()
-    stack = [] # Stack to simulate recursion
-
-    Q.append(None) # Place holder for new nodes
-
-    u = max(subg, key=lambda u: len(cand & adj[u]))
-    ext_u = cand - adj[u]
-    max_clique = Q[:-1]
-
-    try:
-        while True:
-            if ext_u:
-                # Pick a node from ext_u to try adding to clique
-                q = ext_u.pop()
-                cand.remove(q)
-                Q[-1] = q 
-
-                adj_q = adj[q] 
-                subg_q = subg & adj_q 
-
-                if not subg_q:
-                    if len(Q) > len(max_clique):
-                        max_clique = Q[:] # Found larger clique
-                else:
-                    # Reduce candidate set to only neighbors of q
-                    cand_q = cand & adj_q
+    return _custom_clique(G, str_mode, schedule, nodes, backend, incremental, None, time_budget,
+                          maxsat_depth, hooks)[0]
 
-                    if len(Q) % 3 == 0:
-                        if len(Q) + max(greedy_color(G.subgraph(cand_q), strategy=str_mode).values(), default=-1) + 1 > len(max_clique):
-                            stack.append((subg, cand, ext_u))
-                            Q.append(None)
-
-                            #Update state for recursive call
-                            subg = subg_q
-                            cand = cand_q
-                            u = max(subg, key=lambda u: len(cand & adj[u]))
-                            ext_u = cand - adj[u]
-                    else:
-                        if len(Q) + len(cand_q) > len(max_clique):
-                            stack.append((subg, cand, ext_u))
-                            Q.append(None)
-
-                            #Update state for recursive call
-                            subg = subg_q
-                            cand = cand_q
-                            u = max(subg, key=lambda u: len(cand & adj[u]))
-                            ext_u = cand - adj[u]
-            else:
-                # Backtrack: no more extension nodes to try
-                Q.pop()
-                if not stack:
-                    break 
-                subg, cand, ext_u = stack.pop()
-    except IndexError:
-        pass
-
-    return set(max_clique)
+@cacheable
+def custom_with_greedy_steps(G, str_mode, nodes=None, backend="set", incremental=False, stats=None, time_budget=None,
+                             maxsat_depth=None, hooks=None):
+    """
+    Based off the AI Generated method max_clique().
+    Finds the maximum clique in an undirected graph using a bron-kerbosch 
+    algorithm with pruning based on a greedy colouring function provided by networkX.
+    Additionally keeps track of the steps taken by the algorithm.
+    Parameters:
+        G (networkx.Graph): The graph.
+        str_mode (string): The colouring strategy used by the greedy colouring function.
+                           "mcq", "mcr" and "mcs" colour on the solver's own bitsets and branch
+                           on the highest colour class first (always uses the bitset backend).
+        nodes (list): optional
+        backend (str): optional, "set" (default) or "bitset" to run the search on integer bitsets.
+        incremental (bool): optional, carry the parent node's colour classes down the search and only
+                            recolour when they cannot prune (always uses the bitset backend).
+        stats (dict): optional, filled with the number of full "colorings" and the "recolors_avoided"
+                      (bitset backend only).
+        time_budget (float): optional, seconds after which the search stops and returns the best clique
+                             found so far as a CliqueResult, with the upper bound proven so far and
+                             whether it is optimal.
+        maxsat_depth (int): optional, search nodes at most this many levels below the root that the colouring
+                            can not prune try the tighter MaxSAT bound on their colour classes, counted in
+                            stats as "maxsat_calls" and "maxsat_prunes" (always uses the bitset backend).
+        hooks (SearchHooks): optional, instrumentation called by the set backend, see search_engine().
+    Returns:
+        set(max_clique): A set of nodes representing the largest clique found in the G
+                         (a CliqueResult when time_budget is given).
+        step_count (int): The number of steps taken by the algorithm.
+    """
+    return _custom_clique(G, str_mode, "always", nodes, backend, incremental, stats, time_budget,
+                          maxsat_depth, hooks)
 
-def custom_with_greedy_steps(G, str_mode, nodes=None):
+@cacheable
+def custom_with_partial_greedy_steps(G, str_mode, nodes=None, backend="set", incremental=False, stats=None, time_budget=None,
+                                     maxsat_depth=None, hooks=None, schedule=None):
     """
     Based off the AI Generated method max_clique().
     Finds the maximum clique in an undirected graph using a bron-kerbosch 
     algorithm with pruning based on a greedy colouring function provided by networkX.
+    On the set backend the greedy colouring function only runs at the depths where it prunes enough
+    to pay for itself, on the bitset backend it runs every 3 iterations.
     Additionally keeps track of the steps taken by the algorithm.
     Parameters:
         G (networkx.Graph): The graph.
         str_mode (string): The colouring strategy used by the greedy colouring function.
+                           "mcq", "mcr" and "mcs" colour on the solver's own bitsets and branch
+                           on the highest colour class first (always uses the bitset backend).
         nodes (list): optional
+        backend (str): optional, "set" (default) or "bitset" to run the search on integer bitsets.
+        incremental (bool): optional, carry the parent node's colour classes down the search and only
+                            recolour when they cannot prune (always uses the bitset backend).
+        stats (dict): optional, filled with the number of full "colorings" and the "recolors_avoided"
+                      (bitset backend only).
+        time_budget (float): optional, seconds after which the search stops and returns the best clique
+                             found so far as a CliqueResult, with the upper bound proven so far and
+                             whether it is optimal.
+        maxsat_depth (int): optional, search nodes at most this many levels below the root that the colouring
+                            can not prune try the tighter MaxSAT bound on their colour classes, counted in
+                            stats as "maxsat_calls" and "maxsat_prunes" (always uses the bitset backend).
+        hooks (SearchHooks): optional, instrumentation called by the set backend, see search_engine().
+        schedule (str): optional, "adaptive" or "partial" to colour every 3 iterations. By default "adaptive"
+                        on the set backend and "partial" on the bitset backend, which does not support
+                        "adaptive" ("mcq", "mcr", "mcs", incremental and maxsat_depth all run on it).
     Returns:
-        set(max_clique): A set of nodes representing the largest clique found in the G.
+        set(max_clique): A set of nodes representing the largest clique found in the G
+                         (a CliqueResult when time_budget is given).
         step_count (int): The number of steps taken by the algorithm.
     """
+    return _custom_clique(G, str_mode, schedule, nodes, backend, incremental, stats, time_budget,
+                          maxsat_depth, hooks)
+
+class AdaptiveSchedule:
+    """
+    Decides per depth whether search_engine() computes the colouring bound of a child.
+    A depth keeps colouring while the share of its colourings that prune, times the average time
+    spent below a child it expands, is at least the average time a colouring takes there. A depth
+    that stopped colouring still colours one in every PROBE children, so it can turn back on.
+    Only the prunes the size bound could not make are counted, so a skipped colouring never makes
+    the search wrong, it can only expand a child the colouring would have cut.
+    """
+    WARMUP = 8 # Colourings made at a depth before it can be turned off
+    PROBE = 8
+
+    def __init__(self):
+        self.calls = defaultdict(int)
+        self.prunes = defaultdict(int)
+        self.color_seconds = defaultdict(float)
+        self.children = defaultdict(int)
+        self.child_seconds = defaultdict(float)
+        self.skips = defaultdict(int)
+
+    def wants(self, depth):
+        """
+        Parameters:
+            depth (int): Depth of the child, the size of the clique it extends the given nodes by.
+        Returns:
+            color (bool): True if the colouring bound of the child should be computed.
+        """
+        calls = self.calls[depth]
+        if calls < self.WARMUP or not self.children[depth]:
+            return True
+        saved = self.prunes[depth] / calls * self.child_seconds[depth] / self.children[depth]
+        if saved >= self.color_seconds[depth] / calls:
+            return True
+        self.skips[depth] += 1
+        return self.skips[depth] % self.PROBE == 0
+
+    def colored(self, depth, seconds, pruned):
+        """A colouring of a child at this depth took seconds and pruned it or not."""
+        self.calls[depth] += 1
+        self.color_seconds[depth] += seconds
+        self.prunes[depth] += pruned
+
+    def expanded(self, depth, seconds):
+        """The search spent seconds below a child it expanded at this depth."""
+        self.children[depth] += 1
+        self.child_seconds[depth] += seconds
+
+def search_engine(G, nodes=None, str_mode=None, schedule="always", order=None, deadline=None, seed=None,
+                  eliminate=False, hooks=None):
+    """
+    The set search loop behind max_clique() and the custom greedy variants.
+    A bron-kerbosch search with pivoting that only descends into a child when the clique plus
+    a bound on the child candidates can beat the best clique. The bound is the number of
+    candidates, and with a str_mode also the number of colours greedy_color() gives them.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in the clique.
+        str_mode (string): optional, the networkX colouring strategy of the colouring bound.
+                           None prunes on the number of candidates only.
+        schedule (str): optional, when the colouring bound is computed: "always", "partial"
+                        for children whose clique size is a multiple of 3, or "adaptive" for the
+                        depths where its prunes have saved more time than it cost (see AdaptiveSchedule).
+        order (list): optional, branch on the earliest node of this ordering first.
+        deadline (float): optional, time.perf_counter() value after which the search stops early.
+        seed (list): optional, the nodes of a clique found beforehand, only larger cliques are searched for.
+        eliminate (bool): optional, remove the nodes that can not be in a larger clique at the start
+                          and whenever the best clique grows.
+        hooks (SearchHooks): optional, told about every step, colouring decision, colouring bound, prune,
+                             larger clique and change of depth. Nothing is timed or counted without it.
+    Returns:
+        max_clique (list): The nodes of the largest clique found.
+        steps (int): The number of steps taken by the search.
+        upper_bound (int): The upper bound proven when the deadline stopped the search, else None.
+        optimal (bool): False if the deadline stopped the search.
+    """
+    if schedule not in ("always", "partial", "adaptive"):
+        raise ValueError(f"Unknown schedule {schedule}")
     if len(G) == 0:
-        return set(), 0
+        return [], 0, None, True
 
     adj = {u: {v for v in G[u] if v != u} for u in G}
     Q = nodes[:] if nodes is not None else []
     cand = set(G)
+    rank = None if order is None else {u: i for i, u in enumerate(order)}
 
     # If user provided initial clique nodes, verify they form a clique
     for node in Q:
@@ -486,148 +743,637 @@ def custom_with_greedy_steps(G, str_mode, nodes=None):
 
     # If no candidates left - return what we have in Q
     if not cand:
-        return set(Q[:]), 0
+        return Q, 0, None, True
 
     subg = cand.copy()
     stack = [] # Stack to simulate recursion
 
     Q.append(None) # Place holder for new nodes
 
+    def branches(cand, u):
+        # The nodes to branch on, popped from the end, so sorted earliest of the ordering last
+        ext_u = cand - adj[u]
+        return ext_u if rank is None else sorted(ext_u, key=rank.__getitem__, reverse=True)
+
+    def drop(parts, dead):
+        for part in parts:
+            if isinstance(part, list):
+                part[:] = [x for x in part if x not in dead]
+            else:
+                part -= dead
+
     u = max(subg, key=lambda u: len(cand & adj[u]))
-    ext_u = cand - adj[u]
+    ext_u = branches(cand, u)
     max_clique = Q[:-1]
-
+    if seed is not None and len(seed) > len(max_clique):
+        max_clique = list(seed) # Start from the heuristic clique
+    base = len(Q) - 1
+    alive = set(cand) # Nodes that may still be in a larger clique
+    if eliminate:
+        drop((subg, cand, ext_u), _eliminate(adj, alive, len(max_clique) - base))
     steps = 0
+    timed_out = False
+    adaptive = AdaptiveSchedule() if schedule == "adaptive" else None
+    entered = [] # When each level of the stack was entered, for the adaptive schedule
+
     try:
         while True:
             steps += 1
+            if deadline is not None and time.perf_counter() > deadline:
+                timed_out = True
+                break
+            if hooks is not None:
+                hooks.step(len(stack))
             if ext_u:
                 # Pick a node from ext_u to try adding to clique
                 q = ext_u.pop()
                 cand.remove(q)
-                Q[-1] = q 
+                Q[-1] = q
 
-                adj_q = adj[q] 
-                subg_q = subg & adj_q 
+                adj_q = adj[q]
+                subg_q = subg & adj_q
 
                 if not subg_q:
                     if len(Q) > len(max_clique):
                         max_clique = Q[:] # Found larger clique
+                        if hooks is not None:
+                            hooks.improve(len(max_clique))
+                        if eliminate:
+                            # The larger clique can make more nodes useless, drop them from every level
+                            dead = _eliminate(adj, alive, len(max_clique) - base)
+                            for frame in stack + [(subg, cand, ext_u)]:
+                                drop(frame, dead)
                 else:
                     # Reduce candidate set to only neighbors of q
                     cand_q = cand & adj_q
-
-                    if len(Q) + max(greedy_color(G.subgraph(cand_q), strategy=str_mode).values(), default=-1) + 1 > len(max_clique):
+                    limit = len(cand_q)
+                    reason = "size"
+
+                    # The colours never outnumber the candidates, only colour when the size can not prune
+                    if str_mode is not None and len(Q) + limit > len(max_clique):
+                        if schedule == "always":
+                            color = True
+                        elif schedule == "partial":
+                            color = len(Q) % 3 == 0
+                        else:
+                            color = adaptive.wants(len(stack) + 1) # Keyed like expanded(), by the depth of the child
+                        if hooks is not None:
+                            hooks.schedule(len(stack), color)
+                        if color:
+                            start = time.perf_counter() if hooks is not None or adaptive is not None else None
+                            limit = max(greedy_color(G.subgraph(cand_q), strategy=str_mode).values(), default=-1) + 1
+                            reason = "color"
+                            if start is not None:
+                                seconds = time.perf_counter() - start
+                                if hooks is not None:
+                                    hooks.bound(len(stack), seconds)
+                                if adaptive is not None:
+                                    adaptive.colored(len(stack) + 1, seconds, len(Q) + limit <= len(max_clique))
+
+                    if len(Q) + limit > len(max_clique):
                         stack.append((subg, cand, ext_u))
                         Q.append(None)
+                        if adaptive is not None:
+                            entered.append(time.perf_counter())
 
                         #Update state for recursive call
                         subg = subg_q
                         cand = cand_q
                         u = max(subg, key=lambda u: len(cand & adj[u]))
-                        ext_u = cand - adj[u]
+                        ext_u = branches(cand, u)
+                        if hooks is not None:
+                            hooks.enter(len(stack))
+                    elif hooks is not None:
+                        hooks.prune(len(stack), reason)
             else:
                 # Backtrack: no more extension nodes to try
                 Q.pop()
                 if not stack:
-                    break 
+                    break
+                if hooks is not None:
+                    hooks.leave(len(stack))
+                if adaptive is not None:
+                    adaptive.expanded(len(stack), time.perf_counter() - entered.pop())
                 subg, cand, ext_u = stack.pop()
     except IndexError:
         pass
 
-    return set(max_clique), steps
+    upper_bound = _open_bound(G, Q, stack, cand, ext_u, len(max_clique)) if timed_out else None
+    return max_clique, steps, upper_bound, not timed_out
 
-def custom_with_partial_greedy_steps(G, str_mode, nodes=None):
+def symmetric_search(G, nodes=None, order=None, deadline=None, seed=None, eliminate=False, hooks=None):
     """
-    Based off the AI Generated method max_clique().
-    Finds the maximum clique in an undirected graph using a bron-kerbosch 
-    algorithm with pruning based on a greedy colouring function provided by networkX.
-    Greedy colouring function only runs every 3 iterations.
-    Additionally keeps track of the steps taken by the algorithm.
+    Runs search_engine() on one subproblem per orbit of the root and of its stabilizer.
+    Once every clique through a node v is searched, the nodes an automorphism maps onto v are
+    dropped: the automorphism maps a clique through one of them onto a clique of the same size
+    through v, or through a node dropped before. One level below the same holds for the
+    automorphisms of the nodes left that fix v. orbits() only merges nodes an automorphism
+    was found for, so the result stays exact.
     Parameters:
         G (networkx.Graph): The graph.
-        str_mode (string): The colouring strategy used by the greedy colouring function.
-        nodes (list): optional
+        nodes (list): optional, nodes that must be in the clique, the orbits are those of their common neighbourhood.
+        order (list): optional, branch on the orbit holding the earliest node of this ordering first
+                      (the largest orbit first otherwise).
+        deadline, seed, eliminate, hooks: As for search_engine().
     Returns:
-        set(max_clique): A set of nodes representing the largest clique found in the G.
-        step_count (int): The number of steps taken by the algorithm.
+        max_clique (list), steps (int), upper_bound (int), optimal (bool): As for search_engine().
     """
-    if len(G) == 0:
-        return set(), 0
+    Q, cand = _seed_candidates(G, nodes)
+    adj = {u: set(G[u]) & cand - {u} for u in cand}
+    best = list(seed) if seed is not None and len(seed) > len(Q) else Q[:]
+    rank = None if order is None else {u: i for i, u in enumerate(order)}
+
+    def first(group):
+        # Largest orbit first, then highest degree, unless an ordering was given
+        if rank is not None:
+            return min(rank[u] for u in group)
+        return (-len(group), -len(adj[group[0]]))
+
+    def colors(part):
+        return max(greedy_coloring_heuristic(G.subgraph(part), list(part)).values(), default=-1) + 1
+
+    def rest(i, j, below, inner, alive):
+        # A subproblem not searched yet can only add as many nodes as its candidates have colours
+        bounds = [len(Q) + 2 + colors(adj[x[0]] & inner) for x in below[j:]]
+        bounds += [len(Q) + 1 + colors(adj[x[0]] & alive) for x in roots[i + 1:]]
+        return max(bounds, default=0)
 
-    adj = {u: {v for v in G[u] if v != u} for u in G}
+    steps = 0
+    alive = set(cand) # Nodes of no dropped orbit
+    roots = sorted(orbits(adj, deadline=deadline), key=first)
+    for i, group in enumerate(roots):
+        v = group[0]
+        inner = adj[v] & alive
+        if len(Q) + 1 + len(inner) > len(best):
+            steps += 1
+            if len(Q) + 1 > len(best):
+                best = Q + [v]
+            # The automorphisms of the nodes left that fix v
+            sub_adj = {u: adj[u] & alive for u in alive}
+            below = sorted(orbits(sub_adj, [v], inner, deadline=deadline), key=first)
+            for j, sub_group in enumerate(below):
+                w = sub_group[0]
+                if deadline is not None and time.perf_counter() > deadline:
+                    return best, steps, max(len(best), rest(i, j, below, inner, alive)), False
+                if len(Q) + 2 + len(adj[w] & inner) > len(best):
+                    sub = G.subgraph(Q + [v] + list(inner))
+                    best, sub_steps, upper_bound, optimal = search_engine(
+                        sub, Q + [v, w], order=order, deadline=deadline, seed=best, eliminate=eliminate, hooks=hooks)
+                    steps += 1 + sub_steps # Branching on w, then its search
+                    if not optimal:
+                        return best, steps, max(upper_bound, rest(i, j + 1, below, inner, alive)), False
+                inner -= set(sub_group)
+        alive -= set(group)
+    return best, steps, None, True
+
+def russian_doll_search(G, nodes=None, order=None, deadline=None, seed=None, eliminate=False, hooks=None,
+                        dolls=None):
+    """
+    Russian doll search (Ostergard's Cliquer): solves the nested subgraphs of the first k nodes of an ordering
+    for k = 1, 2, ..., n, each one only for the cliques through its new node.
+    c[k] is the size of the largest clique among the first k + 1 nodes. A branch that adds a
+    candidate w can only take w and nodes before it, so it is cut once the clique plus c[pos(w)]
+    can not beat the best clique. c[k] is at most c[k - 1] + 1, so the search of a doll stops at
+    the first larger clique it finds.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in the clique.
+        order (list): optional, the dolls grow by the nodes of this ordering from its front
+                      (vertex_ordering(G, "degeneracy") by default, so the first dolls are the dense core).
+        deadline, seed, eliminate: As for search_engine().
+        hooks (SearchHooks): optional, as for search_engine() without the colouring events. A child is cut
+                             with reason "size" or "doll", a "doll" prune also cuts the children after it.
+        dolls (list): optional, filled with the best clique, the steps taken and the time.perf_counter()
+                      value as each doll is finished. Without nodes and seed, the clique after the doll
+                      of order[k] is a maximum clique of the first k + 1 nodes.
+    Returns:
+        max_clique (list), steps (int), upper_bound (int), optimal (bool): As for search_engine().
+    """
+    Q, cand = _seed_candidates(G, nodes)
+    adj = {u: set(G[u]) & cand - {u} for u in cand}
+    if order is None:
+        order = vertex_ordering(G.subgraph(cand), "degeneracy")
+    order = [u for u in order if u in cand]
+    pos = {u: k for k, u in enumerate(order)}
+    best = list(seed) if seed is not None and len(seed) > len(Q) else Q[:]
+    base = len(Q)
+    alive = set(cand)
+    if eliminate:
+        _eliminate(adj, alive, len(best) - base)
+
+    c = [] # c[k], counted without Q
+    steps = 0
+    for k, v in enumerate(order):
+        done = c[k - 1] if k else 0
+        steps += 1
+        if deadline is not None and time.perf_counter() > deadline:
+            return best, steps, _doll_bound(G, Q, order, k, done, len(best)), False
+        if hooks is not None:
+            hooks.step(0)
+        if v not in alive or 1 + done <= len(best) - base:
+            # The doll holds no clique through v larger than the best one
+            if hooks is not None and v in alive:
+                hooks.prune(0, "doll")
+        else:
+            # Candidates latest first, every one after w then lies in the doll of w
+            R = Q + [v]
+            stack = [(sorted((w for w in adj[v] & alive if pos[w] < k), key=pos.__getitem__, reverse=True), 0)]
+            if hooks is not None:
+                hooks.enter(1)
+            if len(R) > len(best):
+                best = R[:]
+                if hooks is not None:
+                    hooks.improve(len(best))
+            while stack and len(best) - base <= done:
+                steps += 1
+                if deadline is not None and time.perf_counter() > deadline:
+                    return best, steps, _doll_bound(G, Q, order, k, done, len(best)), False
+                if hooks is not None:
+                    hooks.step(len(stack))
+                frame, i = stack[-1]
+                reason = None
+                if i < len(frame):
+                    # Every candidate left lies in the doll of frame[i]
+                    if len(R) + len(frame) - i <= len(best):
+                        reason = "size"
+                    elif len(R) + c[pos[frame[i]]] <= len(best):
+                        reason = "doll"
+                if i == len(frame) or reason is not None:
+                    if hooks is not None:
+                        if reason is not None:
+                            hooks.prune(len(stack), reason)
+                        hooks.leave(len(stack))
+                    stack.pop()
+                    R.pop()
+                    continue
+                w = frame[i]
+                stack[-1] = (frame, i + 1)
+                frame_w = [x for x in frame[i + 1:] if x in adj[w]]
+                if len(R) + 1 + len(frame_w) <= len(best):
+                    if hooks is not None:
+                        hooks.prune(len(stack), "size")
+                    continue
+                R.append(w)
+                if len(R) > len(best):
+                    best = R[:]
+                    if hooks is not None:
+                        hooks.improve(len(best))
+                stack.append((frame_w, 0))
+                if hooks is not None:
+                    hooks.enter(len(stack))
+
+            if hooks is not None:
+                for depth in range(len(stack), 0, -1):
+                    hooks.leave(depth)
+        c.append(min(done + 1, max(done, len(best) - base)))
+        if dolls is not None:
+            dolls.append((best[:], steps, time.perf_counter()))
+        if eliminate and len(best) - base > done:
+            _eliminate(adj, alive, len(best) - base)
+    return best, steps, None, True
+
+def kernel_clique(G, nodes=None, backend="set", time_budget=None, heuristic=False, heuristic_share=0.1,
+                  eliminate=False, ordering=None, hooks=None, stats=None):
+    """
+    Solves max_clique() through the minimum vertex cover problem of the complement graph.
+    The complement is built from the adjacency sets of G, reduced by the degree 0, 1 and 2 (folding),
+    dominance and crown rules of vertex_cover_kernel.py, and its kernel is complemented back and
+    solved by max_clique() on the chosen backend. On a very dense G the complement is sparse and
+    the kernel is often much smaller than G.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in the clique, their common neighbourhood is kernelized.
+        backend, time_budget, heuristic, heuristic_share, eliminate, ordering, hooks: As for max_clique(),
+            used to solve the kernel.
+        stats (dict): optional, filled with the number of times each reduction was applied and the
+                      number of "kernel_nodes".
+    Returns:
+        max_clique (set or CliqueResult), steps (int)
+    """
+    start = time.perf_counter()
+    Q, cand = _seed_candidates(G, nodes)
+    comp = complement({u: set(G[u]) & cand for u in cand})
+    info = stats if stats is not None else {}
+    taken, folds = kernelize_complement(comp, info)
+    info["kernel_nodes"] = len(comp)
+    if len(comp) == len(cand):
+        # Nothing was reduced, solve G itself
+        return _max_clique(G, nodes, backend, None, time_budget, heuristic, heuristic_share, eliminate,
+                           ordering, hooks, kernelize=False)
+
+    # Nodes of the kernel are joined when they are not neighbours in the complement
+    kernel = nx.Graph()
+    kernel.add_nodes_from(comp)
+    kernel.add_edges_from((u, v) for u in comp for v in comp if u != v and v not in comp[u])
+    if time_budget is not None:
+        time_budget = max(0.0, time_budget - (time.perf_counter() - start))
+    clique, steps = _max_clique(kernel, None, backend, None, time_budget, heuristic, heuristic_share,
+                                eliminate, ordering, hooks, kernelize=False)
+
+    lifted = lift(clique, taken, folds) | set(Q)
+    if time_budget is None:
+        return lifted, steps
+    # Every reduction adds as many nodes to the clique as it removed from the kernel's optimum
+    return CliqueResult(lifted, clique.upper_bound + len(lifted) - len(clique), clique.optimal), steps
+
+def _max_clique(G, nodes=None, backend="set", workers=None, time_budget=None, heuristic=False,
+                heuristic_share=0.1, eliminate=False, ordering=None, hooks=None, symmetry=False, kernelize=False,
+                russian_doll=False, schedule="static", stats=None):
+    """
+    Runs max_clique() on the chosen backend.
+    Returns:
+        max_clique (set or CliqueResult), steps (int)
+    """
+    if backend not in ("set", "bitset", "sparse"):
+        raise ValueError(f"Unknown backend {backend}")
+    if schedule not in ("static", "stealing"):
+        raise ValueError(f"Unknown schedule {schedule}")
+    if schedule != "static" and (workers is None or backend == "sparse"):
+        raise ValueError(f"The {schedule} schedule needs workers on the set or bitset backend")
+    if workers is not None and time_budget is not None:
+        raise ValueError("time_budget is not supported together with workers")
+    if hooks is not None and (backend != "set" or workers is not None):
+        raise ValueError("hooks are only supported by the set backend")
+    if symmetry and (backend != "set" or workers is not None):
+        raise ValueError("symmetry is only supported by the set backend")
+    if russian_doll and (backend != "set" or workers is not None):
+        raise ValueError("russian_doll is only supported by the set backend")
+    if russian_doll and symmetry:
+        raise ValueError("russian_doll is not supported together with symmetry")
+    if kernelize and (symmetry or russian_doll or workers is not None):
+        raise ValueError("kernelize is not supported together with symmetry, russian_doll or workers")
+    if kernelize:
+        return kernel_clique(G, nodes, backend, time_budget, heuristic, heuristic_share, eliminate,
+                             ordering, hooks)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    seed = None
+    if heuristic:
+        seed = heuristic_clique(G, nodes, time_limit=None if time_budget is None else heuristic_share * time_budget)
+    order = None if ordering is None else vertex_ordering(G, ordering)
+    if backend == "sparse":
+        info = stats if stats is not None else {}
+        clique, steps = sparse_max_clique(G, nodes, workers, stats=info, deadline=deadline, seed=seed, eliminate=eliminate)
+        return _result(clique, time_budget, info), steps
+    if workers is not None:
+        clique, steps = parallel_max_clique(G, nodes, workers, schedule=schedule, stats=stats, seed=seed, order=order)
+        return set(clique), steps
+    if backend == "bitset":
+        info = {}
+        clique, steps = _bitset_clique(G, nodes, stats=info, deadline=deadline, seed=seed, eliminate=eliminate,
+                                      order=order)
+        return _result(clique, time_budget, info), steps
+
+    engine = symmetric_search if symmetry else russian_doll_search if russian_doll else search_engine
+    clique, steps, upper_bound, optimal = engine(G, nodes, order=order, deadline=deadline, seed=seed,
+                                                 eliminate=eliminate, hooks=hooks)
+    return _result(clique, time_budget, upper_bound, optimal), steps
+
+def _custom_clique(G, str_mode, schedule, nodes=None, backend="set", incremental=False, stats=None,
+                   time_budget=None, maxsat_depth=None, hooks=None):
+    """
+    Runs the custom greedy variants on the chosen backend, schedule is "always", "partial", "adaptive"
+    or None for the default of the backend ("adaptive" on the set backend, "partial" on the bitset one).
+    Returns:
+        max_clique (set or CliqueResult), steps (int)
+    """
+    if backend not in ("set", "bitset"):
+        raise ValueError(f"Unknown backend {backend}")
+    if schedule not in (None, "always", "partial", "adaptive"):
+        raise ValueError(f"Unknown schedule {schedule}")
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    if backend == "bitset" or str_mode in TOMITA_STRATEGIES or incremental or maxsat_depth is not None:
+        if hooks is not None:
+            raise ValueError("hooks are only supported by the set backend")
+        if schedule == "adaptive":
+            raise ValueError("the adaptive schedule is only supported by the set backend")
+        schedule = schedule or "partial"
+        info = stats if stats is not None else {}
+        clique, steps = _bitset_clique(G, nodes, str_mode, schedule != "always", incremental, info, deadline,
+                                      maxsat_depth=maxsat_depth)
+        return _result(clique, time_budget, info), steps
+
+    clique, steps, upper_bound, optimal = search_engine(G, nodes, str_mode, schedule or "adaptive",
+                                                        deadline=deadline, hooks=hooks)
+    return _result(clique, time_budget, upper_bound, optimal), steps
+
+def _seed_candidates(G, nodes):
+    """
+    Parameters:
+        G (networkx.Graph): The graph being searched.
+        nodes (list): The nodes the clique must contain, or None.
+
+    Returns:
+        tuple: A copy of `nodes` and the set of nodes adjacent to all of them, self-loops left out.
+    """
     Q = nodes[:] if nodes is not None else []
     cand = set(G)
-
-    # If user provided initial clique nodes, verify they form a clique
     for node in Q:
         if node not in cand:
             raise ValueError(f"The given `nodes` {nodes} do not form a clique")
-        cand &= adj[node] # Intersect candidates with neighbors of current node
-
-    # If no candidates left - return what we have in Q
-    if not cand:
-        return set(Q[:]), 0
-
-    subg = cand.copy()
-    stack = [] # Stack to simulate recursion
-
-    Q.append(None) # Place holder for new nodes
-
-    u = max(subg, key=lambda u: len(cand & adj[u]))
-    ext_u = cand - adj[u]
-    max_clique = Q[:-1]
-
-    steps = 0
-    try:
-        while True:
-            steps += 1
-            if ext_u:
-                # Pick a node from ext_u to try adding to clique
-                q = ext_u.pop()
-                cand.remove(q)
-                Q[-1] = q 
-
-                adj_q = adj[q] 
-                subg_q = subg & adj_q 
+        cand &= {v for v in G[node] if v != node}
+    return Q, cand
 
-                if not subg_q:
-                    if len(Q) > len(max_clique):
-                        max_clique = Q[:] # Found larger clique
-                else:
-                    # Reduce candidate set to only neighbors of q
-                    cand_q = cand & adj_q
+def _result(clique, time_budget, upper_bound=None, optimal=True):
+    """
+    Returns the clique found by a solver as a plain set, or as a CliqueResult when it was given a time_budget.
+    Parameters:
+        clique (iterable): The nodes of the clique.
+        time_budget (float): The time_budget given to the solver, or None.
+        upper_bound (int or dict): optional, the upper bound proven by the search, or the stats
+                                   dict a bitset search stored its "upper_bound" and "optimal" in.
+        optimal (bool): optional, whether the search finished.
+    Returns:
+        set or CliqueResult
+    """
+    if time_budget is None:
+        return set(clique)
+    if isinstance(upper_bound, dict):
+        upper_bound, optimal = upper_bound.get("upper_bound"), upper_bound.get("optimal", True)
+    return CliqueResult(clique, upper_bound, optimal)
 
-                    if len(Q) % 3 == 0:
-                        if len(Q) + max(greedy_color(G.subgraph(cand_q), strategy=str_mode).values(), default=-1) + 1 > len(max_clique):
-                            stack.append((subg, cand, ext_u))
-                            Q.append(None)
-
-                            #Update state for recursive call
-                            subg = subg_q
-                            cand = cand_q
-                            u = max(subg, key=lambda u: len(cand & adj[u]))
-                            ext_u = cand - adj[u]
-                    else:
-                        if len(Q) + len(cand_q) > len(max_clique):
-                            stack.append((subg, cand, ext_u))
-                            Q.append(None)
-
-                            #Update state for recursive call
-                            subg = subg_q
-                            cand = cand_q
-                            u = max(subg, key=lambda u: len(cand & adj[u]))
-                            ext_u = cand - adj[u]
-            else:
-                # Backtrack: no more extension nodes to try
-                Q.pop()
-                if not stack:
-                    break 
-                subg, cand, ext_u = stack.pop()
-    except IndexError:
-        pass
+def _eliminate(adj, alive, k):
+    """
+    Removes the nodes of alive (in place) that can not be in a clique of more than k nodes of alive.
+    Such a clique needs k neighbours inside it for every node, so nodes of core number below k
+    are peeled off, and a node whose neighbourhood can be coloured with k - 1 colours is removed.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        alive (set): The nodes still in the graph, changed in place.
+        k (int): Size of the clique to beat, counted inside alive.
+    Returns:
+        dead (set): The nodes removed.
+    """
+    dead = set()
+    if k <= 0:
+        return dead
+    queue = list(alive)
+    check = set(alive) # Nodes whose neighbourhood changed since its colouring was checked
+    while check:
+        # Peel nodes of degree below k, rechecking the neighbours of every removed node
+        while queue:
+            v = queue.pop()
+            if v in alive and len(adj[v] & alive) < k:
+                alive.remove(v)
+                dead.add(v)
+                queue.extend(adj[v] & alive)
+                check |= adj[v]
+
+        todo, check = check & alive, set()
+        for v in todo:
+            neighbours = adj[v] & alive
+            if _fewer_colors(adj, neighbours, k):
+                alive.remove(v)
+                dead.add(v)
+                queue.extend(neighbours)
+                check |= neighbours
+    return dead
+
+def _fewer_colors(adj, nodes, k):
+    """
+    Returns True if a greedy colouring colours nodes with fewer than k colours.
+    Colours one maximal independent set at a time and stops as soon as k - 1 colours are used.
+    """
+    uncolored = set(nodes)
+    for _ in range(k - 1):
+        if not uncolored:
+            return True
+        available = set(uncolored)
+        while available:
+            w = available.pop()
+            uncolored.remove(w)
+            available -= adj[w]
+    return not uncolored
+
+def _open_bound(G, Q, stack, cand, ext_u, best):
+    """
+    Upper bound on the cliques a set search that stopped early could still have found.
+    The unexplored branches of a level only add candidates of that level to its clique,
+    so a level can not beat its clique size plus the number of colours of its candidates.
+    Parameters:
+        G (networkx.Graph): The graph.
+        Q (list): The clique of the search, ending with the place holder of the current level.
+        stack (list): The (subg, cand, ext_u) frames of the levels above the current one.
+        cand (set), ext_u (set or list): The candidates and the nodes left to branch on at the current level.
+        best (int): Size of the best clique found.
+    Returns:
+        int: No clique reachable from the open levels is larger than this.
+    """
+    base = len(Q) - 1 - len(stack)
+    levels = [(base + j, f_cand) for j, (_, f_cand, f_ext_u) in enumerate(stack) if f_ext_u]
+    if ext_u:
+        levels.append((len(Q) - 1, cand))
+
+    bound = best
+    for size, level_cand in levels:
+        if size + len(level_cand) > bound:
+            coloring = greedy_coloring_heuristic(G.subgraph(level_cand), list(level_cand))
+            bound = max(bound, size + max(coloring.values(), default=-1) + 1)
+    return bound
+
+def _doll_bound(G, Q, order, k, done, best):
+    """
+    Upper bound of a russian_doll_search() stopped in the doll of order[k].
+    Every node from order[k] on adds at most one node to the largest clique of the dolls before,
+    and no clique has more nodes than the candidates have colours.
+    Parameters:
+        G (networkx.Graph): The graph.
+        Q (list): The nodes that must be in the clique.
+        order (list): The candidates, in the order the dolls grow.
+        k (int): Index of the doll being searched.
+        done (int): Size of the largest clique among order[:k], Q left out.
+        best (int): Size of the best clique found.
+    Returns:
+        int: No clique of G through Q is larger than this.
+    """
+    colors = max(greedy_coloring_heuristic(G.subgraph(order), order).values(), default=-1) + 1
+    return max(best, len(Q) + min(done + len(order) - k, colors))
 
-    return set(max_clique), steps
+def _bitset_clique(G, nodes=None, str_mode=None, partial=False, incremental=False, stats=None,
+                   deadline=None, seed=None, eliminate=False, maxsat_depth=None, order=None):
+    """
+    Runs the search used by max_clique() and the custom greedy variants on the bitset backend.
+    Nodes are relabeled to 0..n-1 and every adjacency row, candidate set and subgraph set
+    is a single int, so each set operation is one & and each size is one bit_count().
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional
+        str_mode (string): optional, the colouring strategy used to prune. None prunes on size only,
+                           "mcq", "mcr" and "mcs" switch to color_search().
+        partial (bool): optional, only colour every 3 iterations.
+        incremental (bool): optional, reuse the parent node's colour classes before recolouring.
+        stats (dict): optional, filled with the "colorings" run and the "recolors_avoided".
+        deadline (float): optional, time.perf_counter() value after which the search stops early,
+                          stats then gets the "upper_bound" proven so far and whether it is "optimal".
+        seed (list): optional, the nodes of a clique found beforehand, only larger cliques are searched for.
+        eliminate (bool): optional, remove nodes that can not be in a larger clique (pivot search only).
+        maxsat_depth (int): optional, try the MaxSAT bound on the colour classes of the search nodes
+                            up to this depth (needs a str_mode to colour with).
+        order (list): optional, the node order used for the labels, the pivot search branches on
+                      the lowest label first ("mcq", "mcr" and "mcs" use their own order).
+    Returns:
+        clique (list): The nodes of the largest clique found in G.
+        steps (int): The number of steps taken by the algorithm.
+    """
+    if len(G) == 0:
+        return [], 0
+
+    if str_mode == "mcq":
+        order = vertex_ordering(G, "max_degree") # Highest degree gets the first label
+    elif str_mode in ("mcr", "mcs"):
+        order = vertex_ordering(G, "min_width") # Minimum degree last, self-loops left out
+
+    node_list, adj, Q, cand = start_state(G, nodes, order)
+    if seed is not None:
+        index = {u: i for i, u in enumerate(node_list)}
+        seed = [index[u] for u in seed]
+
+    if str_mode in TOMITA_STRATEGIES:
+        clique, steps = color_search(adj, cand, Q, str_mode == "mcs", partial, incremental, stats,
+                                    deadline, seed, maxsat_depth)
+    else:
+        coloring = None if str_mode is None else _coloring(G, node_list, adj, str_mode)
+        clique, steps = pivot_search(adj, cand, Q, coloring, partial, incremental, stats,
+                                    deadline=deadline, seed=seed, eliminate=eliminate, maxsat_depth=maxsat_depth)
+    return to_nodes(node_list, clique), steps
+
+def _ranked_cliques(G, nodes=None, k=None, stats=None):
+    """
+    Runs ranked_search() on the bitsets of G.
+    Returns:
+        cliques (list): Node lists of the cliques kept, largest first.
+    """
+    if len(G) == 0:
+        return []
+    node_list, adj, Q, cand = start_state(G, nodes)
+    cliques, steps = ranked_search(adj, cand, Q, k, stats)
+    if stats is not None:
+        stats["steps"] = stats.get("steps", 0) + steps
+    return [to_nodes(node_list, clique) for clique in cliques]
+
+def _coloring(G, node_list, adj, str_mode):
+    """
+    Builds the colouring used by the bitset backend.
+    "largest_first" and "random_sequential" are coloured directly on the bitsets,
+    any other networkX strategy falls back to greedy_color() on the matching subgraph.
+    Parameters:
+        G (networkx.Graph): The graph.
+        node_list (list): node_list[i] is the node with label i.
+        adj (list): Bitset adjacency rows.
+        str_mode (string): The colouring strategy.
+    Returns:
+        function: Maps a candidate bitset to its colour classes (as bitsets).
+    """
+    if str_mode in ("largest_first", "random_sequential"):
+        return lambda P: color_classes(P, adj, str_mode)
+
+    index = {u: i for i, u in enumerate(node_list)}
+    def nx_coloring(P):
+        coloring = greedy_color(G.subgraph(to_nodes(node_list, P)), strategy=str_mode)
+        classes = [0] * (max(coloring.values(), default=-1) + 1)
+        for node, color in coloring.items():
+            classes[color] |= 1 << index[node]
+        return classes
+    return nx_coloring
 
 
 """
@@ -0,0 +1,220 @@
+"""
+Persistent on-disk cache for the results of the clique solvers.
+A result is keyed by a hash of the graph (its nodes relabeled 0..n-1 in sorted order, written as
+graph6 or sparse6 bytes) together with the name of the solver and its parameters, so the same
+DIMACS subgraph is only ever solved once per solver. Entries live in a SQLite file and the least
+recently used ones are evicted once the stored results outgrow the size limit.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import sqlite3
+import time
+
+import networkx as nx
+
+# Cache used by every @cacheable solver when no cache is passed, set with set_default_cache()
+_default_cache = None
+
+# Parameters that make a result depend on the run instead of the graph, results are never cached with them
+UNCACHED_PARAMETERS = ("stats", "time_budget", "hooks")
+
+def canonical_form(G):
+    """
+    Relabels the nodes of G to 0..n-1 in sorted order and hashes the edge set.
+    Self-loops are dropped, no clique solver uses them.
+    Parameters:
+        G (networkx.Graph): The graph.
+    Returns:
+        digest (str): sha256 hex digest of the graph6 (dense) or sparse6 (sparse) bytes.
+        node_list (list): node_list[i] is the node relabeled to i.
+    """
+    try:
+        node_list = sorted(G)
+    except TypeError:
+        node_list = sorted(G, key=repr) # Nodes of mixed types
+    index = {u: i for i, u in enumerate(node_list)}
+    H = nx.Graph()
+    H.add_nodes_from(range(len(node_list)))
+    H.add_edges_from((index[u], index[v]) for u, v in G.edges() if u != v)
+
+    # graph6 stores every node pair, sparse6 every edge, so pick the shorter one
+    n, m = len(node_list), H.number_of_edges()
+    if m * (n.bit_length() + 1) < n * (n - 1) // 2:
+        data = b"sparse6" + nx.to_sparse6_bytes(H, header=False)
+    else:
+        data = b"graph6" + nx.to_graph6_bytes(H, header=False)
+    return hashlib.sha256(data).hexdigest(), node_list
+
+class CliqueCache:
+    """
+    A SQLite file holding solver results, evicting the least recently used once over max_bytes.
+    Every entry holds the clique (as relabeled nodes), its size, the steps and the runtime of the solver.
+    """
+    def __init__(self, path="clique_cache.sqlite", max_bytes=64 * 1024 * 1024):
+        """
+        Parameters:
+            path (str): optional, the SQLite file, ":memory:" keeps the cache in memory.
+            max_bytes (int): optional, the largest total size of the stored results.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._db = sqlite3.connect(path, timeout=30)
+        # A hit writes last_used, WAL keeps that commit from waiting on a full sync to disk
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS results (
+                                key TEXT PRIMARY KEY, graph TEXT, algorithm TEXT, params TEXT,
+                                clique TEXT, size INTEGER, steps INTEGER, runtime REAL,
+                                bytes INTEGER, last_used REAL)""")
+        self._db.commit()
+
+    def key(self, digest, algorithm, params):
+        """
+        Parameters:
+            digest (str): The canonical_form() digest of the graph.
+            algorithm (str): Name of the solver.
+            params (dict): JSON serialisable parameters of the solver.
+        Returns:
+            key (str): The key of the entry.
+        """
+        text = json.dumps([digest, algorithm, params], sort_keys=True)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Looks an entry up and marks it as the most recently used.
+        Returns:
+            entry (dict): The "clique" (relabeled nodes), "size", "steps" (None if the solver counts none)
+                          and "runtime", or None when the key is not cached.
+        """
+        row = self._db.execute("SELECT clique, size, steps, runtime FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._db.commit()
+        return {"clique": json.loads(row[0]), "size": row[1], "steps": row[2], "runtime": row[3]}
+
+    def put(self, key, digest, algorithm, params, clique, steps, runtime):
+        """
+        Stores an entry and evicts the least recently used ones while the cache is over max_bytes.
+        Parameters:
+            key (str): The key() of the entry.
+            digest, algorithm, params: What the key was built from, kept for inspection.
+            clique (list): The clique as relabeled nodes.
+            steps (int): The steps taken, or None.
+            runtime (float): Seconds the solver took.
+        """
+        clique_text = json.dumps(sorted(clique))
+        params_text = json.dumps(params, sort_keys=True)
+        size_bytes = len(key) + len(digest) + len(algorithm) + len(params_text) + len(clique_text) + 40
+        self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         (key, digest, algorithm, params_text, clique_text, len(clique), steps, runtime,
+                          size_bytes, time.time()))
+        total = self._db.execute("SELECT COALESCE(SUM(bytes), 0) FROM results").fetchone()[0]
+        if total > self.max_bytes:
+            # Drop the least recently used entries until the rest fits
+            for old_key, old_bytes in self._db.execute("SELECT key, bytes FROM results ORDER BY last_used").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM results WHERE key = ?", (old_key,))
+                total -= old_bytes
+        self._db.commit()
+
+    def total_bytes(self):
+        """
+        Returns:
+            int: The total size of the stored results.
+        """
+        return self._db.execute("SELECT COALESCE(SUM(bytes), 0) FROM results").fetchone()[0]
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        self._db.execute("DELETE FROM results")
+        self._db.commit()
+
+    def close(self):
+        """
+        Closes the SQLite connection.
+        """
+        self._db.close()
+
+def set_default_cache(cache):
+    """
+    Makes every @cacheable solver consult cache when it is not given one, None turns this off.
+    Parameters:
+        cache (CliqueCache): The cache, or None.
+    Returns:
+        previous (CliqueCache): The default cache before, or None.
+    """
+    global _default_cache
+    previous, _default_cache = _default_cache, cache
+    return previous
+
+def cacheable(func):
+    """
+    Lets a solver consult a CliqueCache, taking it from a `cache` keyword argument or set_default_cache().
+    The solver is called as usual on a miss and its clique, steps and runtime are stored. A hit returns
+    the stored clique as a set (with the stored steps when the solver returns them) without solving.
+    Calls given a stats dict or a time_budget, or parameters that are not JSON serialisable, always run
+    the solver. Parameters that are nodes are relabeled like the graph, so the key only depends on it.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(G, *args, cache=None, **kwargs):
+        cache = cache if cache is not None else _default_cache
+        if cache is None:
+            return func(G, *args, **kwargs)
+
+        bound = signature.bind(G, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        del params[next(iter(signature.parameters))] # The graph itself is keyed by its digest
+        if any(params.get(name) is not None for name in UNCACHED_PARAMETERS):
+            return func(G, *args, **kwargs)
+
+        digest, node_list = canonical_form(G)
+        index = {u: i for i, u in enumerate(node_list)}
+        if params.get("nodes") is not None:
+            if not all(u in index for u in params["nodes"]):
+                return func(G, *args, **kwargs)
+            params["nodes"] = [index[u] for u in params["nodes"]]
+        try:
+            key = cache.key(digest, func.__name__, params)
+        except TypeError:
+            return func(G, *args, **kwargs) # Parameters that can not be keyed
+
+        entry = cache.get(key)
+        if entry is not None:
+            clique = {node_list[i] for i in entry["clique"]}
+            return clique if entry["steps"] is None else (clique, entry["steps"])
+
+        start = time.perf_counter()
+        result = func(G, *args, **kwargs)
+        runtime = time.perf_counter() - start
+        clique, steps = result if isinstance(result, tuple) else (result, None)
+        cache.put(key, digest, func.__name__, params, [index[u] for u in clique], steps, runtime)
+        return result
+
+    return wrapper
+
+@cacheable
+def built_in_max_clique(G):
+    """
+    The largest clique found by networkX find_cliques(), cacheable like the solvers.
+    Parameters:
+        G (networkx.Graph): The graph.
+    Returns:
+        set(max_clique): A set of nodes representing the largest clique in G.
+    """
+    return set(max(nx.find_cliques(G), key=len, default=[]))
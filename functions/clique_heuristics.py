@@ -0,0 +1,112 @@
+"""
+Fast heuristics that find a large clique without proving it is maximum.
+They are used to seed the exact searches with a good incumbent, so the bound
+prunes from the very first branch instead of only after a large clique was found.
+"""
+import time
+
+from functions.sparse_clique import degeneracy_order
+
+def core_numbers(adj):
+    """
+    Computes the core number of every node (the largest k such that the node is in a k-core).
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours (without self-loops).
+    Returns:
+        core (dict): Maps every node to its core number.
+    """
+    order, core, later = degeneracy_order(adj)
+    return core
+
+def greedy_clique(adj, start, key):
+    """
+    Grows a clique from start, always adding the candidate that keeps the most candidates.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        start: The first node of the clique.
+        key (dict): The priority of every node, used to break ties.
+    Returns:
+        clique (list): A maximal clique containing start.
+    """
+    clique = [start]
+    cand = set(adj[start])
+    while cand:
+        u = max(cand, key=lambda u: (len(cand & adj[u]), key[u]))
+        clique.append(u)
+        cand &= adj[u]
+    return clique
+
+def local_search(adj, clique, deadline=None):
+    """
+    Improves a clique with (1,2)-swaps: a node of the clique is dropped for two adjacent
+    nodes that are both adjacent to the rest of the clique, so each swap grows it by one.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        clique (list): A clique.
+        deadline (float): optional, time.perf_counter() value after which the search stops.
+    Returns:
+        clique (list): A clique at least as large as the given one, with no (1,2)-swap left.
+    """
+    clique = set(clique)
+    while deadline is None or time.perf_counter() < deadline:
+        # Nodes outside the clique missing exactly one clique neighbour, grouped by that node
+        tight = {}
+        for w in adj:
+            if w in clique:
+                continue
+            missing = clique - adj[w]
+            if not missing:
+                clique.add(w) # w is adjacent to the whole clique
+                break
+            if len(missing) == 1:
+                tight.setdefault(missing.pop(), []).append(w)
+        else:
+            for x, nodes in tight.items():
+                pair = next(((a, b) for i, a in enumerate(nodes) for b in nodes[i + 1:] if b in adj[a]), None)
+                if pair is not None:
+                    clique.discard(x)
+                    clique.update(pair)
+                    break
+            else:
+                break # No swap improves the clique
+    return list(clique)
+
+def heuristic_clique(G, nodes=None, starts=8, time_limit=None):
+    """
+    Multi-start greedy clique search followed by a short local search.
+    The greedy runs start from the top nodes by degree and by core number, the largest
+    clique found is then improved with local_search().
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in the clique (they must form a clique).
+        starts (int): optional, number of start nodes taken from each ordering.
+        time_limit (float): optional, seconds the heuristic may run for.
+    Returns:
+        clique (list): The nodes of a clique of G (containing the given nodes).
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    Q = list(nodes) if nodes is not None else []
+
+    # Only the common neighbours of the given nodes can extend them
+    cand = set(G)
+    for node in Q:
+        if node not in cand:
+            raise ValueError(f"The given `nodes` {nodes} do not form a clique")
+        cand &= {v for v in G[node] if v != node}
+    adj = {u: {v for v in G[u] if v in cand and v != u} for u in cand}
+    if not adj:
+        return Q
+
+    core = core_numbers(adj)
+    degree = {u: len(adj[u]) for u in adj}
+    best = []
+    for key in (degree, core):
+        ranking = sorted(adj, key=lambda u: (key[u], degree[u]), reverse=True)
+        for start in ranking[:starts]:
+            clique = greedy_clique(adj, start, key)
+            if len(clique) > len(best):
+                best = clique
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+
+    return Q + local_search(adj, best, deadline)
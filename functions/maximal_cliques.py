@@ -0,0 +1,165 @@
+"""
+Enumeration of maximal cliques.
+Every search here is an iterative Bron-Kerbosch search with Tomita pivoting that yields the
+cliques one at a time, so only the path to the current branch is ever stored.
+degeneracy_cliques() splits the search into one subproblem per node of a degeneracy ordering
+(Eppstein, Loffler and Strash), which bounds its runtime by O(d * n * 3^(d/3)) for degeneracy d.
+"""
+import multiprocessing
+import os
+
+from functions.sparse_clique import degeneracy_order
+
+# Worker state, set once per process by _init_worker()
+_best = None
+
+def pivot_cliques(adj, R, P, X, max_only=False, best=0, min_size=0, max_size=None):
+    """
+    Yields the maximal cliques that contain R, extend it with nodes of P and no node of X.
+    Parameters:
+        adj (dict): Maps every node of P and X to the set of its neighbours (without self-loops).
+        R (list): Nodes of the current clique, adjacent to every node of P and X.
+        P (set): Candidate nodes, changed by the search.
+        X (set): Excluded nodes, changed by the search.
+        max_only (bool): optional, only yield cliques larger than best and every clique yielded
+                         before, and prune every branch with |R| + |P| <= the size of the largest one.
+        best (int): optional, max_only starts from a clique of this size.
+        min_size (int): optional, only yield cliques of at least this size, and prune every branch
+                        with |R| + |P| below it.
+        max_size (int): optional, only yield cliques of at most this size, and prune every branch
+                        whose R already has this size but can still be extended.
+    Yields:
+        clique (set): A set of nodes forming a maximal clique.
+    """
+    def branches(P, X):
+        # Nodes left to branch on after choosing the pivot
+        pivot = max(P | X, key=lambda u: len(P & adj[u]))
+        return list(P - adj[pivot])
+
+    # Smallest clique size still wanted
+    floor = max(min_size, best + 1) if max_only else min_size
+    if max_size is None:
+        max_size = len(R) + len(P)
+
+    if not P:
+        if R and not X and floor <= len(R) <= max_size:
+            yield set(R)
+        return
+    if len(R) >= max_size:
+        return
+    clique = list(R) # One node is added per frame below the first
+    stack = [(P, X, branches(P, X))]
+    while stack:
+        P, X, todo = stack[-1]
+        if not todo or len(clique) + len(P) < floor:
+            stack.pop()
+            if stack:
+                clique.pop()
+            continue
+
+        vertex = todo.pop()
+        P.remove(vertex)
+        P_vertex = P & adj[vertex]
+        X_vertex = X & adj[vertex]
+        X.add(vertex)
+        clique.append(vertex)
+
+        if not P_vertex:
+            if not X_vertex and len(clique) >= floor:
+                if max_only:
+                    floor = len(clique) + 1
+                yield set(clique)
+            clique.pop()
+        elif len(clique) + len(P_vertex) < floor or len(clique) >= max_size:
+            clique.pop()
+        else:
+            stack.append((P_vertex, X_vertex, branches(P_vertex, X_vertex)))
+
+def degeneracy_cliques(G, workers=None, max_only=False, chunksize=16, min_size=0, max_size=None):
+    """
+    Yields the maximal cliques of G by running pivot_cliques() once per node v of a degeneracy ordering,
+    with P the neighbours of v later in the ordering and X the neighbours before it. Every maximal
+    clique is yielded exactly once, by the subproblem of its earliest node.
+    Parameters:
+        G (networkx.Graph): The graph.
+        workers (int): optional, solve the subproblems in this many processes, their cliques are merged
+                       into one stream in the order the subproblems finish.
+        max_only (bool): optional, only yield cliques larger than every clique yielded before, and skip
+                         the subproblems that can not beat the largest one.
+        chunksize (int): optional, number of subproblems handed to a worker at a time.
+        min_size (int): optional, only yield cliques of at least this size, subproblems with fewer
+                        nodes are skipped.
+        max_size (int): optional, only yield cliques of at most this size.
+    Yields:
+        clique (set): A set of nodes forming a maximal clique.
+    """
+    adj = {u: set(G[u]) - {u} for u in G} # Self-loops are not part of any clique
+    order, core, later = degeneracy_order(adj)
+
+    if workers is None:
+        best = 0
+        for v in order:
+            if 1 + len(later[v]) < (max(min_size, best + 1) if max_only else min_size):
+                continue
+            for clique in pivot_cliques(adj, [v], set(later[v]), adj[v].difference(later[v]), max_only, best,
+                                        min_size, max_size):
+                best = len(clique)
+                yield clique
+        return
+
+    best = multiprocessing.Value("i", 0) if max_only else None
+    def tasks():
+        for v in order:
+            if 1 + len(later[v]) < (max(min_size, best.value + 1) if max_only else min_size):
+                continue
+            yield v, later[v], subproblem(adj, v, later[v]), max_only, min_size, max_size
+
+    workers = workers or os.cpu_count()
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(best,)) as pool:
+        for cliques in pool.imap_unordered(_enumerate_task, tasks(), chunksize=chunksize):
+            for clique in cliques:
+                if max_only:
+                    if len(clique) <= best.value:
+                        continue
+                    best.value = len(clique) # Only the main process writes the best size
+                yield clique
+
+def subproblem(adj, v, later):
+    """
+    Builds the adjacency the subproblem of node v needs, so it can be sent to a worker on its own.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        v: The node of the subproblem.
+        later (list): The neighbours of v that come later in the degeneracy ordering.
+    Returns:
+        sub_adj (dict): Maps every neighbour of v to its neighbours among the later ones, and the
+                        later ones also to their neighbours before v.
+    """
+    P = set(later)
+    sub_adj = {w: adj[w] & P for w in adj[v]}
+    for w in later:
+        sub_adj[w] = adj[w] & adj[v]
+    return sub_adj
+
+def _init_worker(best):
+    """
+    Stores the shared best clique size in a worker process.
+    """
+    global _best
+    _best = best
+
+def _enumerate_task(task):
+    """
+    Lists the cliques of one subproblem in a pool worker.
+    Parameters:
+        task (tuple): (v, later, sub_adj, max_only, min_size, max_size) of one subproblem.
+    Returns:
+        cliques (list): The cliques pivot_cliques() yields for the subproblem.
+    """
+    v, later, sub_adj, max_only, min_size, max_size = task
+    best = _best.value if max_only else 0
+    if max_only and 1 + len(later) <= best:
+        return []
+    P = set(later)
+    X = set(sub_adj) - P
+    return list(pivot_cliques(sub_adj, [v], P, X, max_only, best, min_size, max_size))
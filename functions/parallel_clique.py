@@ -0,0 +1,280 @@
+"""
+Process-parallel versions of the clique searches in bitset_clique.py.
+The branches of the search are handed to worker processes and the size of the best
+clique is shared through a multiprocessing.Value, so every worker prunes against the
+best clique found by any worker.
+"""
+import multiprocessing
+import os
+import time
+from array import array
+
+from functions.bitset_clique import start_state, to_nodes, pivot_search, choose_pivot, share_incumbent
+
+# Worker state, set once per process by _init_worker()
+_adj = None
+_incumbent = None
+
+def parallel_max_clique(G, nodes=None, workers=None, depth=1, schedule="static", stats=None, seed=None,
+                        order=None):
+    """
+    Finds the maximum clique with the search of max_clique(), split over several processes.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in the clique.
+        workers (int): optional, number of processes. Defaults to os.cpu_count().
+        depth (int): optional, "static" only, split the search tree at depth 1 (root branches) or 2.
+        schedule (str): optional, "static" hands the split branches to a process pool,
+                        "stealing" starts from the root and lets idle workers take the oldest
+                        unexplored frames from the stacks of busy workers.
+        stats (dict): optional, stats["workers"] is filled with one dict per worker holding its
+                      "busy" and "idle" seconds, the "frames" it ran, the frames it "donated"
+                      and its "steps".
+        seed (list): optional, the nodes of a clique found beforehand (by a heuristic), it becomes
+                     the starting incumbent of every worker.
+        order (list): optional, the nodes in the order they are branched on.
+    Returns:
+        clique (list): The nodes of the largest clique found in G.
+        steps (int): The number of steps taken by all workers together.
+    """
+    if len(G) == 0:
+        return [], 0
+    if depth not in (1, 2):
+        raise ValueError(f"depth must be 1 or 2, not {depth}")
+    if schedule not in ("static", "stealing"):
+        raise ValueError(f"Unknown schedule {schedule}")
+
+    node_list, adj, Q, cand = start_state(G, nodes, order)
+    if not cand:
+        return to_nodes(node_list, Q), 0
+
+    workers = workers or os.cpu_count()
+    start = Q
+    if seed is not None and len(seed) > len(Q):
+        index = {u: i for i, u in enumerate(node_list)}
+        start = [index[u] for u in seed]
+    incumbent = multiprocessing.Value("i", len(start))
+    if schedule == "stealing":
+        best, steps, worker_stats = _run_stealing(adj, Q, cand, workers, incumbent, start)
+    else:
+        best, steps, worker_stats = _run_static(adj, Q, cand, workers, depth, incumbent, start)
+
+    if stats is not None:
+        stats["workers"] = worker_stats
+    return to_nodes(node_list, best), steps
+
+def split_branches(adj, Q, subg, cand, depth=1):
+    """
+    Lists the branches the search of max_clique() would explore below a node.
+    Every branch is independent, running them all in any order explores the same tree.
+    Parameters:
+        adj (list): Bitset adjacency rows.
+        Q (list): Labels of the nodes in the current clique.
+        subg (int): Bitset of the subgraph nodes.
+        cand (int): Bitset of the candidate nodes.
+        depth (int): optional, number of levels to expand.
+    Returns:
+        tasks (list): (Q, subg, cand) tuples, one per branch.
+    """
+    tasks = []
+    u = choose_pivot(subg, cand, adj)
+    ext_u = cand & ~adj[u]
+    while ext_u:
+        low = ext_u & -ext_u
+        ext_u ^= low
+        cand ^= low # Later branches never take q again
+        q = low.bit_length() - 1
+        subg_q = subg & adj[q]
+        cand_q = cand & adj[q]
+        if depth > 1 and cand_q:
+            tasks.extend(split_branches(adj, Q + [q], subg_q, cand_q, depth - 1))
+        else:
+            tasks.append((Q + [q], subg_q, cand_q))
+    return tasks
+
+def pack_frame(Q, subg, cand, ext_u, size):
+    """
+    Serializes a search frame into one bytes object so it can be sent to another process.
+    Parameters:
+        Q (list): Labels of the nodes in the clique of the frame.
+        subg, cand, ext_u (int): The bitsets of the frame.
+        size (int): Number of bytes of every bitset, (n + 7) // 8.
+    Returns:
+        bytes: The packed frame.
+    """
+    labels = array("l", Q).tobytes()
+    return (len(Q).to_bytes(4, "little") + labels + subg.to_bytes(size, "little")
+            + cand.to_bytes(size, "little") + ext_u.to_bytes(size, "little"))
+
+def unpack_frame(packed, size):
+    """
+    Reverses pack_frame().
+    Parameters:
+        packed (bytes): The packed frame.
+        size (int): Number of bytes of every bitset.
+    Returns:
+        Q (list), subg (int), cand (int), ext_u (int)
+    """
+    count = int.from_bytes(packed[:4], "little")
+    start = 4 + count * array("l").itemsize
+    Q = array("l", packed[4:start]).tolist()
+    subg = int.from_bytes(packed[start:start + size], "little")
+    cand = int.from_bytes(packed[start + size:start + 2 * size], "little")
+    ext_u = int.from_bytes(packed[start + 2 * size:], "little")
+    return Q, subg, cand, ext_u
+
+def _run_static(adj, Q, cand, workers, depth, incumbent, best):
+    """
+    Runs the branches of split_branches() in a process pool.
+    best is the clique the incumbent was started with.
+    Returns:
+        best (list), steps (int), worker_stats (list)
+    """
+    tasks = split_branches(adj, Q, cand, cand, depth)
+    steps = 0
+    per_pid = {}
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(adj, incumbent)) as pool:
+        for clique, task_steps, pid, busy in pool.imap_unordered(_solve_branch, tasks):
+            steps += task_steps
+            if len(clique) > len(best):
+                best = clique
+            record = per_pid.setdefault(pid, {"busy": 0.0, "idle": 0.0, "frames": 0, "donated": 0, "steps": 0})
+            record["busy"] += busy
+            record["frames"] += 1
+            record["steps"] += task_steps
+    wall = time.perf_counter() - start
+
+    worker_stats = list(per_pid.values())
+    for record in worker_stats:
+        record["idle"] = max(wall - record["busy"], 0.0)
+    return best, steps, worker_stats
+
+def _init_worker(adj, incumbent):
+    """
+    Stores the graph and the shared incumbent in a worker process.
+    """
+    global _adj, _incumbent
+    _adj = adj
+    _incumbent = incumbent
+
+def _solve_branch(task):
+    """
+    Runs the search of one branch in a pool worker.
+    Parameters:
+        task (tuple): (Q, subg, cand) from split_branches().
+    Returns:
+        clique (list): Labels of the largest clique found, only if it beat the incumbent.
+        steps (int): The number of steps taken.
+        pid (int): The worker's process id.
+        busy (float): Seconds spent on the branch.
+    """
+    start = time.perf_counter()
+    Q, subg, cand = task
+    if not subg:
+        # Q cannot be extended, so it is a maximal clique
+        clique, steps = [], 0
+        if len(Q) > _incumbent.value:
+            share_incumbent(_incumbent, len(Q))
+            clique = Q
+    else:
+        clique, steps = pivot_search(_adj, cand, Q, subg=subg, incumbent=_incumbent)
+    return clique, steps, os.getpid(), time.perf_counter() - start
+
+def _run_stealing(adj, Q, cand, workers, incumbent, best):
+    """
+    Runs the search with work stealing. The root frame goes to one worker and every
+    other worker waits until a busy worker hands it a frame from its stack.
+    best is the clique the incumbent was started with.
+    Returns:
+        best (list), steps (int), worker_stats (list)
+    """
+    size = (len(adj) + 7) // 8
+    frames = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    # Idle workers minus frames already waiting in the queue
+    hungry = multiprocessing.Value("i", -1)
+    # Frames queued or running, the search is over when it reaches 0
+    pending = multiprocessing.Value("i", 1)
+
+    u = choose_pivot(cand, cand, adj)
+    frames.put(pack_frame(Q, cand, cand, cand & ~adj[u], size))
+
+    processes = [multiprocessing.Process(target=_stealing_worker,
+                                         args=(adj, incumbent, frames, results, hungry, pending, workers, size))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    steps, worker_stats = 0, []
+    for _ in processes:
+        clique, worker_steps, record = results.get()
+        steps += worker_steps
+        worker_stats.append(record)
+        if len(clique) > len(best):
+            best = clique
+    for process in processes:
+        process.join()
+    return best, steps, worker_stats
+
+class _FrameDonor:
+    """
+    Lets the search of a busy worker hand frames to idle workers (see pivot_search()).
+    """
+    def __init__(self, frames, hungry, pending, size):
+        self.frames = frames
+        self.hungry = hungry
+        self.pending = pending
+        self.size = size
+        self.donated = 0
+
+    def wanted(self):
+        return self.hungry.value > 0
+
+    def give(self, Q, subg, cand, ext_u):
+        with self.hungry.get_lock():
+            if self.hungry.value <= 0:
+                return False
+            self.hungry.value -= 1
+        with self.pending.get_lock():
+            self.pending.value += 1
+        self.frames.put(pack_frame(Q, subg, cand, ext_u, self.size))
+        self.donated += 1
+        return True
+
+def _stealing_worker(adj, incumbent, frames, results, hungry, pending, workers, size):
+    """
+    Worker loop of the work stealing schedule: take a frame, search it, repeat until
+    every frame has been searched.
+    """
+    donor = _FrameDonor(frames, hungry, pending, size)
+    best, steps, busy, idle, run = [], 0, 0.0, 0.0, 0
+
+    while True:
+        start = time.perf_counter()
+        with hungry.get_lock():
+            hungry.value += 1
+        packed = frames.get()
+        idle += time.perf_counter() - start
+        if packed is None:
+            break
+
+        start = time.perf_counter()
+        Q, subg, cand, ext_u = unpack_frame(packed, size)
+        clique, frame_steps = pivot_search(adj, cand, Q, subg=subg, incumbent=incumbent,
+                                           ext_u=ext_u, donor=donor)
+        busy += time.perf_counter() - start
+        steps += frame_steps
+        run += 1
+        if len(clique) > len(best):
+            best = clique
+
+        with pending.get_lock():
+            pending.value -= 1
+            if pending.value == 0:
+                for _ in range(workers):
+                    frames.put(None) # Tell every worker to stop
+
+    results.put((best, steps, {"busy": busy, "idle": idle, "frames": run,
+                               "donated": donor.donated, "steps": steps}))
@@ -30,4 +30,18 @@ def read_dimacs_clq(source):
                 u = int(parts[1])
                 v = int(parts[2])
                 G.add_edge(u, v)
-    return G
\ No newline at end of file
+    return G
+
+def set_dimacs_weights(G, weight="weight"):
+    """
+    Gives every node i of a DIMACS graph the weight (i mod 200) + 1, the standard weights used to
+    benchmark maximum weight clique solvers on the DIMACS files.
+    Parameters:
+        G (networkx.Graph): A graph read by read_dimacs_clq(), its nodes are 1..n.
+        weight (str): optional, the node attribute the weights are stored in.
+    Returns:
+        G (networkx.Graph): The same graph.
+    """
+    for i in G:
+        G.nodes[i][weight] = (i % 200) + 1
+    return G
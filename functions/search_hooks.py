@@ -0,0 +1,198 @@
+"""
+Instrumentation hooks for the set search engine of clique_algorithms.py.
+SearchCounters totals the events of a search and SearchProfile breaks them down per depth.
+The engine calls the methods of a hooks object at every step, colouring decision, bound computation, prune,
+incumbent update and change of depth. Without a hooks object none of this runs, the engine
+only checks once per event that it was given none.
+"""
+import json
+import time
+from collections import defaultdict
+
+class SearchHooks:
+    """
+    Hooks that do nothing, subclass it and override the events of interest.
+    The depth of an event is the number of levels below the root of the search.
+    """
+    def step(self, depth):
+        """One iteration of the search loop at this depth."""
+
+    def schedule(self, depth, color):
+        """The size bound could not cut a child, color is True if its colouring bound is computed."""
+
+    def bound(self, depth, seconds):
+        """A colouring bound of a child was computed in this many seconds."""
+
+    def prune(self, depth, reason):
+        """
+        A child was cut, reason is "size" (too few candidates), "color" (too few colours)
+        or "doll" (too small a clique in the nested subgraph of russian_doll_search()).
+        """
+
+    def improve(self, size):
+        """The best clique grew to this size."""
+
+    def enter(self, depth):
+        """The search descended into a child at this depth."""
+
+    def leave(self, depth):
+        """The search backtracked out of this depth."""
+
+class SearchCounters(SearchHooks):
+    """
+    Hooks that count every event of a search.
+    Attributes:
+        steps (int): Iterations of the search loop.
+        bound_calls (int): Colouring bounds computed.
+        bound_skips (int): Colouring bounds the schedule skipped.
+        prunes (dict): Maps "size", "color" and "doll" to the number of children they cut.
+        incumbent_updates (int): Times the best clique grew.
+        time_per_depth (dict): Maps every depth to the seconds spent at it, deeper levels excluded.
+    """
+    def __init__(self):
+        self.steps = 0
+        self.bound_calls = 0
+        self.bound_skips = 0
+        self.prunes = defaultdict(int)
+        self.incumbent_updates = 0
+        self.time_per_depth = defaultdict(float)
+        self._since = None
+
+    def step(self, depth):
+        self.steps += 1
+        if self._since is None:
+            self._since = time.perf_counter()
+
+    def schedule(self, depth, color):
+        self.bound_skips += not color
+
+    def bound(self, depth, seconds):
+        self.bound_calls += 1
+
+    def prune(self, depth, reason):
+        self.prunes[reason] += 1
+
+    def improve(self, size):
+        self.incumbent_updates += 1
+
+    def enter(self, depth):
+        self._charge(depth - 1)
+
+    def leave(self, depth):
+        self._charge(depth)
+
+    def _charge(self, depth):
+        # The time since the last change of depth was spent at this one
+        now = time.perf_counter()
+        if self._since is not None:
+            self.time_per_depth[depth] += now - self._since
+        self._since = now
+
+    def as_dict(self):
+        """
+        Returns:
+            counters (dict): The counters as plain ints, floats and dicts.
+        """
+        return {"steps": self.steps, "bound_calls": self.bound_calls, "bound_skips": self.bound_skips, "prunes": dict(self.prunes),
+                "incumbent_updates": self.incumbent_updates, "time_per_depth": dict(sorted(self.time_per_depth.items()))}
+
+class SearchProfile(SearchHooks):
+    """
+    Hooks that profile a search per depth, to see where each bound pays off.
+    A row of the profile is about the children created at that depth: how many were expanded,
+    how many the size, colouring and doll bounds cut, how many the schedule did not colour
+    and the seconds spent colouring them.
+    A child at depth d extends the given nodes by d nodes.
+    Attributes:
+        depths (dict): Maps every depth to its row, a dict of "steps", "expanded", "size_prunes",
+                       "color_prunes", "doll_prunes", "color_calls", "color_skips" and "color_seconds".
+        improvements (list): One dict per larger clique found, its "size", the "seconds" since
+                             the search started and the "steps" taken until then.
+    """
+    FIELDS = ("steps", "expanded", "size_prunes", "color_prunes", "doll_prunes", "color_calls", "color_skips",
+              "color_seconds")
+
+    def __init__(self):
+        self.depths = {}
+        self.improvements = []
+        self._steps = 0
+        self._start = None
+
+    def _row(self, depth):
+        row = self.depths.get(depth)
+        if row is None:
+            row = self.depths[depth] = dict.fromkeys(self.FIELDS, 0)
+            row["color_seconds"] = 0.0
+        return row
+
+    def step(self, depth):
+        if self._start is None:
+            self._start = time.perf_counter()
+            self._row(0)["expanded"] += 1 # The root
+        self._steps += 1
+        self._row(depth)["steps"] += 1
+
+    def schedule(self, depth, color):
+        self._row(depth + 1)["color_skips"] += not color
+
+    def bound(self, depth, seconds):
+        row = self._row(depth + 1)
+        row["color_calls"] += 1
+        row["color_seconds"] += seconds
+
+    def prune(self, depth, reason):
+        self._row(depth + 1)[f"{reason}_prunes"] += 1
+
+    def improve(self, size):
+        self.improvements.append({"size": size, "seconds": time.perf_counter() - self._start, "steps": self._steps})
+
+    def enter(self, depth):
+        self._row(depth)["expanded"] += 1
+
+    def as_dict(self):
+        """
+        Returns:
+            profile (dict): The "depths" (keys in increasing order) and the "improvements".
+        """
+        return {"depths": {depth: dict(self.depths[depth]) for depth in sorted(self.depths)},
+                "improvements": [dict(imp) for imp in self.improvements]}
+
+    def to_json(self, path=None):
+        """
+        Parameters:
+            path (str): optional, file the profile is written to.
+        Returns:
+            text (str): The profile as JSON, depths become string keys.
+        """
+        text = json.dumps(self.as_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def table(self):
+        """
+        Returns:
+            text (str): One line per depth with the share of children each bound cut, then a total
+                        and the larger cliques found.
+        """
+        lines = [f"  {'depth':>5} {'steps':>9} {'expanded':>9} {'size cut':>9} {'color cut':>9} "
+                 f"{'doll cut':>9} {'cut %':>6} {'colorings':>9} {'skipped':>9} {'color s':>9}"]
+        total = dict.fromkeys(self.FIELDS, 0)
+        for depth in sorted(self.depths):
+            row = self.depths[depth]
+            for field in self.FIELDS:
+                total[field] += row[field]
+            lines.append(self._line(depth, row))
+        lines.append(self._line("all", total))
+        for imp in self.improvements:
+            lines.append(f"  clique of size {imp['size']} after {imp['seconds']:.6f}s and {imp['steps']} steps")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _line(label, row):
+        cuts = row["size_prunes"] + row["color_prunes"] + row["doll_prunes"]
+        children = row["expanded"] + cuts
+        cut = 100 * cuts / children if children else 0.0
+        return (f"  {label:>5} {row['steps']:>9} {row['expanded']:>9} {row['size_prunes']:>9} {row['color_prunes']:>9} "
+                f"{row['doll_prunes']:>9} {cut:>6.1f} {row['color_calls']:>9} {row['color_skips']:>9} {row['color_seconds']:>9.4f}")
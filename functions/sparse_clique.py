@@ -0,0 +1,251 @@
+"""
+Maximum clique search for large sparse graphs.
+The nodes are put in a degeneracy ordering and every node gets one small subproblem
+holding only its neighbours later in the ordering, so no subproblem has more nodes than
+the degeneracy of the graph. Only the subproblems are turned into bitsets, never the whole graph.
+"""
+import multiprocessing
+import os
+import time
+
+from functions.bitset_clique import pivot_search, color_classes, share_incumbent
+
+# Worker state, set once per process by _init_worker()
+_incumbent = None
+
+def degeneracy_order(adj):
+    """
+    Orders the nodes by repeatedly removing a node of minimum degree (smallest last).
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours (without self-loops).
+    Returns:
+        order (list): The nodes in the order they were removed.
+        core (dict): Maps every node to its core number, the largest is the degeneracy.
+        later (dict): Maps every node to its neighbours removed after it, at most the degeneracy many.
+    """
+    degree = {u: len(adj[u]) for u in adj}
+    buckets = [set() for _ in range(max(degree.values(), default=0) + 1)]
+    for u, d in degree.items():
+        buckets[d].add(u)
+
+    order, core, later = [], {}, {}
+    d = 0
+    for _ in range(len(adj)):
+        # Peel a node of minimum remaining degree, no degree ever drops below d
+        while not buckets[d]:
+            d += 1
+        u = buckets[d].pop()
+        order.append(u)
+        core[u] = d
+        later[u] = [v for v in adj[u] if v not in core]
+        for v in later[u]:
+            if degree[v] > d:
+                buckets[degree[v]].remove(v)
+                degree[v] -= 1
+                buckets[degree[v]].add(v)
+    return order, core, later
+
+def peel(adj, later, k):
+    """
+    Removes the later neighbours of a node that have fewer than k - 1 neighbours among the others,
+    they can not be part of a clique of k of them.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        later (list): The neighbours of the node that come later in the degeneracy ordering.
+        k (int): The size of the clique looked for among them.
+    Returns:
+        kept (list): The nodes of later that are left, in their order, or None once fewer than k are left.
+    """
+    if len(later) < k:
+        return None
+    if k <= 1:
+        return later
+    kept = set(later)
+    degree, low = {}, []
+    for w in later:
+        degree[w] = len(adj[w].intersection(kept)) # kept never holds w itself
+        if degree[w] < k - 1:
+            low.append(w)
+            # Give up as soon as too few nodes can be left, most subproblems fail here
+            if len(later) - len(low) < k:
+                return None
+    while low:
+        w = low.pop()
+        kept.discard(w)
+        if len(kept) < k:
+            return None
+        for x in adj[w].intersection(kept):
+            degree[x] -= 1
+            if degree[x] == k - 2:
+                low.append(x)
+    return [w for w in later if w in kept]
+
+def subproblem(adj, later):
+    """
+    Builds the bitsets of the subgraph induced by the later neighbours of a node.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        later (list): The neighbours of the node that come later in the degeneracy ordering.
+    Returns:
+        rows (list): rows[i] is the bitset of the neighbours of later[i] among later.
+    """
+    index = {w: i for i, w in enumerate(later)}
+    rows = []
+    for w in later:
+        row = 0
+        for x in adj[w].intersection(index):
+            row |= 1 << index[x]
+        rows.append(row)
+    return rows
+
+def sparse_max_clique(G, nodes=None, workers=None, stats=None, deadline=None, seed=None, eliminate=False):
+    """
+    Finds the maximum clique by solving one subproblem per node of a degeneracy ordering.
+    The subproblem of a node holds its later neighbours, it is skipped when the core number of
+    the node plus one can not beat the best clique, or when peel() leaves too few of them, and
+    otherwise searched with pivot_search() and a colouring bound. The nodes with the largest
+    core numbers are searched first.
+    Parameters:
+        G (networkx.Graph): The graph.
+        nodes (list): optional, nodes that must be in the clique.
+        workers (int): optional, solve the subproblems in this many processes sharing the best clique size.
+        stats (dict): optional, filled with the "degeneracy", the "subproblems" searched and the
+                      number "skipped" by their core number or peel().
+        deadline (float): optional, time.perf_counter() value after which the search stops early
+                          (serial only), stats then gets the "upper_bound" proven so far and
+                          whether it is "optimal".
+        seed (list): optional, the nodes of a clique found beforehand, only larger cliques are searched for.
+        eliminate (bool): optional, let pivot_search() remove useless nodes of every subproblem.
+    Returns:
+        clique (list): The nodes of the largest clique found in G.
+        steps (int): The number of steps taken by all subproblems together.
+    """
+    Q = list(nodes) if nodes is not None else []
+    cand = set(G)
+    for node in Q:
+        if node not in cand:
+            raise ValueError(f"The given `nodes` {nodes} do not form a clique")
+        cand &= {v for v in G[node] if v != node}
+    # Only the common neighbours of the given nodes can extend them
+    adj = {u: cand.intersection(G[u]) - {u} for u in cand}
+
+    order, core, later = degeneracy_order(adj)
+    # Largest core numbers first, they are the most likely to hold a large clique.
+    # A node has exactly its core number of later neighbours
+    starts = sorted(order, key=core.get, reverse=True)
+
+    # Clique sizes below are counted without the given nodes
+    best = list(seed[len(Q):]) if seed is not None and len(seed) > len(Q) else []
+    incumbent = multiprocessing.Value("i", len(best))
+    if workers is not None:
+        clique, steps, searched = _run_parallel(adj, core, later, starts, workers, incumbent)
+        upper_bound, optimal = None, True
+    else:
+        clique, steps, searched, upper_bound, optimal = _run_serial(adj, core, later, starts, incumbent, deadline,
+                                                                    eliminate)
+    if len(clique) > len(best):
+        best = clique
+
+    if stats is not None:
+        stats["degeneracy"] = max(core.values(), default=0)
+        stats["subproblems"] = stats.get("subproblems", 0) + searched
+        stats["skipped"] = stats.get("skipped", 0) + len(starts) - searched
+        if deadline is not None:
+            stats["upper_bound"] = len(Q) + (len(best) if optimal else max(upper_bound, len(best)))
+            stats["optimal"] = optimal
+    return Q + best, steps
+
+def _run_serial(adj, core, later, starts, incumbent, deadline=None, eliminate=False):
+    """
+    Solves the subproblems one after the other, stopping at the first node whose core number
+    can not beat the incumbent (all later ones are smaller) and skipping those peel() empties.
+    Returns:
+        best (list), steps (int), searched (int), upper_bound (int), optimal (bool)
+    """
+    best, steps, searched = [], 0, 0
+    for i, u in enumerate(starts):
+        if core[u] + 1 <= incumbent.value:
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            # No clique left is larger than the largest remaining subproblem
+            return best, steps, searched, core[u] + 1, False
+        nodes = peel(adj, later[u], incumbent.value)
+        if nodes is None:
+            continue
+
+        info = {}
+        clique, sub_steps = _solve(u, nodes, subproblem(adj, nodes), incumbent, info, deadline, eliminate)
+        steps += sub_steps
+        searched += 1
+        if len(clique) > len(best):
+            best = clique
+        if not info.get("optimal", True):
+            rest = max((core[w] + 1 for w in starts[i + 1:i + 2]), default=0)
+            return best, steps, searched, max(info["upper_bound"], rest), False
+    return best, steps, searched, len(best), True
+
+def _solve(u, nodes, rows, incumbent, stats=None, deadline=None, eliminate=False):
+    """
+    Searches the subproblem of node u.
+    Parameters:
+        u: The node of the subproblem.
+        nodes (list): Its later neighbours left by peel(), nodes[i] has label i in rows.
+        rows (list): Bitset adjacency rows of the subproblem.
+        incumbent (multiprocessing.Value): Size of the best clique found by any subproblem.
+    Returns:
+        clique (list): The nodes of the largest clique found containing u.
+        steps (int): The number of steps taken.
+    """
+    k = len(nodes)
+    # u gets label k and is adjacent to every other node of the subproblem
+    rows = rows + [(1 << k) - 1]
+    clique, steps = pivot_search(rows, (1 << k) - 1, [k], lambda P: color_classes(P, rows), stats=stats,
+                                 incumbent=incumbent, deadline=deadline, eliminate=eliminate)
+    share_incumbent(incumbent, len(clique))
+    return [u] + [nodes[i] for i in clique[1:]], steps
+
+def _run_parallel(adj, core, later, starts, workers, incumbent):
+    """
+    Solves the subproblems in a process pool. Every worker skips the subproblems that can not
+    beat the shared incumbent when it picks them up.
+    Returns:
+        best (list), steps (int), searched (int)
+    """
+    def tasks():
+        for u in starts:
+            if core[u] + 1 <= incumbent.value:
+                return
+            nodes = peel(adj, later[u], incumbent.value)
+            if nodes is not None:
+                yield u, nodes, subproblem(adj, nodes)
+
+    best, steps, searched = [], 0, 0
+    workers = workers or os.cpu_count()
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(incumbent,)) as pool:
+        for clique, sub_steps, ran in pool.imap_unordered(_solve_task, tasks(), chunksize=16):
+            steps += sub_steps
+            searched += ran
+            if len(clique) > len(best):
+                best = clique
+    return best, steps, searched
+
+def _init_worker(incumbent):
+    """
+    Stores the shared incumbent in a worker process.
+    """
+    global _incumbent
+    _incumbent = incumbent
+
+def _solve_task(task):
+    """
+    Runs _solve() in a pool worker.
+    Parameters:
+        task (tuple): (u, nodes, rows) of one subproblem.
+    Returns:
+        clique (list), steps (int), ran (int): 1 if the subproblem was searched, 0 if it was skipped.
+    """
+    u, nodes, rows = task
+    if 1 + len(nodes) <= _incumbent.value:
+        return [], 0, 0
+    clique, steps = _solve(u, nodes, rows, _incumbent)
+    return clique, steps, 1
@@ -0,0 +1,133 @@
+"""
+Vertex orbits for symmetry breaking in the exact searches.
+Colour refinement (the equitable partition reached by splitting cells on the colours of the
+neighbours) gives cells that hold every orbit, but a cell may hold more than one orbit. Two nodes
+of a cell are only put in the same orbit once an automorphism mapping one onto the other is found,
+by individualizing a node of the first non-singleton cell on both sides and refining again until
+the partition is discrete. The orbits returned can therefore be finer than the true ones, never coarser.
+"""
+import time
+from collections import Counter
+
+def refine(adj, colors):
+    """
+    Refines a colouring to the coarsest equitable partition below it.
+    The colours are renumbered by sorting their signatures, so the same graph coloured the same
+    way up to an automorphism gets the same colours on corresponding nodes.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        colors (dict): Maps every node to an int.
+    Returns:
+        colors (dict): Maps every node to an int in 0..cells-1.
+    """
+    cells = len(set(colors.values()))
+    while True:
+        signature = {v: (colors[v], tuple(sorted(Counter(colors[w] for w in adj[v]).items()))) for v in adj}
+        rank = {sig: i for i, sig in enumerate(sorted(set(signature.values())))}
+        colors = {v: rank[signature[v]] for v in adj}
+        if len(rank) == cells:
+            return colors
+        cells = len(rank)
+
+def individualize(adj, colors, v):
+    """
+    Returns:
+        colors (dict): colors refined after giving v a colour of its own.
+    """
+    colors = dict(colors)
+    colors[v] = len(adj) # Above every colour in use
+    return refine(adj, colors)
+
+def find_automorphism(adj, source, target, budget=1000, deadline=None, cache=None):
+    """
+    Searches an automorphism that maps every node coloured c in source to a node coloured c in target.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        source (dict), target (dict): Equitable colourings from refine().
+        budget (int): optional, most refinements tried before giving up.
+        deadline (float): optional, time.perf_counter() value after which the search gives up.
+        cache (dict): optional, keeps the refinements of source, pass the same dict to every search
+                      from the same source so they are only computed once.
+    Returns:
+        sigma (dict): Maps every node to its image, None if none was found within the budget.
+    """
+    budget = [budget]
+    cache = {} if cache is None else cache
+
+    def search(source, target, path):
+        if Counter(source.values()) != Counter(target.values()):
+            return None # The partitions differ, no automorphism maps one onto the other
+        cells = Counter(source.values())
+        if len(cells) == len(adj):
+            image = {c: v for v, c in target.items()}
+            sigma = {v: image[c] for v, c in source.items()}
+            if all(sigma[w] in adj[sigma[v]] for v in adj for w in adj[v]):
+                return sigma
+            return None
+        # Individualize a node of the smallest non-singleton cell, and try every node of that cell on the other side
+        cell = min((size, c) for c, size in cells.items() if size > 1)[1]
+        x = next(v for v, c in source.items() if c == cell)
+        path = path + (x,)
+        if path not in cache:
+            cache[path] = individualize(adj, source, x)
+        fixed = cache[path]
+        for y in [v for v, c in target.items() if c == cell]:
+            if budget[0] <= 0 or (deadline is not None and time.perf_counter() > deadline):
+                return None
+            budget[0] -= 1
+            sigma = search(fixed, individualize(adj, target, y), path)
+            if sigma is not None:
+                return sigma
+        return None
+
+    return search(source, target, ())
+
+def orbits(adj, fixed=(), among=None, budget=1000, deadline=None):
+    """
+    Partitions nodes into orbits of the automorphisms that fix every node of fixed.
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+        fixed (list): optional, nodes every automorphism must fix.
+        among (iterable): optional, only the orbits of these nodes are returned (all nodes by default).
+        budget (int): optional, most refinements tried per automorphism searched.
+        deadline (float): optional, time.perf_counter() value after which no more automorphisms are
+                          searched, the nodes not merged yet are left in orbits of their own.
+    Returns:
+        orbits (list): Lists of nodes, each within one orbit, in the order their first node appears in among.
+    """
+    colors = refine(adj, {v: 0 for v in adj})
+    for v in fixed:
+        colors = individualize(adj, colors, v)
+    among = list(adj) if among is None else list(among)
+
+    parent = {v: v for v in adj}
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    # Every automorphism found merges each node with its image, so later pairs are often already joined
+    reps = {} # Colour -> nodes of among starting an orbit of that cell
+    sources = {} # Rep -> its individualized colouring and the cache of its refinements
+    for u in among:
+        for r in reps.get(colors[u], []):
+            if find(r) == find(u):
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                continue
+            if r not in sources:
+                sources[r] = individualize(adj, colors, r), {}
+            source, cache = sources[r]
+            sigma = find_automorphism(adj, source, individualize(adj, colors, u), budget, deadline, cache)
+            if sigma is not None:
+                for v, w in sigma.items():
+                    parent[find(v)] = find(w)
+                break
+        else:
+            reps.setdefault(colors[u], []).append(u)
+
+    groups = {}
+    for u in among:
+        groups.setdefault(find(u), []).append(u)
+    return list(groups.values())
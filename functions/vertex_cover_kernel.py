@@ -0,0 +1,175 @@
+"""
+Kernelization of the maximum clique problem through the complement graph.
+A clique of G is an independent set of its complement, and the nodes outside a maximum independent
+set form a minimum vertex cover. On a very dense G the complement is sparse, and the vertex cover
+reductions below shrink it to a kernel:
+    degree 0 and 1: a node with at most one complement neighbour is in some maximum independent set.
+    degree 2 folding: a node v with non-adjacent complement neighbours u, w is merged with them into
+                      one node, which is in the independent set exactly when u and w are, v otherwise.
+    dominance: if the closed complement neighbourhood of v is inside that of its neighbour u,
+               some maximum independent set avoids u.
+    crown: an independent set I matched into its neighbourhood N(I) is taken whole, N(I) dropped.
+The kernel is solved as a clique problem again and the answer is mapped back.
+"""
+import networkx as nx
+
+class Fold:
+    """
+    The node a degree 2 folding merges v, u and w into.
+    """
+    __slots__ = ("v", "u", "w")
+
+    def __init__(self, v, u, w):
+        self.v, self.u, self.w = v, u, w
+
+    def __repr__(self):
+        return f"Fold({self.v!r}, {self.u!r}, {self.w!r})"
+
+def complement(adj):
+    """
+    Parameters:
+        adj (dict): Maps every node to the set of its neighbours.
+    Returns:
+        comp (dict): Maps every node to the set of nodes it is not adjacent to, itself excluded.
+    """
+    nodes = set(adj)
+    return {u: nodes - adj[u] - {u} for u in adj}
+
+def kernelize(comp, stats=None):
+    """
+    Reduces the maximum independent set problem of a graph (the complement of the clique problem).
+    Parameters:
+        comp (dict): Maps every node to the set of its neighbours in the graph, changed in place into the kernel.
+        stats (dict): optional, filled with the number of times each reduction was applied ("degree_0", "degree_1",
+                      "degree_2", "folds", "dominance" and "crown").
+    Returns:
+        taken (list): Nodes in the maximum independent set whatever the kernel's solution is, Fold nodes
+                      among them are unfolded by lift().
+        folds (list): The Fold nodes made, in order.
+    """
+    counts = dict.fromkeys(("degree_0", "degree_1", "degree_2", "folds", "dominance", "crown"), 0)
+    taken, folds = [], []
+
+    def remove(v):
+        for u in comp.pop(v):
+            comp[u].discard(v)
+
+    changed = True
+    while changed:
+        changed = False
+        # Low degree rules first, they are the cheapest and feed each other
+        queue = [v for v in comp if len(comp[v]) <= 2]
+        while queue:
+            v = queue.pop()
+            if v not in comp or len(comp[v]) > 2:
+                continue
+            near = list(comp[v])
+            touched = set().union(*(comp[u] for u in near)) if near else set()
+            if len(near) == 0:
+                counts["degree_0"] += 1
+                taken.append(v)
+                remove(v)
+            elif len(near) == 1:
+                counts["degree_1"] += 1
+                taken.append(v)
+                remove(v)
+                remove(near[0])
+            else:
+                u, w = near
+                if w in comp[u]:
+                    # v, u and w form a triangle, v is as good as either of the others
+                    counts["degree_2"] += 1
+                    taken.append(v)
+                    for x in (v, u, w):
+                        remove(x)
+                else:
+                    counts["folds"] += 1
+                    fold = Fold(v, u, w)
+                    neighbours = (comp[u] | comp[w]) - {v, u, w}
+                    for x in (v, u, w):
+                        remove(x)
+                    comp[fold] = neighbours
+                    for x in neighbours:
+                        comp[x].add(fold)
+                    folds.append(fold)
+                    touched.add(fold)
+            queue.extend(x for x in touched if x in comp and len(comp[x]) <= 2)
+            changed = True
+
+        # Dominance: N[v] inside N[u] for a neighbour u of v, then u can go to the cover
+        for v in list(comp):
+            if v not in comp:
+                continue
+            closed = comp[v] | {v}
+            for u in list(comp[v]):
+                if u in comp and len(comp[u]) >= len(comp[v]) and closed <= comp[u] | {u}:
+                    counts["dominance"] += 1
+                    remove(u)
+                    changed = True
+
+        if not changed:
+            crown = _crown(comp)
+            if crown:
+                I, H = crown
+                counts["crown"] += 1
+                taken.extend(I)
+                for x in I | H:
+                    remove(x)
+                changed = True
+
+    if stats is not None:
+        stats.update(counts)
+    return taken, folds
+
+def _crown(comp):
+    """
+    Searches a crown: an independent set I whose neighbourhood H can be matched into I.
+    Some maximum independent set then holds all of I and none of H.
+    Returns:
+        (I, H) (tuple of sets), or None if no crown was found.
+    """
+    # The nodes a maximal matching leaves unmatched are independent
+    matched = set()
+    for u in comp:
+        if u not in matched:
+            for w in comp[u]:
+                if w not in matched:
+                    matched.update((u, w))
+                    break
+    outside = [u for u in comp if u not in matched and comp[u]]
+    if not outside:
+        return None
+
+    # Tag the two sides of the bipartite graph
+    B = nx.Graph()
+    B.add_edges_from(((0, u), (1, w)) for u in outside for w in comp[u])
+    top = {(0, u) for u in outside}
+    matching = nx.bipartite.hopcroft_karp_matching(B, top_nodes=top)
+
+    I = {u for u in outside if (0, u) not in matching}
+    if not I:
+        return None
+    while True:
+        H = set().union(*(comp[u] for u in I))
+        grown = I | {matching[(1, h)][1] for h in H}
+        if grown == I:
+            return I, H
+        I = grown
+
+def lift(clique, taken, folds):
+    """
+    Maps a clique of the kernel back to the graph.
+    Parameters:
+        clique (iterable): Nodes of the kernel forming a clique of it (an independent set of its complement).
+        taken (list), folds (list): As returned by kernelize().
+    Returns:
+        clique (set): Nodes of the graph.
+    """
+    solution = set(clique) | set(taken)
+    for fold in reversed(folds):
+        if fold in solution:
+            solution.remove(fold)
+            solution.update((fold.u, fold.w))
+        else:
+            solution.add(fold.v)
+    return solution
@@ -0,0 +1,39 @@
+"""
+Initial vertex orderings for the exact searches.
+An ordering lists the nodes the search should branch on first at the front. Every ordering
+is computed once before the search in near-linear time.
+"""
+import networkx as nx
+
+from functions.sparse_clique import degeneracy_order
+
+ORDERINGS = ("degeneracy", "max_degree", "min_width", "color")
+
+def vertex_ordering(G, ordering):
+    """
+    Orders the nodes of G for branching.
+    Parameters:
+        G (networkx.Graph): The graph.
+        ordering (str): "degeneracy" puts the nodes of highest core number first (ties by degree),
+                        "max_degree" the nodes of highest degree first,
+                        "min_width" reverses the smallest-last removal order (Matula-Beck), so every
+                        node has as few neighbours as possible after it, and
+                        "color" greedily colours the nodes largest first and puts the highest colour
+                        classes first (ties by degree), like MCQ branches.
+    Returns:
+        order (list): The nodes of G, the first one is branched on first.
+    """
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Unknown ordering {ordering}")
+    degree = {u: len(G[u]) - (u in G[u]) for u in G}
+
+    if ordering == "max_degree":
+        return sorted(G, key=degree.__getitem__, reverse=True)
+    if ordering == "color":
+        coloring = nx.greedy_color(G, strategy="largest_first")
+        return sorted(G, key=lambda u: (coloring[u], degree[u]), reverse=True)
+
+    order, core, later = degeneracy_order({u: set(G[u]) - {u} for u in G})
+    if ordering == "degeneracy":
+        return sorted(G, key=lambda u: (core[u], degree[u]), reverse=True)
+    return order[::-1]
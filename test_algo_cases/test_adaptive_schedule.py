@@ -0,0 +1,134 @@
+import networkx as nx
+import unittest
+import sys
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.search_hooks import SearchCounters, SearchProfile
+
+# 9 Tests
+class TestAdaptiveSchedule(unittest.TestCase):
+    """
+    Testing the "adaptive" colouring schedule of custom_with_partial_greedy(G, str_mode).
+    ---A DEPTH ONLY COLOURS WHILE ITS PRUNES SAVE MORE TIME THAN THE COLOURING COSTS---
+    Asserts for each case run through:
+        Confirming the clique is a valid maximum clique whatever the schedule decides
+        Confirming every decision shows up in the hooks
+    """
+# Custom Assertions
+    def assertIsMaxClique(self, G, clq):
+        """
+        Assert that clq is a clique as large as the largest of find_cliques().
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (set): Set of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+        self.assertEqual(max((len(c) for c in nx.find_cliques(G)), default=0), len(clq))
+
+# 1. Correctness
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertEqual(set(), custom_with_partial_greedy(nx.Graph(), "largest_first"))
+
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs compared against find_cliques()"""
+        for seed in range(40):
+            G = nx.gnp_random_graph(35, 0.05 + 0.02 * seed, seed=seed)
+            for mode in ("largest_first", "independent_set"):
+                self.assertIsMaxClique(G, custom_with_partial_greedy(G, mode))
+
+    def test_invalid_schedule(self):
+        """Unknown schedules are rejected"""
+        with self.assertRaises(ValueError):
+            custom_with_partial_greedy(nx.complete_graph(3), "largest_first", schedule="sometimes")
+
+    def test_bitset_paths(self):
+        """The bitset paths colour every 3 iterations by default and reject the adaptive schedule"""
+        G = nx.gnp_random_graph(40, 0.6, seed=5)
+        for options in ({"str_mode": "largest_first", "backend": "bitset"}, {"str_mode": "mcq"},
+                        {"str_mode": "largest_first", "incremental": True},
+                        {"str_mode": "largest_first", "maxsat_depth": 2}):
+            self.assertIsMaxClique(G, custom_with_partial_greedy(G, **options))
+            self.assertEqual(custom_with_partial_greedy_steps(G, **options)[1],
+                             custom_with_partial_greedy_steps(G, schedule="partial", **options)[1])
+            with self.assertRaises(ValueError):
+                custom_with_partial_greedy(G, schedule="adaptive", **options)
+
+# 2. Decisions
+    def test_decisions_in_counters(self):
+        """Every child the size bound can not cut is either coloured or skipped"""
+        G = nx.gnp_random_graph(60, 0.6, seed=1)
+        adaptive, always = SearchCounters(), SearchCounters()
+        custom_with_partial_greedy(G, "largest_first", hooks=adaptive)
+        custom_with_greedy(G, "largest_first", hooks=always)
+        self.assertEqual(0, always.bound_skips)
+        self.assertGreater(adaptive.bound_calls, 0)
+        self.assertGreaterEqual(adaptive.bound_calls, adaptive.prunes["color"])
+        partial = SearchCounters()
+        custom_with_partial_greedy(G, "largest_first", hooks=partial, schedule="partial")
+        self.assertGreater(partial.bound_skips, 0)
+
+    def test_decisions_in_profile(self):
+        """The profile shows per depth how many colourings were skipped"""
+        profile = SearchProfile()
+        custom_with_partial_greedy(nx.gnp_random_graph(60, 0.6, seed=2), "largest_first", hooks=profile)
+        for depth, row in profile.depths.items():
+            self.assertGreaterEqual(row["color_calls"] + row["color_skips"], row["color_prunes"])
+
+    def test_depths_line_up_with_nodes(self):
+        """With given nodes the schedule keys colourings and expansions by the same depths as the profile"""
+        keys = {"wants": set(), "colored": set(), "expanded": set()}
+
+        class Recording(AdaptiveSchedule):
+            def wants(self, depth):
+                keys["wants"].add(depth)
+                return super().wants(depth)
+
+            def colored(self, depth, seconds, pruned):
+                keys["colored"].add(depth)
+                super().colored(depth, seconds, pruned)
+
+            def expanded(self, depth, seconds):
+                keys["expanded"].add(depth)
+                super().expanded(depth, seconds)
+
+        G = nx.gnp_random_graph(60, 0.6, seed=3)
+        v = max(G, key=G.degree)
+        profile = SearchProfile()
+        module = sys.modules[search_engine.__module__]
+        original, module.AdaptiveSchedule = module.AdaptiveSchedule, Recording
+        try:
+            custom_with_partial_greedy(G, "largest_first", nodes=[v], hooks=profile)
+        finally:
+            module.AdaptiveSchedule = original
+        decided = {depth for depth, row in profile.depths.items() if row["color_calls"] + row["color_skips"]}
+        colored = {depth for depth, row in profile.depths.items() if row["color_calls"]}
+        expanded = {depth for depth, row in profile.depths.items() if row["expanded"] and depth > 0}
+        self.assertEqual(decided, keys["wants"])
+        self.assertEqual(colored, keys["colored"])
+        self.assertEqual(expanded, keys["expanded"])
+        self.assertEqual(1, min(keys["expanded"]))
+
+# 3. Schedule
+    def test_useless_colouring_turns_off(self):
+        """A depth whose colourings never prune stops colouring but keeps probing"""
+        schedule = AdaptiveSchedule()
+        for _ in range(AdaptiveSchedule.WARMUP):
+            self.assertTrue(schedule.wants(2))
+            schedule.colored(2, 0.01, False)
+            schedule.expanded(2, 0.5)
+        decisions = [schedule.wants(2) for _ in range(4 * AdaptiveSchedule.PROBE)]
+        self.assertEqual(4, sum(decisions))
+        self.assertTrue(schedule.wants(3), "Other depths are not affected")
+
+    def test_useful_colouring_stays_on(self):
+        """A depth whose colourings prune half its children keeps colouring"""
+        schedule = AdaptiveSchedule()
+        for i in range(100):
+            self.assertTrue(schedule.wants(2))
+            schedule.colored(2, 0.01, i % 2 == 0)
+            schedule.expanded(2, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
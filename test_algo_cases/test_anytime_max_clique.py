@@ -0,0 +1,138 @@
+import networkx as nx
+import pickle
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+
+# 10 Tests
+class TestAnytimeMaxClique(unittest.TestCase):
+    """
+    Testing max_clique(), max_clique_with_steps() and the custom greedy variants with a time_budget.
+    ---THE SEARCH STOPS AT THE DEADLINE AND RETURNS ITS BEST CLIQUE WITH A PROVEN UPPER BOUND---
+    Asserts for each case run through:
+        Confirming the clique the algorithm finds is a valid clique
+        Confirming the upper bound is never below the size of a maximum clique
+        Confirming finished searches are flagged as optimal
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def run_all(self, G, time_budget):
+        """
+        Runs every solver with the given time_budget.
+        Parameters:
+            G (networkX.Graph): The graph
+            time_budget (float): Seconds given to every solver
+        Returns:
+            list: (name, CliqueResult) pairs
+        """
+        return [("max_clique", max_clique(G, time_budget=time_budget)),
+                ("max_clique bitset", max_clique(G, backend="bitset", time_budget=time_budget)),
+                ("max_clique_with_steps", max_clique_with_steps(G, time_budget=time_budget)[0]),
+                ("largest_first", custom_with_greedy(G, "largest_first", time_budget=time_budget)),
+                ("largest_first bitset", custom_with_greedy(G, "largest_first", backend="bitset",
+                                                            time_budget=time_budget)),
+                ("partial random_sequential", custom_with_partial_greedy(G, "random_sequential",
+                                                                         time_budget=time_budget)),
+                ("mcq", custom_with_greedy(G, "mcq", time_budget=time_budget)),
+                ("partial mcs", custom_with_partial_greedy(G, "mcs", time_budget=time_budget)),
+                ("mcr steps", custom_with_greedy_steps(G, "mcr", time_budget=time_budget)[0]),
+                ("partial largest_first steps", custom_with_partial_greedy_steps(G, "largest_first",
+                                                                                 time_budget=time_budget)[0])]
+
+# 1. Finished Searches
+    def test_no_budget_returns_plain_set(self):
+        """Without a time_budget the solvers still return a plain set"""
+        G = nx.complete_graph(4)
+        self.assertIs(type(max_clique(G)), set)
+        self.assertIs(type(custom_with_greedy(G, "mcq")), set)
+
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        for name, result in self.run_all(nx.Graph(), 5):
+            self.assertIsInstance(result, CliqueResult, name)
+            self.assertEqual(set(), result)
+            self.assertEqual(0, result.upper_bound)
+            self.assertTrue(result.optimal)
+
+    def test_generous_budget_is_optimal(self):
+        """20 random graphs, a search that finishes in time proves its clique is maximum"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(30, 0.2 + 0.03 * seed, seed=seed)
+            size = len(max(nx.find_cliques(G), key=len))
+            for name, result in self.run_all(G, 60):
+                self.assertIsClique(G, result)
+                self.assertEqual(size, len(result), name)
+                self.assertEqual(size, result.upper_bound, name)
+                self.assertTrue(result.optimal, name)
+                self.assertEqual(0, result.gap)
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        result = max_clique(G, nodes=[5], time_budget=5)
+        self.assertEqual({5, 6, 7}, result)
+        self.assertTrue(result.optimal)
+
+# 2. Searches Stopped at the Deadline
+    def test_zero_budget_bounds_the_maximum(self):
+        """A search out of time still returns a valid clique and an upper bound on the maximum clique"""
+        G = nx.gnp_random_graph(120, 0.6, seed=1)
+        size = len(max_clique(G, backend="bitset"))
+        for name, result in self.run_all(G, 0):
+            self.assertIsClique(G, result)
+            self.assertFalse(result.optimal, name)
+            self.assertLessEqual(len(result), size, name)
+            self.assertGreaterEqual(result.upper_bound, size, name)
+            self.assertLessEqual(result.upper_bound, len(G))
+
+    def test_short_budget_keeps_best_so_far(self):
+        """A search stopped mid-way keeps the cliques it has already found"""
+        G = nx.gnp_random_graph(150, 0.7, seed=2)
+        result = custom_with_greedy(G, "mcq", time_budget=0.2)
+        self.assertIsClique(G, result)
+        self.assertGreater(len(result), 1)
+        self.assertGreaterEqual(result.upper_bound, len(result))
+
+    def test_steps_are_returned(self):
+        """The steps variants return the CliqueResult together with the steps taken"""
+        G = nx.gnp_random_graph(40, 0.5, seed=4)
+        result, steps = max_clique_with_steps(G, time_budget=30)
+        self.assertIsInstance(result, CliqueResult)
+        self.assertGreater(steps, 0)
+        stats = {}
+        result, steps = custom_with_greedy_steps(G, "largest_first", backend="bitset", stats=stats, time_budget=30)
+        self.assertTrue(stats["optimal"])
+        self.assertEqual(len(result), stats["upper_bound"])
+
+# 3. Result Object
+    def test_result_behaves_like_a_set(self):
+        """CliqueResult compares equal to the plain set of its nodes"""
+        result = CliqueResult([1, 2, 3], upper_bound=5, optimal=False)
+        self.assertEqual({1, 2, 3}, result)
+        self.assertEqual(2, result.gap)
+        self.assertEqual(3, CliqueResult([1, 2, 3]).upper_bound)
+
+    def test_result_survives_pickling(self):
+        """The benchmarks send results between processes, the bound must survive the trip"""
+        result = pickle.loads(pickle.dumps(CliqueResult(["A", "B"], upper_bound=4, optimal=False)))
+        self.assertEqual({"A", "B"}, result)
+        self.assertEqual(4, result.upper_bound)
+        self.assertFalse(result.optimal)
+
+    def test_budget_with_workers_is_rejected(self):
+        """The parallel search does not support a time_budget"""
+        with self.assertRaises(ValueError):
+            max_clique(nx.complete_graph(3), workers=2, time_budget=1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.read_DIMACS import read_dimacs_clq
+
+# 12 Tests
+class TestBitsetBackend(unittest.TestCase):
+    """
+    Testing max_clique(), max_clique_with_steps(), custom_with_greedy() and custom_with_partial_greedy()
+    with backend="bitset" on various edge cases.
+    ---THE SAME BRON KERBOSCH PRUNING SEARCH RUN ON INTEGER BITSETS INSTEAD OF PYTHON SETS---
+    Asserts for each case run through:
+        Confirming the clique the algorithm finds is a valid clique
+        Confirming all nodes exist within the graph
+        A final check for correct max clique length (compared to the set backend)
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertAllBackends(self, G, size):
+        """
+        Assert that every variant finds a valid clique of the given size with the bitset backend.
+        Parameters:
+            G (networkX.Graph): The graph
+            size (int): The size of the maximum clique
+        """
+        results = [max_clique(G, backend="bitset"),
+                   max_clique_with_steps(G, backend="bitset")[0],
+                   custom_with_greedy(G, "largest_first", backend="bitset"),
+                   custom_with_greedy(G, "random_sequential", backend="bitset"),
+                   custom_with_partial_greedy(G, "largest_first", backend="bitset"),
+                   custom_with_partial_greedy(G, "random_sequential", backend="bitset")]
+        for max_clq in results:
+            self.assertIsClique(G, max_clq)
+            self.assertTrue(set(max_clq).issubset(G.nodes))
+            self.assertEqual(size, len(max_clq))
+
+# 1. Basic Structures
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        G = nx.Graph()
+        self.assertAllBackends(G, 0)
+        self.assertEqual((set(), 0), max_clique_with_steps(G, backend="bitset"))
+
+    def test_single_node(self):
+        """networkX Graph with 1 node and 0 edges"""
+        G = nx.Graph()
+        G.add_node(0)
+        self.assertAllBackends(G, 1)
+
+    def test_graph_with_no_edges(self):
+        """networkX Graph with 5 nodes and 0 edges"""
+        G = nx.Graph()
+        G.add_nodes_from(range(5))
+        self.assertAllBackends(G, 1)
+
+    def test_k5_graph(self):
+        """networkX 5-node complete Graph"""
+        self.assertAllBackends(nx.complete_graph(5), 5)
+
+    def test_c10_graph(self):
+        """networkX 10-node cycle Graph"""
+        self.assertAllBackends(nx.cycle_graph(10), 2)
+
+    def test_k4_bridged_with_triangle(self):
+        """networkX Graph with a 4-node clique connected to a triangle"""
+        G = nx.complete_graph(4)
+        G.add_edges_from([(3, 4), (4, 5), (5, 6), (6, 4)])
+        self.assertAllBackends(G, 4)
+
+# 2. Input Handling
+    def test_string_node_labels(self):
+        """networkX Graph with strings as node labels"""
+        G = nx.Graph()
+        G.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')])
+        self.assertAllBackends(G, 3)
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        max_clq = max_clique(G, nodes=[5], backend="bitset")
+        self.assertIsClique(G, max_clq)
+        self.assertEqual({5, 6, 7}, max_clq)
+
+    def test_initial_nodes_not_a_clique(self):
+        """The `nodes` argument must form a clique"""
+        G = nx.path_graph(4)
+        with self.assertRaises(ValueError):
+            max_clique(G, nodes=[0, 2], backend="bitset")
+
+    def test_unknown_backend(self):
+        """Unknown backends are rejected"""
+        with self.assertRaises(ValueError):
+            max_clique(nx.complete_graph(3), backend="array")
+
+# 3. Against the Set Backend
+    def test_random_graphs_against_set_backend(self):
+        """50 random graphs, the bitset backend must find cliques as large as the set backend"""
+        for seed in range(50):
+            G = nx.gnp_random_graph(30, 0.1 + 0.015 * seed, seed=seed)
+            self.assertAllBackends(G, len(max_clique(G)))
+
+    def test_DIMACS_subgraph_against_set_backend(self):
+        """60-vertex subgraph of brock200_2"""
+        try:
+            G = read_dimacs_clq("DIMACS_files/brock200_2.txt")
+        except IndexError as e:
+            self.skipTest(f"Skipping test due to IndexError: {e}")
+        H = G.subgraph(range(1, 61))
+        self.assertAllBackends(H, len(max(nx.find_cliques(H), key=len)))
+
+if __name__ == '__main__':
+    unittest.main()
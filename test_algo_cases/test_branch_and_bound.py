@@ -1,10 +1,11 @@
 import networkx as nx
 import unittest
 import random
+import sys
 from functions.check_functions import *
 from functions.clique_algorithms import *
 
-# 25 Tests and 122 Asserts
+# 27 Tests and 214 Asserts
 class TestBranchAndBound(unittest.TestCase):
     """
     Testing branch_and_bound(nx.Graph) algorithm on various edge cases.
@@ -371,6 +372,28 @@ class TestBranchAndBound(unittest.TestCase):
         # Final Size Correctness Test
         self.assertEqual(5, len(max_clq))
 
+    def test_deeper_than_recursion_limit(self):
+        """A K150 with the recursion limit at 100, the search is iterative"""
+        G = nx.complete_graph(150)
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(100)
+        try:
+            max_clq = branch_and_bound.__wrapped__(G)
+        finally:
+            sys.setrecursionlimit(limit)
+
+        self.assertIsClique(G, max_clq)
+        self.assertEqual(150, len(max_clq))
+
+    def test_random_graphs_against_built_in(self):
+        """30 random graphs with 60 nodes compared against find_cliques()"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(60, 0.1 + 0.025 * seed, seed=seed)
+            max_clq = branch_and_bound(G)
+            self.assertIsClique(G, max_clq)
+            self.assertAllValidNodes(G, max_clq)
+            self.assertEqual(max(len(c) for c in nx.find_cliques(G)), len(max_clq))
+
 # 5. Varying Input Types
     def test_string_node_labels(self):
         """networkX Graph with strings as node labels"""
@@ -0,0 +1,139 @@
+import networkx as nx
+import unittest
+import os
+import tempfile
+from functions.check_functions import *
+from functions.clique_algorithms import *
+from functions.clique_cache import CliqueCache, canonical_form, set_default_cache, built_in_max_clique
+
+# 9 Tests
+class TestCliqueCache(unittest.TestCase):
+    """
+    Testing CliqueCache and the cache option of the solvers on various edge cases.
+    ---RESULTS ARE KEYED BY THE RELABELED EDGE SET, THE SOLVER AND ITS PARAMETERS---
+    Asserts for each case run through:
+        Confirming a graph with the same sorted relabeling gets the same key
+        Confirming a hit returns the stored clique and steps without solving
+        Confirming the least recently used entries are evicted first
+    """
+    def setUp(self):
+        self.cache = CliqueCache(":memory:")
+
+    def tearDown(self):
+        set_default_cache(None)
+        self.cache.close()
+
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+# 1. Canonical Form
+    def test_same_relabeling_same_digest(self):
+        """Shifting every label keeps the sorted relabeling, adding an edge changes it"""
+        G = nx.gnp_random_graph(30, 0.3, seed=1)
+        H = nx.relabel_nodes(G, {u: u + 100 for u in G})
+        self.assertEqual(canonical_form(G)[0], canonical_form(H)[0])
+        H.add_edge(100, 129)
+        H.add_edge(100, 128)
+        self.assertNotEqual(canonical_form(G)[0], canonical_form(H)[0])
+
+    def test_sparse_and_dense_graphs(self):
+        """Sparse graphs are hashed from sparse6, dense ones from graph6, self-loops are ignored"""
+        G = nx.path_graph(200)
+        H = nx.complete_graph(20)
+        self.assertNotEqual(canonical_form(G)[0], canonical_form(H)[0])
+        looped = H.copy()
+        looped.add_edge(0, 0)
+        self.assertEqual(canonical_form(H)[0], canonical_form(looped)[0])
+
+# 2. Hits and Misses
+    def test_hit_returns_the_stored_result(self):
+        """The second call is a hit and returns the same clique and steps"""
+        G = nx.gnp_random_graph(40, 0.4, seed=2)
+        first = max_clique_with_steps(G, cache=self.cache)
+        second = max_clique_with_steps(G, cache=self.cache)
+        self.assertEqual((1, 1), (self.cache.misses, self.cache.hits))
+        self.assertEqual(first, second)
+        self.assertIsClique(G, second[0])
+
+    def test_relabeled_graph_hits(self):
+        """A subgraph with shifted labels hits and the clique is mapped back to its labels"""
+        G = nx.gnp_random_graph(40, 0.4, seed=3)
+        max_clique(G, cache=self.cache)
+        H = nx.relabel_nodes(G, {u: f"v{u:02d}" for u in G})
+        max_clq = max_clique(H, cache=self.cache)
+        self.assertEqual(1, self.cache.hits)
+        self.assertIsClique(H, max_clq)
+        self.assertEqual(len(max(nx.find_cliques(G), key=len)), len(max_clq))
+
+    def test_parameters_are_part_of_the_key(self):
+        """Different solvers, parameters and initial nodes are different entries"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        self.assertEqual({5, 6, 7}, max_clique(G, nodes=[5], cache=self.cache))
+        self.assertEqual(5, len(max_clique(G, cache=self.cache)))
+        self.assertEqual(5, len(max_clique(G, backend="bitset", cache=self.cache)))
+        self.assertEqual(5, len(custom_with_greedy(G, "mcs", cache=self.cache)))
+        self.assertEqual(5, len(built_in_max_clique(G, cache=self.cache)))
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual({5, 6, 7}, max_clique(G, nodes=[5], cache=self.cache))
+        self.assertEqual(1, self.cache.hits)
+
+    def test_run_dependent_calls_are_not_cached(self):
+        """Calls with stats or a time_budget always solve"""
+        G = nx.gnp_random_graph(30, 0.5, seed=4)
+        stats = {}
+        custom_with_greedy_steps(G, "mcs", stats=stats, cache=self.cache)
+        max_clique(G, time_budget=10, cache=self.cache)
+        self.assertEqual(0, len(self.cache))
+        self.assertGreater(stats["colorings"], 0)
+
+    def test_default_cache(self):
+        """set_default_cache() makes every solver consult the cache without passing it"""
+        G = nx.gnp_random_graph(25, 0.5, seed=5)
+        set_default_cache(self.cache)
+        for solver in (branch_and_bound, Bron_Kerbosch, max_clique):
+            self.assertEqual(solver(G), solver(G))
+        self.assertEqual(3, self.cache.hits)
+        set_default_cache(None)
+        max_clique(G)
+        self.assertEqual(3, self.cache.hits)
+
+# 3. Persistence and Eviction
+    def test_persists_across_connections(self):
+        """A result stored in a file is found by a new cache on the same file"""
+        G = nx.gnp_random_graph(30, 0.5, seed=6)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = CliqueCache(path)
+            max_clq, steps = max_clique_with_steps(G, cache=cache)
+            cache.close()
+            cache = CliqueCache(path)
+            self.assertEqual((max_clq, steps), max_clique_with_steps(G, cache=cache))
+            self.assertEqual(1, cache.hits)
+            cache.close()
+
+    def test_least_recently_used_is_evicted(self):
+        """Over max_bytes the entry used longest ago goes first"""
+        graphs = [nx.gnp_random_graph(20, 0.5, seed=seed) for seed in range(3)]
+        max_clique(graphs[0], cache=self.cache)
+        self.cache.max_bytes = 2 * self.cache.total_bytes() + 10
+        max_clique(graphs[1], cache=self.cache)
+        max_clique(graphs[0], cache=self.cache) # graphs[1] is now the least recently used
+        max_clique(graphs[2], cache=self.cache)
+        self.assertEqual(2, len(self.cache))
+        self.assertLessEqual(self.cache.total_bytes(), self.cache.max_bytes)
+        hits = self.cache.hits
+        max_clique(graphs[0], cache=self.cache)
+        self.assertEqual(hits + 1, self.cache.hits)
+        max_clique(graphs[1], cache=self.cache)
+        self.assertEqual(hits + 1, self.cache.hits)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.search_hooks import SearchHooks, SearchCounters
+
+# 8 Tests
+class TestCliqueEngine(unittest.TestCase):
+    """
+    Testing search_engine(G) and the hooks it calls for the set backend of every solver.
+    ---ONE SEARCH LOOP, THE SOLVERS ONLY PICK ITS BOUND AND SCHEDULE---
+    Asserts for each case run through:
+        Confirming the wrappers return the cliques and steps of the engine
+        Confirming the hooks see every step, bound, prune and larger clique
+    """
+# Custom Assertions
+    def assertSameSearch(self, G, wrapper, *args, **kwargs):
+        """
+        Assert that a solver returns the clique and steps of the engine it wraps.
+        Parameters:
+            G (networkX.Graph): The graph
+            wrapper (function): A solver returning (clique, steps)
+            args, kwargs: Passed on to search_engine()
+        """
+        clique, steps, upper_bound, optimal = search_engine(G, *args, **kwargs)
+        self.assertEqual((set(clique), steps), wrapper(G))
+        self.assertTrue(optimal)
+        self.assertIsNone(upper_bound)
+
+# 1. Wrappers
+    def test_empty_graph(self):
+        """Nothing to search in an empty graph"""
+        self.assertEqual(([], 0, None, True), search_engine(nx.Graph()))
+
+    def test_wrappers_match_engine(self):
+        """20 random graphs, every set solver is the engine with its own bound and schedule"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(30, 0.1 + 0.04 * seed, seed=seed)
+            self.assertSameSearch(G, max_clique_with_steps)
+            for mode in ("largest_first", "independent_set"):
+                self.assertSameSearch(G, lambda H: custom_with_greedy_steps(H, mode), str_mode=mode)
+                self.assertSameSearch(G, lambda H: custom_with_partial_greedy_steps(H, mode, schedule="partial"),
+                                      str_mode=mode, schedule="partial")
+
+    def test_max_clique(self):
+        """The engine finds a maximum clique with every bound"""
+        for seed in range(10):
+            G = nx.gnp_random_graph(35, 0.5, seed=seed)
+            size = max(len(c) for c in nx.find_cliques(G))
+            for mode in (None, "largest_first"):
+                clique = search_engine(G, str_mode=mode)[0]
+                self.assertTrue(is_clique(G, clique))
+                self.assertEqual(size, len(clique))
+
+    def test_invalid_arguments(self):
+        """Unknown schedules and hooks on other backends are rejected"""
+        G = nx.complete_graph(4)
+        with self.assertRaises(ValueError):
+            search_engine(G, schedule="sometimes")
+        with self.assertRaises(ValueError):
+            max_clique(G, backend="bitset", hooks=SearchHooks())
+        with self.assertRaises(ValueError):
+            custom_with_greedy(G, "mcq", hooks=SearchHooks())
+
+# 2. Hooks
+    def test_hooks_do_not_change_search(self):
+        """The same clique and steps with and without hooks"""
+        G = nx.gnp_random_graph(40, 0.6, seed=3)
+        plain = custom_with_greedy_steps(G, "largest_first")
+        self.assertEqual(plain, custom_with_greedy_steps(G, "largest_first", hooks=SearchCounters()))
+
+    def test_counters(self):
+        """The counters add up to the steps of the search"""
+        G = nx.gnp_random_graph(40, 0.6, seed=5)
+        counters = SearchCounters()
+        clique, steps = custom_with_partial_greedy_steps(G, "largest_first", hooks=counters)
+        info = counters.as_dict()
+        self.assertEqual(steps, info["steps"])
+        self.assertGreater(info["bound_calls"], 0)
+        self.assertGreater(info["prunes"]["color"], 0)
+        self.assertGreaterEqual(len(clique), info["incumbent_updates"])
+        self.assertGreater(info["incumbent_updates"], 0)
+        self.assertEqual(0, min(info["time_per_depth"]))
+
+    def test_size_bound_only(self):
+        """Without a colouring strategy nothing is coloured"""
+        G = nx.gnp_random_graph(40, 0.6, seed=5)
+        counters = SearchCounters()
+        max_clique(G, hooks=counters)
+        self.assertEqual(0, counters.bound_calls)
+        self.assertNotIn("color", counters.prunes)
+
+    def test_depths_balance(self):
+        """Every level entered is left again"""
+        class Depths(SearchHooks):
+            def __init__(self):
+                self.depth = 0
+                self.deepest = 0
+            def enter(self, depth):
+                self.depth += 1
+                self.deepest = max(self.deepest, depth)
+            def leave(self, depth):
+                self.depth -= 1
+        G = nx.gnp_random_graph(30, 0.5, seed=2)
+        hooks = Depths()
+        clique = max_clique(G, hooks=hooks)
+        self.assertEqual(0, hooks.depth)
+        self.assertGreaterEqual(hooks.deepest, len(clique) - 1)
+
+if __name__ == '__main__':
+    unittest.main()
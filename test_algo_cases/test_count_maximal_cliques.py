@@ -0,0 +1,91 @@
+import networkx as nx
+import unittest
+import tracemalloc
+from collections import Counter
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+
+# 8 Tests
+class TestCountMaximalCliques(unittest.TestCase):
+    """
+    Testing count_maximal_cliques(G) and the min_size/max_size filters on various edge cases.
+    ---MAXIMAL CLIQUES ARE COUNTED BY SIZE WITHOUT BEING STORED---
+    Asserts for each case run through:
+        Confirming the total and histogram match find_cliques()
+        Confirming the filters only drop cliques outside the size range
+    """
+# Custom Assertions
+    def assertSameCounts(self, G, min_size=0, max_size=None):
+        """
+        Assert that both backends count the same cliques as find_cliques().
+        Parameters:
+            G (networkX.Graph): The graph
+            min_size (int): Smallest size counted
+            max_size (int): Largest size counted
+        """
+        sizes = Counter(len(c) for c in nx.find_cliques(G))
+        expected = {k: v for k, v in sorted(sizes.items())
+                    if k >= min_size and (max_size is None or k <= max_size)}
+        for backend in ("set", "sparse"):
+            total, histogram = count_maximal_cliques(G, min_size, max_size, backend=backend)
+            self.assertEqual(expected, histogram, f"{backend} backend")
+            self.assertEqual(sum(expected.values()), total, f"{backend} backend")
+
+# 1. Counting
+    def test_empty_graph(self):
+        """No cliques in an empty graph"""
+        self.assertEqual((0, {}), count_maximal_cliques(nx.Graph()))
+
+    def test_complete_graph(self):
+        """A complete graph is one maximal clique"""
+        self.assertEqual((1, {6: 1}), count_maximal_cliques(nx.complete_graph(6)))
+
+    def test_moon_moser_graph(self):
+        """The complete 4-partite graph with parts of size 3 has 3^4 maximal cliques of size 4"""
+        self.assertEqual((81, {4: 81}), count_maximal_cliques(nx.complete_multipartite_graph(3, 3, 3, 3)))
+
+    def test_random_graphs_against_built_in(self):
+        """30 random graphs compared against find_cliques()"""
+        for seed in range(30):
+            self.assertSameCounts(nx.gnp_random_graph(30, 0.05 + 0.025 * seed, seed=seed))
+
+# 2. Filters
+    def test_min_size(self):
+        """20 random graphs, only cliques of at least min_size are counted"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(35, 0.2 + 0.03 * seed, seed=seed)
+            for min_size in (2, 4, 6):
+                self.assertSameCounts(G, min_size=min_size)
+
+    def test_max_size(self):
+        """20 random graphs, only cliques of at most max_size are counted"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(35, 0.2 + 0.03 * seed, seed=seed)
+            for max_size in (1, 3, 5):
+                self.assertSameCounts(G, max_size=max_size)
+                self.assertSameCounts(G, min_size=max_size, max_size=max_size + 1)
+
+    def test_min_size_prunes(self):
+        """A min_size above the largest clique counts nothing"""
+        G = nx.gnp_random_graph(40, 0.5, seed=3)
+        size = len(max(nx.find_cliques(G), key=len))
+        self.assertEqual((0, {}), count_maximal_cliques(G, min_size=size + 1))
+
+# 3. Memory
+    def test_memory_does_not_grow_with_cliques(self):
+        """Peak memory counting 3^7 maximal cliques stays below that of storing them"""
+        G = nx.complete_multipartite_graph(*[3] * 7)
+        tracemalloc.start()
+        total, histogram = count_maximal_cliques(G)
+        counting = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        tracemalloc.start()
+        cliques = list(nx.find_cliques(G))
+        storing = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.assertEqual(len(cliques), total)
+        self.assertLess(counting, storing)
+
+if __name__ == '__main__':
+    unittest.main()
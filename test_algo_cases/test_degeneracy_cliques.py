@@ -0,0 +1,85 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.maximal_cliques import degeneracy_cliques, subproblem
+from functions.sparse_clique import degeneracy_order
+
+# 8 Tests
+class TestDegeneracyCliques(unittest.TestCase):
+    """
+    Testing iter_maximal_cliques(G, backend="sparse") on various edge cases.
+    ---ONE PIVOTED SEARCH PER NODE OVER ITS LATER NEIGHBOURS IN A DEGENERACY ORDERING---
+    Asserts for each case run through:
+        Confirming every maximal clique is yielded exactly once, serial and in parallel
+        Confirming max_only ends on a maximum clique
+    """
+# Custom Assertions
+    def assertSameCliques(self, G, workers=None):
+        """
+        Assert that the sparse backend yields the same cliques as find_cliques().
+        Parameters:
+            G (networkX.Graph): The graph
+            workers (int): Number of processes
+        """
+        found = [frozenset(c) for c in iter_maximal_cliques(G, backend="sparse", workers=workers)]
+        self.assertEqual(len(found), len(set(found)), "A clique was yielded twice")
+        self.assertEqual({frozenset(c) for c in nx.find_cliques(G)}, set(found))
+
+# 1. Enumeration
+    def test_empty_graph(self):
+        """No cliques are yielded for an empty graph"""
+        self.assertEqual([], list(iter_maximal_cliques(nx.Graph(), backend="sparse")))
+
+    def test_isolated_nodes_and_self_loops(self):
+        """Isolated nodes are cliques of their own, self-loops are ignored"""
+        G = nx.empty_graph(3)
+        G.add_edges_from([(3, 4), (4, 4)])
+        self.assertSameCliques(G)
+
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs compared against find_cliques()"""
+        for seed in range(40):
+            self.assertSameCliques(nx.gnp_random_graph(30, 0.05 + 0.02 * seed, seed=seed))
+
+    def test_sparse_graph_against_built_in(self):
+        """A 2000-node power law graph compared against find_cliques()"""
+        self.assertSameCliques(nx.powerlaw_cluster_graph(2000, 4, 0.5, seed=1))
+
+    def test_parallel(self):
+        """Cliques of 2 workers merged into one stream, compared against find_cliques()"""
+        for seed in range(3):
+            self.assertSameCliques(nx.barabasi_albert_graph(500, 4, seed=seed), workers=2)
+
+    def test_subproblem(self):
+        """The adjacency sent to a worker only holds the neighbours of the node"""
+        G = nx.gnp_random_graph(40, 0.3, seed=5)
+        adj = {u: set(G[u]) for u in G}
+        order, core, later = degeneracy_order(adj)
+        for v in order:
+            sub_adj = subproblem(adj, v, later[v])
+            self.assertEqual(adj[v], set(sub_adj))
+            for w in sub_adj:
+                self.assertLessEqual(sub_adj[w], adj[v])
+
+# 2. Max Only
+    def test_max_only(self):
+        """20 random graphs, serial and parallel max_only end on a maximum clique"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(60, 0.05 + 0.03 * seed, seed=seed)
+            size = len(max(nx.find_cliques(G), key=len))
+            for workers in (None, 2):
+                sizes = [len(c) for c in degeneracy_cliques(G, workers, max_only=True)]
+                self.assertEqual(sorted(set(sizes)), sizes)
+                self.assertEqual(size, sizes[-1])
+
+    def test_unknown_backend(self):
+        """Only the set and sparse backends enumerate cliques"""
+        with self.assertRaises(ValueError):
+            list(iter_maximal_cliques(nx.complete_graph(3), backend="bitset"))
+        with self.assertRaises(ValueError):
+            list(iter_maximal_cliques(nx.complete_graph(3), workers=2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.clique_heuristics import core_numbers, local_search, heuristic_clique
+
+# 10 Tests
+class TestHeuristicSeed(unittest.TestCase):
+    """
+    Testing heuristic_clique() and max_clique(G, heuristic=True) on various edge cases.
+    ---A GREEDY CLIQUE FOUND BEFORE THE SEARCH SEEDS THE INCUMBENT OF THE EXACT SEARCH---
+    Asserts for each case run through:
+        Confirming the clique the heuristic finds is a valid, maximal clique
+        Confirming the seeded search still finds a maximum clique
+        Confirming the seeded search never takes more steps
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertIsMaximal(self, G, clq):
+        """
+        Assert that no node outside clq is adjacent to every node of clq.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        for u in set(G) - set(clq):
+            self.assertFalse(set(clq) <= set(G[u]), f"{clq} can be extended with {u}")
+
+# 1. Heuristic
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertEqual([], heuristic_clique(nx.Graph()))
+        self.assertEqual(set(), max_clique(nx.Graph(), heuristic=True))
+
+    def test_core_numbers_match_networkx(self):
+        """core_numbers() agrees with nx.core_number() on 20 random graphs"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(50, 0.05 + 0.02 * seed, seed=seed)
+            adj = {u: set(G[u]) for u in G}
+            self.assertEqual(nx.core_number(G), core_numbers(adj))
+
+    def test_heuristic_finds_maximal_cliques(self):
+        """30 random graphs, the heuristic clique is a maximal clique"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(40, 0.1 + 0.025 * seed, seed=seed)
+            clq = heuristic_clique(G)
+            self.assertIsClique(G, clq)
+            self.assertIsMaximal(G, clq)
+
+    def test_local_search_swaps(self):
+        """A (1,2)-swap replaces node 1 of the clique {0, 1} with the adjacent nodes 2 and 3"""
+        G = nx.Graph([(0, 1), (0, 2), (0, 3), (2, 3), (1, 4)])
+        adj = {u: set(G[u]) for u in G}
+        self.assertEqual({0, 2, 3}, set(local_search(adj, [0, 1])))
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the heuristic clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        self.assertEqual({5, 6, 7}, set(heuristic_clique(G, nodes=[5])))
+        with self.assertRaises(ValueError):
+            max_clique(nx.path_graph(4), nodes=[0, 2], heuristic=True)
+
+# 2. Seeded Exact Search
+    def test_seeded_search_against_built_in(self):
+        """30 random graphs, seeding must not change the size of the maximum clique"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(35, 0.2 + 0.02 * seed, seed=seed)
+            size = len(max(nx.find_cliques(G), key=len))
+            for backend in ("set", "bitset"):
+                max_clq = max_clique(G, backend=backend, heuristic=True)
+                self.assertIsClique(G, max_clq)
+                self.assertEqual(size, len(max_clq))
+
+    def test_seeded_search_never_takes_more_steps(self):
+        """The seeded search explores a subset of the nodes explored without the seed"""
+        total, seeded_total = 0, 0
+        for seed in range(10):
+            G = nx.gnp_random_graph(60, 0.6, seed=seed)
+            for backend in ("set", "bitset"):
+                max_clq, steps = max_clique_with_steps(G, backend=backend)
+                seeded_clq, seeded_steps = max_clique_with_steps(G, backend=backend, heuristic=True)
+                self.assertEqual(len(max_clq), len(seeded_clq))
+                self.assertLessEqual(seeded_steps, steps)
+                total += steps
+                seeded_total += seeded_steps
+        self.assertLess(seeded_total, total)
+
+    def test_seed_is_returned_when_optimal(self):
+        """A heuristic clique that is already maximum is returned by the search"""
+        G = nx.complete_graph(6)
+        G.add_edges_from([(5, 6), (6, 7), (7, 5)])
+        self.assertEqual(set(range(6)), max_clique(G, heuristic=True))
+        self.assertEqual(set(range(6)), max_clique(G, backend="bitset", heuristic=True))
+
+    def test_seeded_parallel_search(self):
+        """The seed becomes the starting incumbent of the parallel workers"""
+        G = nx.gnp_random_graph(40, 0.5, seed=8)
+        size = len(max(nx.find_cliques(G), key=len))
+        max_clq = max_clique(G, workers=2, heuristic=True)
+        self.assertIsClique(G, max_clq)
+        self.assertEqual(size, len(max_clq))
+
+    def test_seeded_search_with_time_budget(self):
+        """The heuristic takes its share of the time_budget and the result keeps its bound"""
+        G = nx.gnp_random_graph(40, 0.5, seed=6)
+        result = max_clique(G, time_budget=30, heuristic=True, heuristic_share=0.5)
+        self.assertTrue(result.optimal)
+        self.assertEqual(len(max(nx.find_cliques(G), key=len)), result.upper_bound)
+
+if __name__ == '__main__':
+    unittest.main()
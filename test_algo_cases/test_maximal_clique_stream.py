@@ -0,0 +1,81 @@
+import networkx as nx
+import unittest
+import types
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+
+# 8 Tests
+class TestMaximalCliqueStream(unittest.TestCase):
+    """
+    Testing iter_maximal_cliques(G) and its max_only mode on various edge cases.
+    ---MAXIMAL CLIQUES ARE YIELDED ONE AT A TIME BY A PIVOTED BRON KERBOSCH SEARCH---
+    Asserts for each case run through:
+        Confirming every maximal clique is yielded exactly once
+        Confirming max_only yields growing cliques and ends on a maximum clique
+    """
+# Custom Assertions
+    def assertSameCliques(self, G):
+        """
+        Assert that iter_maximal_cliques() yields the same cliques as find_cliques().
+        Parameters:
+            G (networkX.Graph): The graph
+        """
+        found = [frozenset(c) for c in iter_maximal_cliques(G)]
+        self.assertEqual(len(found), len(set(found)), "A clique was yielded twice")
+        self.assertEqual({frozenset(c) for c in nx.find_cliques(G)}, set(found))
+
+# 1. Enumeration
+    def test_is_generator(self):
+        """Nothing is searched until the first clique is asked for"""
+        self.assertIsInstance(iter_maximal_cliques(nx.complete_graph(4)), types.GeneratorType)
+
+    def test_empty_graph(self):
+        """No cliques are yielded for an empty graph"""
+        self.assertEqual([], list(iter_maximal_cliques(nx.Graph())))
+        self.assertEqual([], list(iter_maximal_cliques(nx.Graph(), max_only=True)))
+
+    def test_isolated_nodes(self):
+        """Every isolated node is a maximal clique of its own"""
+        G = nx.empty_graph(5)
+        self.assertSameCliques(G)
+
+    def test_self_loops(self):
+        """Self-loops are ignored"""
+        G = nx.complete_graph(4)
+        G.add_edges_from([(0, 0), (2, 2)])
+        self.assertEqual([{0, 1, 2, 3}], list(iter_maximal_cliques(G)))
+
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs compared against find_cliques()"""
+        for seed in range(40):
+            self.assertSameCliques(nx.gnp_random_graph(30, 0.05 + 0.02 * seed, seed=seed))
+
+    def test_moon_moser_graph(self):
+        """The complete 5-partite graph with parts of size 3 has 3^5 maximal cliques"""
+        G = nx.complete_multipartite_graph(3, 3, 3, 3, 3)
+        cliques = list(iter_maximal_cliques(G))
+        self.assertEqual(3 ** 5, len(cliques))
+        for clq in cliques:
+            self.assertEqual(5, len(clq))
+            self.assertTrue(is_clique(G, clq))
+
+# 2. Max Only
+    def test_max_only_sizes_grow(self):
+        """30 random graphs, each clique yielded is larger than the one before and the last is maximum"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(40, 0.1 + 0.025 * seed, seed=seed)
+            sizes = [len(c) for c in iter_maximal_cliques(G, max_only=True)]
+            self.assertEqual(sorted(set(sizes)), sizes)
+            self.assertEqual(len(max(nx.find_cliques(G), key=len)), sizes[-1])
+
+    def test_max_only_yields_maximal_cliques(self):
+        """Every clique yielded in max_only mode can not be extended"""
+        G = nx.gnp_random_graph(50, 0.4, seed=7)
+        for clq in iter_maximal_cliques(G, max_only=True):
+            self.assertTrue(is_clique(G, clq))
+            common = set.intersection(*(set(G[u]) for u in clq))
+            self.assertEqual(set(), common - clq)
+
+if __name__ == '__main__':
+    unittest.main()
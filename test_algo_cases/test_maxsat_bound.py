@@ -0,0 +1,113 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.bitset_clique import to_bitsets, color_classes, maxsat_bound, color_search
+
+# 8 Tests
+class TestMaxSATBound(unittest.TestCase):
+    """
+    Testing maxsat_bound() and the maxsat_depth option of the custom greedy variants on various edge cases.
+    ---COLOUR CLASSES ARE SOFT CLAUSES, EVERY DISJOINT INCONSISTENT SUBSET LOWERS THE BOUND BY ONE---
+    Asserts for each case run through:
+        Confirming the bound never drops below the size of the maximum clique
+        Confirming the bound is tighter than the number of colours where it should be
+        Confirming the search still finds a maximum clique and counts its MaxSAT calls
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertValidBound(self, G):
+        """
+        Assert that maxsat_bound() on a greedy colouring of G is at least the clique number
+        and at most the number of colours.
+        Parameters:
+            G (networkX.Graph): The graph
+        Returns:
+            bound (int), colours (int)
+        """
+        node_list, index, adj = to_bitsets(G)
+        classes = color_classes((1 << len(node_list)) - 1, adj)
+        bound = maxsat_bound(classes, adj, len(classes))
+        size = len(max(nx.find_cliques(G), key=len)) if len(G) else 0
+        self.assertGreaterEqual(bound, size)
+        self.assertLessEqual(bound, len(classes))
+        return bound, len(classes)
+
+# 1. The Bound
+    def test_bound_is_valid(self):
+        """100 random graphs of every density, the bound never cuts off the maximum clique"""
+        for seed in range(100):
+            self.assertValidBound(nx.gnp_random_graph(8 + seed % 20, 0.2 + 0.007 * seed, seed=seed))
+
+    def test_odd_cycle(self):
+        """A 5-cycle needs 3 colours but has no triangle, one inconsistent subset proves it"""
+        bound, colours = self.assertValidBound(nx.cycle_graph(5))
+        self.assertEqual(3, colours)
+        self.assertEqual(2, bound)
+
+    def test_complete_graph(self):
+        """Every class of a complete graph holds one node, nothing is inconsistent"""
+        bound, colours = self.assertValidBound(nx.complete_graph(6))
+        self.assertEqual(6, bound)
+
+    def test_stops_at_excess(self):
+        """Three joined 5-cycles need 9 colours but hold no clique above 6, the search stops at excess"""
+        G = nx.complement(nx.disjoint_union_all([nx.complement(nx.cycle_graph(5))] * 3))
+        node_list, index, adj = to_bitsets(G)
+        classes = color_classes((1 << len(node_list)) - 1, adj)
+        self.assertEqual(9, len(classes))
+        self.assertEqual(8, maxsat_bound(classes, adj, 1))
+        self.assertEqual(6, maxsat_bound(classes, adj, len(classes)))
+
+# 2. Against the Built-in
+    def test_random_graphs_against_built_in(self):
+        """30 random graphs, every custom variant with maxsat_depth compared against find_cliques()"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(30, 0.3 + 0.02 * seed, seed=seed)
+            size = len(max(nx.find_cliques(G), key=len))
+            for str_mode in ("largest_first", "mcq", "mcs"):
+                for function in (custom_with_greedy, custom_with_partial_greedy):
+                    max_clq = function(G, str_mode, maxsat_depth=3)
+                    self.assertIsClique(G, max_clq)
+                    self.assertEqual(size, len(max_clq), f"{function.__name__} {str_mode}")
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        for str_mode in ("largest_first", "mcs"):
+            self.assertEqual({5, 6, 7}, custom_with_greedy(G, str_mode, nodes=[5], maxsat_depth=2))
+
+# 3. Step Counters
+    def test_counters_and_fewer_steps(self):
+        """On a dense graph the MaxSAT bound is called, prunes and saves steps"""
+        G = nx.gnp_random_graph(90, 0.9, seed=4)
+        for function in (custom_with_greedy_steps, custom_with_partial_greedy_steps):
+            max_clq, steps = function(G, "mcs")
+            stats = {}
+            maxsat_clq, maxsat_steps = function(G, "mcs", stats=stats, maxsat_depth=3)
+            self.assertEqual(len(max_clq), len(maxsat_clq))
+            self.assertGreater(stats["maxsat_calls"], 0)
+            self.assertGreater(stats["maxsat_prunes"], 0)
+            self.assertLessEqual(maxsat_steps, steps)
+
+    def test_depth_zero_never_calls(self):
+        """maxsat_depth=0 keeps the root only, the counters stay at zero"""
+        G = nx.gnp_random_graph(40, 0.8, seed=5)
+        node_list, index, adj = to_bitsets(G)
+        stats = {}
+        clique, steps = color_search(adj, (1 << len(node_list)) - 1, stats=stats, maxsat_depth=0)
+        self.assertEqual(0, stats["maxsat_calls"])
+        self.assertEqual(len(max(nx.find_cliques(G), key=len)), len(clique))
+
+if __name__ == '__main__':
+    unittest.main()
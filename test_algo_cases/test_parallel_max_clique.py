@@ -0,0 +1,167 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.parallel_clique import parallel_max_clique, split_branches, pack_frame, unpack_frame
+from functions.bitset_clique import start_state
+
+# 15 Tests
+class TestParallelMaxClique(unittest.TestCase):
+    """
+    Testing max_clique(nx.Graph, workers=n) and parallel_max_clique(nx.Graph) on various edge cases.
+    ---THE ROOT BRANCHES OF MAX_CLIQUE SPLIT OVER A PROCESS POOL WITH A SHARED INCUMBENT---
+    Asserts for each case run through:
+        Confirming the clique the algorithm finds is a valid clique
+        Confirming all nodes exist within the graph
+        A final check for correct max clique length
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertParallel(self, G, size):
+        """
+        Assert that the parallel search finds a valid clique of the given size at depth 1 and 2.
+        Parameters:
+            G (networkX.Graph): The graph
+            size (int): The size of the maximum clique
+        """
+        results = [max_clique(G, workers=2),
+                   max_clique_with_steps(G, workers=2)[0],
+                   set(parallel_max_clique(G, workers=3, depth=2)[0]),
+                   set(parallel_max_clique(G, workers=3, schedule="stealing")[0])]
+        for max_clq in results:
+            self.assertIsClique(G, max_clq)
+            self.assertTrue(max_clq.issubset(G.nodes))
+            self.assertEqual(size, len(max_clq))
+
+# 1. Basic Structures
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertParallel(nx.Graph(), 0)
+
+    def test_graph_with_no_edges(self):
+        """networkX Graph with 5 nodes and 0 edges"""
+        G = nx.Graph()
+        G.add_nodes_from(range(5))
+        self.assertParallel(G, 1)
+
+    def test_k10_graph(self):
+        """networkX 10-node complete Graph"""
+        self.assertParallel(nx.complete_graph(10), 10)
+
+    def test_c10_graph(self):
+        """networkX 10-node cycle Graph"""
+        self.assertParallel(nx.cycle_graph(10), 2)
+
+# 2. Input Handling
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        self.assertEqual({5, 6, 7}, max_clique(G, nodes=[5], workers=2))
+
+    def test_bad_depth(self):
+        """Only depth 1 and 2 splits are supported"""
+        with self.assertRaises(ValueError):
+            parallel_max_clique(nx.complete_graph(3), workers=1, depth=3)
+
+# 3. Against the Serial Search
+    def test_split_branches_partition_the_tree(self):
+        """Every maximal clique is reachable from one of the branches of split_branches()"""
+        G = nx.gnp_random_graph(25, 0.5, seed=1)
+        node_list, adj, Q, cand = start_state(G)
+        cliques = {frozenset(c) for c in nx.find_cliques(G)}
+        for depth in (1, 2):
+            found = []
+            for task_Q, subg, task_cand in split_branches(adj, Q, cand, cand, depth):
+                H = G.subgraph(node_list[i] for i in range(len(node_list)) if subg >> i & 1)
+                prefix = {node_list[i] for i in task_Q}
+                for c in nx.find_cliques(H) if len(H) else [[]]:
+                    if (prefix | set(c)) in cliques:
+                        found.append(frozenset(prefix | set(c)))
+            self.assertEqual(cliques, set(found))
+
+    def test_random_graphs_against_serial(self):
+        """20 random graphs, the parallel search must match max_clique()"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(40, 0.2 + 0.03 * seed, seed=seed)
+            self.assertParallel(G, len(max_clique(G)))
+
+    def test_steps_are_summed(self):
+        """The steps of all workers are added up"""
+        G = nx.gnp_random_graph(40, 0.5, seed=2)
+        max_clq, steps = max_clique_with_steps(G, workers=2)
+        self.assertGreater(steps, 0)
+
+# 4. Work Stealing
+    def test_pack_frame_round_trip(self):
+        """Frames survive pack_frame() and unpack_frame()"""
+        size = (500 + 7) // 8
+        frame = ([3, 1, 499], (1 << 499) | 6, 6, 1 << 2)
+        self.assertEqual(frame, unpack_frame(pack_frame(*frame, size), size))
+        self.assertEqual(([], 0, 0, 0), unpack_frame(pack_frame([], 0, 0, 0, 1), 1))
+
+    def test_unknown_schedule(self):
+        """Unknown schedules are rejected"""
+        with self.assertRaises(ValueError):
+            parallel_max_clique(nx.complete_graph(3), workers=1, schedule="dynamic")
+
+    def test_stealing_reports_worker_times(self):
+        """Every worker reports its busy and idle time, and frames are handed between workers"""
+        G = nx.gnp_random_graph(80, 0.6, seed=4)
+        stats = {}
+        max_clq, steps = parallel_max_clique(G, workers=3, schedule="stealing", stats=stats)
+        self.assertEqual(len(max_clique(G)), len(max_clq))
+        self.assertEqual(3, len(stats["workers"]))
+        for record in stats["workers"]:
+            self.assertGreaterEqual(record["busy"], 0.0)
+            self.assertGreaterEqual(record["idle"], 0.0)
+        self.assertEqual(steps, sum(record["steps"] for record in stats["workers"]))
+        # Only the root frame is queued up front, every other frame was donated
+        self.assertEqual(sum(record["frames"] for record in stats["workers"]),
+                         sum(record["donated"] for record in stats["workers"]) + 1)
+
+    def test_static_reports_worker_times(self):
+        """The static schedule reports busy and idle time per pool process"""
+        stats = {}
+        parallel_max_clique(nx.gnp_random_graph(40, 0.5, seed=6), workers=2, stats=stats)
+        self.assertGreater(len(stats["workers"]), 0)
+        for record in stats["workers"]:
+            self.assertIn("busy", record)
+            self.assertIn("idle", record)
+
+    def test_max_clique_schedule_and_stats(self):
+        """max_clique() hands schedule and stats to the parallel search"""
+        G = nx.gnp_random_graph(80, 0.6, seed=4)
+        size = len(max_clique(G))
+        for schedule in ("static", "stealing"):
+            stats = {}
+            max_clq, steps = max_clique_with_steps(G, workers=3, schedule=schedule, stats=stats)
+            self.assertIsClique(G, max_clq)
+            self.assertEqual(size, len(max_clq))
+            self.assertGreater(len(stats["workers"]), 0)
+            self.assertEqual(steps, sum(record["steps"] for record in stats["workers"]))
+        stats = {}
+        self.assertEqual(size, len(max_clique(G, workers=2, schedule="stealing", stats=stats)))
+        self.assertEqual(2, len(stats["workers"]))
+
+    def test_max_clique_schedule_needs_workers(self):
+        """Stealing needs workers on the set or bitset backend, unknown schedules are rejected"""
+        G = nx.complete_graph(3)
+        for options in ({}, {"workers": 2, "backend": "sparse"}):
+            with self.assertRaises(ValueError):
+                max_clique(G, schedule="stealing", **options)
+        with self.assertRaises(ValueError):
+            max_clique(G, workers=2, schedule="dynamic")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.read_DIMACS import *
+from functions.search_hooks import SearchCounters
+
+# 8 Tests
+class TestPrefixCliques(unittest.TestCase):
+    """
+    Testing prefix_max_cliques(G) on the nested prefix subgraphs of a graph.
+    ---THE CLIQUE OF A PREFIX SEEDS THE NEXT ONE, WHICH ONLY SEARCHES THROUGH ITS NEW NODES---
+    Asserts for each case run through:
+        Confirming every row holds a valid maximum clique of its prefix
+        Confirming the steps and seconds only grow with the prefix
+    """
+# Custom Assertions
+    def assertPrefixTable(self, G, table, order=None):
+        """
+        Assert that every row of the table is solved against find_cliques() on its prefix.
+        Parameters:
+            G (networkX.Graph): The graph
+            table (list): Rows returned by prefix_max_cliques()
+            order (list): optional, the prefix order
+        """
+        order = list(G) if order is None else order
+        for row, following in zip(table, table[1:] + [None]):
+            H = G.subgraph(order[:row["nodes"]])
+            self.assertTrue(is_clique(H, row["clique"]), f"{row['clique']} is not a valid clique of the prefix")
+            self.assertEqual(max(len(c) for c in nx.find_cliques(H)), row["size"])
+            self.assertEqual(row["size"], row["upper_bound"])
+            self.assertTrue(row["optimal"])
+            if following is not None:
+                self.assertLessEqual(row["steps"], following["steps"])
+                self.assertLessEqual(row["seconds"], following["seconds"])
+
+# 1. Prefixes
+    def test_empty_graph(self):
+        """Empty networkX Graph has no prefixes"""
+        self.assertEqual([], prefix_max_cliques(nx.Graph()))
+
+    def test_every_prefix(self):
+        """Every prefix of a small graph by default"""
+        G = nx.gnp_random_graph(30, 0.5, seed=1)
+        table = prefix_max_cliques(G)
+        self.assertEqual(list(range(1, 31)), [row["nodes"] for row in table])
+        self.assertPrefixTable(G, table)
+
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs of growing density compared against find_cliques() on every prefix"""
+        for seed in range(40):
+            G = nx.gnp_random_graph(35, 0.05 + 0.02 * seed, seed=seed)
+            self.assertPrefixTable(G, prefix_max_cliques(G, eliminate=seed % 2 == 0))
+
+    def test_sizes_and_order(self):
+        """Only the given prefix sizes, sorted, along the given order"""
+        G = nx.gnp_random_graph(40, 0.6, seed=4)
+        order = sorted(G, key=G.degree)
+        table = prefix_max_cliques(G, [30, 10, 20, 10], order=order)
+        self.assertEqual([10, 20, 30], [row["nodes"] for row in table])
+        self.assertPrefixTable(G, table, order)
+
+    def test_dimacs_prefixes(self):
+        """The prefixes of a DIMACS graph are its first nodes"""
+        G = read_dimacs_clq("DIMACS_files/brock200_2.txt")
+        table = prefix_max_cliques(G, [25, 50, 75])
+        for row in table:
+            H = G.subgraph(range(1, row["nodes"] + 1))
+            self.assertEqual(len(max_clique(H)), row["size"])
+            self.assertTrue(row["clique"] <= set(H))
+
+    def test_time_budget(self):
+        """Prefixes left when the search stops keep a valid clique and upper bound"""
+        G = nx.gnp_random_graph(80, 0.7, seed=3)
+        table = prefix_max_cliques(G, [10, 80], time_budget=0)
+        for row in table:
+            H = G.subgraph(list(G)[:row["nodes"]])
+            self.assertTrue(is_clique(H, row["clique"]))
+            self.assertGreaterEqual(row["upper_bound"], max(len(c) for c in nx.find_cliques(H)))
+        self.assertFalse(table[-1]["optimal"])
+
+    def test_hooks(self):
+        """Hooks count every step of the whole series"""
+        G = nx.gnp_random_graph(40, 0.5, seed=2)
+        counters = SearchCounters()
+        table = prefix_max_cliques(G, hooks=counters)
+        self.assertEqual(table[-1]["steps"], counters.steps)
+
+    def test_invalid_sizes(self):
+        """Prefix sizes must be between 1 and the number of nodes"""
+        G = nx.complete_graph(5)
+        for sizes in ([0], [6], [3, 6]):
+            with self.assertRaises(ValueError):
+                prefix_max_cliques(G, sizes)
+
+if __name__ == '__main__':
+    unittest.main()
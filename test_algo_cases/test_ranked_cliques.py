@@ -0,0 +1,104 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+
+# 9 Tests
+class TestRankedCliques(unittest.TestCase):
+    """
+    Testing all_maximum_cliques(G) and top_k_cliques(G, k) on various edge cases.
+    ---ONE BRANCH AND BOUND SEARCH KEEPS EVERY OPTIMUM OR THE K LARGEST MAXIMAL CLIQUES---
+    Asserts for each case run through:
+        Confirming every clique returned is a valid maximal clique
+        Confirming the cliques match those of find_cliques()
+    """
+# Custom Assertions
+    def assertIsMaximalClique(self, G, clq):
+        """
+        Assert that clq is a clique no node of G can extend.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (set): Set of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+        for u in set(G) - clq:
+            self.assertFalse(clq <= set(G[u]), f"{clq} is not maximal, {u} extends it")
+
+    def assertTopK(self, G, k):
+        """
+        Assert that top_k_cliques() returns k largest maximal cliques.
+        Parameters:
+            G (networkX.Graph): The graph
+            k (int): Number of cliques
+        """
+        sizes = sorted((len(c) for c in nx.find_cliques(G)), reverse=True)[:k]
+        cliques = top_k_cliques(G, k)
+        self.assertEqual(sizes, [len(c) for c in cliques])
+        self.assertEqual(len(cliques), len({frozenset(c) for c in cliques}), "A clique was returned twice")
+        for clq in cliques:
+            self.assertIsMaximalClique(G, clq)
+
+# 1. All Maximum Cliques
+    def test_empty_graph(self):
+        """No cliques in an empty graph"""
+        self.assertEqual([], all_maximum_cliques(nx.Graph()))
+        self.assertEqual([], top_k_cliques(nx.Graph(), 3))
+
+    def test_two_triangles(self):
+        """Two triangles sharing a node are both maximum"""
+        G = nx.Graph([(0, 1), (1, 2), (0, 2), (2, 3), (3, 4), (2, 4)])
+        cliques = all_maximum_cliques(G)
+        self.assertCountEqual([{0, 1, 2}, {2, 3, 4}], cliques)
+
+    def test_moon_moser_graph(self):
+        """Every one of the 3^4 maximal cliques of the complete 4-partite graph is maximum"""
+        cliques = all_maximum_cliques(nx.complete_multipartite_graph(3, 3, 3, 3))
+        self.assertEqual(81, len({frozenset(c) for c in cliques}))
+
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs compared against find_cliques()"""
+        for seed in range(40):
+            G = nx.gnp_random_graph(35, 0.05 + 0.02 * seed, seed=seed)
+            cliques = list(nx.find_cliques(G))
+            size = max(len(c) for c in cliques)
+            expected = {frozenset(c) for c in cliques if len(c) == size}
+            found = [frozenset(c) for c in all_maximum_cliques(G)]
+            self.assertEqual(len(found), len(set(found)), "A clique was returned twice")
+            self.assertEqual(expected, set(found))
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of every returned clique"""
+        G = nx.complete_graph(4)
+        G.add_edges_from([(3, 4), (3, 5), (4, 5), (5, 6), (4, 6)])
+        self.assertCountEqual([{3, 4, 5}, {4, 5, 6}], all_maximum_cliques(G, nodes=[4]))
+        self.assertEqual([{0, 1, 2, 3}], all_maximum_cliques(G))
+
+# 2. Top k
+    def test_top_k_random_graphs(self):
+        """30 random graphs, the sizes of the k largest maximal cliques match find_cliques()"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(35, 0.1 + 0.025 * seed, seed=seed)
+            for k in (1, 3, 10):
+                self.assertTopK(G, k)
+
+    def test_top_k_more_than_cliques(self):
+        """A k larger than the number of maximal cliques returns all of them"""
+        G = nx.path_graph(5)
+        self.assertEqual(4, len(top_k_cliques(G, 10)))
+
+    def test_top_k_prunes(self):
+        """Keeping fewer cliques prunes more branches"""
+        G = nx.gnp_random_graph(80, 0.5, seed=1)
+        few, many = {}, {}
+        top_k_cliques(G, 1, stats=few)
+        top_k_cliques(G, 100, stats=many)
+        self.assertLess(few["steps"], many["steps"])
+
+    def test_invalid_k(self):
+        """k must be positive"""
+        with self.assertRaises(ValueError):
+            top_k_cliques(nx.complete_graph(3), 0)
+
+if __name__ == '__main__':
+    unittest.main()
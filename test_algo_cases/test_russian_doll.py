@@ -0,0 +1,105 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.search_hooks import SearchCounters, SearchProfile
+
+# 9 Tests
+class TestRussianDoll(unittest.TestCase):
+    """
+    Testing russian_doll_search() through the russian_doll option of max_clique(G).
+    ---EVERY DOLL ADDS ONE NODE OF THE ORDERING, ITS CLIQUE SIZE BOUNDS THE BRANCHES ENDING IN IT---
+    Asserts for each case run through:
+        Confirming the clique is a valid maximum clique
+        Confirming the result and instrumentation match the other engines
+    """
+# Custom Assertions
+    def assertIsMaxClique(self, G, clq):
+        """
+        Assert that clq is a clique as large as the largest of find_cliques().
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (set): Set of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+        self.assertEqual(max((len(c) for c in nx.find_cliques(G)), default=0), len(clq))
+
+# 1. Max Clique
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertEqual(set(), max_clique(nx.Graph(), russian_doll=True))
+
+    def test_small_graphs(self):
+        """Single node, single edge and a complete graph"""
+        G = nx.Graph()
+        G.add_node(1)
+        self.assertEqual({1}, max_clique(G, russian_doll=True))
+        self.assertEqual({0, 1}, max_clique(nx.path_graph(2), russian_doll=True))
+        self.assertEqual(set(range(7)), max_clique(nx.complete_graph(7), russian_doll=True))
+
+    def test_random_graphs_against_built_in(self):
+        """60 random graphs of growing density compared against find_cliques()"""
+        for seed in range(60):
+            G = nx.gnp_random_graph(35, 0.05 + 0.015 * seed, seed=seed)
+            self.assertIsMaxClique(G, max_clique(G, russian_doll=True))
+
+    def test_orderings(self):
+        """Every ordering, with elimination and a heuristic seed, finds a maximum clique"""
+        for seed in range(10):
+            G = nx.gnp_random_graph(40, 0.5, seed=seed)
+            for ordering in ("degeneracy", "max_degree", "min_width", "color"):
+                self.assertIsMaxClique(G, max_clique(G, russian_doll=True, ordering=ordering))
+            self.assertIsMaxClique(G, max_clique(G, russian_doll=True, eliminate=True, heuristic=True))
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(4)
+        G.add_edges_from([(3, 4), (3, 5), (4, 5)])
+        self.assertEqual({3, 4, 5}, max_clique(G, nodes=[5], russian_doll=True))
+        self.assertEqual({0, 1, 2, 3}, max_clique(G, nodes=[0], russian_doll=True))
+        with self.assertRaises(ValueError):
+            max_clique(G, nodes=[0, 5], russian_doll=True)
+        G.add_edge(0, 0)
+        self.assertEqual({0, 1, 2, 3}, max_clique(G, nodes=[0], russian_doll=True))
+
+    def test_time_budget(self):
+        """A search stopped early still bounds the clique it may have missed"""
+        G = nx.gnp_random_graph(60, 0.6, seed=2)
+        size = max(len(c) for c in nx.find_cliques(G))
+        for budget in (0, 60):
+            max_clq = max_clique(G, time_budget=budget, russian_doll=True)
+            self.assertTrue(is_clique(G, max_clq))
+            self.assertGreaterEqual(max_clq.upper_bound, size)
+            self.assertEqual(max_clq.optimal, len(max_clq) == max_clq.upper_bound == size)
+
+# 2. Instrumentation
+    def test_hooks(self):
+        """The doll bound prunes, and the counters and profile agree with the steps"""
+        G = nx.gnp_random_graph(60, 0.5, seed=1)
+        counters, profile = SearchCounters(), SearchProfile()
+        max_clq, steps = max_clique_with_steps(G, russian_doll=True, hooks=counters)
+        max_clique(G, russian_doll=True, hooks=profile)
+        self.assertIsMaxClique(G, max_clq)
+        self.assertEqual(steps, counters.steps)
+        self.assertGreater(counters.prunes["doll"], 0)
+        self.assertEqual(0, counters.bound_calls)
+        self.assertEqual(counters.prunes["doll"], sum(row["doll_prunes"] for row in profile.depths.values()))
+        self.assertEqual(len(max_clq), profile.improvements[-1]["size"])
+
+    def test_fewer_steps(self):
+        """The doll bound takes fewer steps than the candidate count alone on a structured graph"""
+        G = nx.hypercube_graph(6)
+        max_clq, steps = max_clique_with_steps(G, russian_doll=True)
+        self.assertIsMaxClique(G, max_clq)
+        self.assertLess(steps, max_clique_with_steps(G)[1])
+
+    def test_invalid_options(self):
+        """Only the set backend runs the russian doll search, and never with symmetry or kernelize"""
+        G = nx.complete_graph(3)
+        for options in ({"backend": "bitset"}, {"symmetry": True}, {"kernelize": True}, {"workers": 2}):
+            with self.assertRaises(ValueError):
+                max_clique(G, russian_doll=True, **options)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import networkx as nx
+import unittest
+import json
+import os
+import tempfile
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.search_hooks import SearchCounters, SearchProfile
+
+# 6 Tests
+class TestSearchProfile(unittest.TestCase):
+    """
+    Testing SearchProfile, the per-depth profile of the set search engine.
+    ---EVERY ROW COUNTS THE CHILDREN OF ONE DEPTH AND WHICH BOUND CUT THEM---
+    Asserts for each case run through:
+        Confirming the rows add up to the totals of SearchCounters
+        Confirming the profile survives a round trip through JSON
+    """
+# Custom Assertions
+    def assertMatchesCounters(self, G, solver, *args, **kwargs):
+        """
+        Assert that the rows of a profile add up to the counters of the same search.
+        Parameters:
+            G (networkX.Graph): The graph
+            solver (function): A solver taking hooks
+            args, kwargs: Passed on to the solver
+        """
+        profile, counters = SearchProfile(), SearchCounters()
+        solver(G, *args, hooks=profile, **kwargs)
+        solver(G, *args, hooks=counters, **kwargs)
+        rows = profile.as_dict()["depths"].values()
+        self.assertEqual(counters.steps, sum(row["steps"] for row in rows))
+        self.assertEqual(counters.bound_calls, sum(row["color_calls"] for row in rows))
+        self.assertEqual(counters.prunes.get("size", 0), sum(row["size_prunes"] for row in rows))
+        self.assertEqual(counters.prunes.get("color", 0), sum(row["color_prunes"] for row in rows))
+        self.assertEqual(counters.incumbent_updates, len(profile.improvements))
+
+# 1. Rows
+    def test_against_counters(self):
+        """10 random graphs, the profile of every set solver adds up to its counters"""
+        for seed in range(10):
+            G = nx.gnp_random_graph(30, 0.3 + 0.05 * seed, seed=seed)
+            self.assertMatchesCounters(G, max_clique)
+            self.assertMatchesCounters(G, custom_with_greedy, "largest_first")
+            self.assertMatchesCounters(G, custom_with_partial_greedy, "independent_set", schedule="partial")
+
+    def test_root_row(self):
+        """Depth 0 holds the root and nothing is cut there"""
+        profile = SearchProfile()
+        max_clique(nx.gnp_random_graph(30, 0.5, seed=1), hooks=profile)
+        root = profile.depths[0]
+        self.assertEqual(1, root["expanded"])
+        self.assertEqual(0, root["size_prunes"] + root["color_prunes"] + root["color_calls"])
+
+    def test_partial_colours_every_third_depth(self):
+        """The partial schedule only colours the children at depth 3, 6, ... (cliques of that size)"""
+        profile = SearchProfile()
+        custom_with_partial_greedy(nx.gnp_random_graph(40, 0.7, seed=2), "largest_first", hooks=profile,
+                                   schedule="partial")
+        for depth, row in profile.depths.items():
+            if depth % 3 != 0:
+                self.assertEqual(0, row["color_calls"], f"Coloured at depth {depth}")
+        self.assertGreater(sum(row["color_calls"] for row in profile.depths.values()), 0)
+
+# 2. Improvements
+    def test_improvements(self):
+        """The larger cliques grow and are found in order"""
+        G = nx.gnp_random_graph(50, 0.6, seed=3)
+        profile = SearchProfile()
+        clique = custom_with_greedy(G, "largest_first", hooks=profile)
+        sizes = [imp["size"] for imp in profile.improvements]
+        self.assertEqual(len(clique), sizes[-1])
+        self.assertEqual(sorted(set(sizes)), sizes)
+        times = [imp["seconds"] for imp in profile.improvements]
+        self.assertEqual(sorted(times), times)
+
+# 3. Output
+    def test_json_round_trip(self):
+        """to_json() writes the same profile it returns"""
+        profile = SearchProfile()
+        custom_with_greedy(nx.gnp_random_graph(30, 0.5, seed=4), "largest_first", hooks=profile)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "profile.json")
+            text = profile.to_json(path)
+            with open(path) as f:
+                self.assertEqual(text, f.read())
+        data = json.loads(text)
+        self.assertEqual(profile.improvements, data["improvements"])
+        self.assertEqual(profile.depths, {int(depth): row for depth, row in data["depths"].items()})
+
+    def test_table(self):
+        """One line per depth, a header, a total and one line per larger clique"""
+        profile = SearchProfile()
+        custom_with_greedy(nx.gnp_random_graph(30, 0.5, seed=5), "largest_first", hooks=profile)
+        lines = profile.table().splitlines()
+        self.assertEqual(2 + len(profile.depths) + len(profile.improvements), len(lines))
+        self.assertTrue(lines[1 + len(profile.depths)].split()[0] == "all")
+
+if __name__ == '__main__':
+    unittest.main()
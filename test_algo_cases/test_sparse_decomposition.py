@@ -0,0 +1,141 @@
+import networkx as nx
+import unittest
+import time
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.sparse_clique import degeneracy_order, peel, sparse_max_clique
+
+# 11 Tests
+class TestSparseDecomposition(unittest.TestCase):
+    """
+    Testing max_clique(G, backend="sparse") on various edge cases.
+    ---ONE SUBPROBLEM PER NODE OVER ITS LATER NEIGHBOURS IN A DEGENERACY ORDERING---
+    Asserts for each case run through:
+        Confirming the ordering leaves every node at most degeneracy later neighbours
+        Confirming the search finds a maximum clique, serial and in parallel
+        Confirming subproblems that can not beat the best clique are skipped
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertMaxClique(self, G, workers=None):
+        """
+        Assert that the sparse backend finds a clique as large as find_cliques() does.
+        Parameters:
+            G (networkX.Graph): The graph
+            workers (int): optional, number of processes
+        """
+        size = len(max(nx.find_cliques(G), key=len)) if len(G) else 0
+        max_clq = max_clique(G, backend="sparse", workers=workers)
+        self.assertIsClique(G, max_clq)
+        self.assertEqual(size, len(max_clq))
+
+# 1. Degeneracy Ordering
+    def test_ordering_matches_core_numbers(self):
+        """The core numbers of the ordering agree with nx.core_number() on 20 random graphs"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(50, 0.02 + 0.03 * seed, seed=seed)
+            adj = {u: set(G[u]) for u in G}
+            order, core, later = degeneracy_order(adj)
+            self.assertEqual(nx.core_number(G), core)
+            self.assertEqual(set(G), set(order))
+
+    def test_later_neighbours_bounded(self):
+        """Every node has at most degeneracy later neighbours and every edge appears once"""
+        G = nx.barabasi_albert_graph(2000, 4, seed=1)
+        adj = {u: set(G[u]) for u in G}
+        order, core, later = degeneracy_order(adj)
+        degeneracy = max(core.values())
+        self.assertLessEqual(max(len(later[u]) for u in G), degeneracy)
+        self.assertEqual(G.number_of_edges(), sum(len(later[u]) for u in G))
+
+    def test_peel_keeps_every_clique(self):
+        """Peeling 20 random graphs keeps every node of a clique of k, and gives up below k nodes"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(30, 0.3 + 0.02 * seed, seed=seed)
+            adj = {u: set(G[u]) for u in G}
+            for k in range(2, 8):
+                kept = peel(adj, list(G), k)
+                in_clique = {u for c in nx.find_cliques(G) if len(c) >= k for u in c}
+                if kept is None:
+                    self.assertEqual(set(), in_clique)
+                else:
+                    self.assertGreaterEqual(len(kept), k)
+                    self.assertLessEqual(in_clique, set(kept))
+                    self.assertGreaterEqual(min(len(adj[u] & set(kept)) for u in kept), k - 1)
+
+# 2. Against the Built-in
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs compared against find_cliques()"""
+        for seed in range(40):
+            self.assertMaxClique(nx.gnp_random_graph(40, 0.02 + 0.02 * seed, seed=seed))
+
+    def test_edge_cases(self):
+        """Empty graph, isolated nodes, a single edge and a complete graph"""
+        for G in (nx.Graph(), nx.empty_graph(5), nx.path_graph(2), nx.complete_graph(8)):
+            self.assertMaxClique(G)
+
+    def test_parallel_workers(self):
+        """Solving the subproblems in 2 processes finds the same clique size"""
+        for seed in range(5):
+            self.assertMaxClique(nx.gnp_random_graph(80, 0.1, seed=seed), workers=2)
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7), (4, 5)])
+        self.assertEqual({5, 6, 7}, max_clique(G, nodes=[5], backend="sparse"))
+        self.assertEqual({4, 5}, max_clique(G, nodes=[4, 5], backend="sparse"))
+        with self.assertRaises(ValueError):
+            max_clique(G, nodes=[0, 6], backend="sparse")
+
+# 3. Large Sparse Graphs
+    def test_small_subproblems_are_skipped(self):
+        """A planted clique of 10 in a sparse random graph, most subproblems are too small to search"""
+        G = nx.gnm_random_graph(20000, 40000, seed=1)
+        G.add_edges_from((u, v) for u in range(10) for v in range(u + 1, 10))
+        stats = {}
+        clique, steps = sparse_max_clique(G, stats=stats)
+        self.assertEqual(set(range(10)), set(clique))
+        self.assertGreater(stats["skipped"], stats["subproblems"])
+
+    def test_peeled_subproblems_are_skipped(self):
+        """Every subproblem of a Barabasi-Albert graph is as large as the degeneracy, peeling still skips most"""
+        G = nx.barabasi_albert_graph(5000, 4, seed=2)
+        stats = {}
+        clique, steps = sparse_max_clique(G, stats=stats)
+        self.assertIsClique(G, clique)
+        self.assertEqual(len(max(nx.find_cliques(G), key=len)), len(clique))
+        self.assertGreater(stats["skipped"], 10 * stats["subproblems"])
+
+    def test_heuristic_seed_and_elimination(self):
+        """Seeding and elimination keep the answer and do not take more steps"""
+        G = nx.barabasi_albert_graph(5000, 3, seed=2)
+        size = len(max(nx.find_cliques(G), key=len))
+        max_clq, steps = max_clique_with_steps(G, backend="sparse")
+        seeded_clq, seeded_steps = max_clique_with_steps(G, backend="sparse", heuristic=True, eliminate=True)
+        self.assertEqual(size, len(max_clq))
+        self.assertEqual(size, len(seeded_clq))
+        self.assertLessEqual(seeded_steps, steps)
+
+    def test_time_budget(self):
+        """A finished search is optimal, an expired one still returns a valid bound"""
+        G = nx.barabasi_albert_graph(3000, 4, seed=3)
+        result = max_clique(G, backend="sparse", time_budget=30)
+        self.assertTrue(result.optimal)
+        self.assertEqual(len(max(nx.find_cliques(G), key=len)), len(result))
+        result = max_clique(G, backend="sparse", time_budget=0)
+        self.assertIsClique(G, result)
+        self.assertFalse(result.optimal)
+        self.assertGreaterEqual(result.upper_bound, len(max(nx.find_cliques(G), key=len)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.symmetry import refine, find_automorphism, orbits
+
+def adjacency(G):
+    return {u: set(G[u]) - {u} for u in G}
+
+# 11 Tests
+class TestSymmetry(unittest.TestCase):
+    """
+    Testing orbits() and the symmetry option of max_clique(G).
+    ---ONE BRANCH PER ORBIT AT THE ROOT AND PER ORBIT OF ITS STABILIZER BELOW---
+    Asserts for each case run through:
+        Confirming nodes are only put in one orbit when an automorphism maps them onto each other
+        Confirming the clique is a valid maximum clique
+    """
+# Custom Assertions
+    def assertIsMaxClique(self, G, clq):
+        """
+        Assert that clq is a clique as large as the largest of find_cliques().
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (set): Set of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+        self.assertEqual(max((len(c) for c in nx.find_cliques(G)), default=0), len(clq))
+
+    def assertOrbits(self, G, expected, fixed=()):
+        """
+        Assert that orbits() finds the expected orbits.
+        Parameters:
+            G (networkX.Graph): The graph
+            expected (list): The orbits as lists of nodes
+            fixed (list): optional, nodes the automorphisms fix
+        """
+        found = {frozenset(o) for o in orbits(adjacency(G), fixed)}
+        self.assertEqual({frozenset(o) for o in expected}, found)
+
+# 1. Orbits
+    def test_path_orbits(self):
+        """A path is only symmetric under its reflection"""
+        self.assertOrbits(nx.path_graph(5), [[0, 4], [1, 3], [2]])
+
+    def test_vertex_transitive(self):
+        """Petersen graph and the 4-cube have a single orbit"""
+        self.assertOrbits(nx.petersen_graph(), [list(range(10))])
+        self.assertOrbits(nx.hypercube_graph(4), [list(nx.hypercube_graph(4))])
+
+    def test_stabilizer_orbits(self):
+        """Fixing a corner of the 4-cube leaves one orbit per distance"""
+        G = nx.hypercube_graph(4)
+        root = (0, 0, 0, 0)
+        distance = nx.single_source_shortest_path_length(G, root)
+        expected = [[u for u in G if distance[u] == d] for d in range(5)]
+        self.assertOrbits(G, expected, fixed=[root])
+
+    def test_refinement_is_not_trusted(self):
+        """A hexagon and two triangles share one refinement cell but no automorphism"""
+        G = nx.disjoint_union(nx.cycle_graph(6), nx.disjoint_union(nx.complete_graph(3), nx.complete_graph(3)))
+        adj = adjacency(G)
+        self.assertEqual(1, len(set(refine(adj, {u: 0 for u in G}).values())))
+        for group in orbits(adj):
+            self.assertTrue(set(group) <= set(range(6)) or set(group) <= set(range(6, 12)), f"{group} mixes orbits")
+
+    def test_automorphism(self):
+        """A found automorphism maps edges onto edges"""
+        G = nx.circulant_graph(12, [1, 3])
+        adj = adjacency(G)
+        colors = refine(adj, {u: 0 for u in G})
+        sigma = find_automorphism(adj, colors, colors)
+        self.assertIsNotNone(sigma)
+        self.assertEqual(set(G), set(sigma.values()))
+        for u, v in G.edges():
+            self.assertTrue(G.has_edge(sigma[u], sigma[v]))
+
+# 2. Max Clique
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertEqual(set(), max_clique(nx.Graph(), symmetry=True))
+
+    def test_random_graphs_against_built_in(self):
+        """60 random graphs compared against find_cliques()"""
+        for seed in range(60):
+            G = nx.gnp_random_graph(30, 0.05 + 0.015 * seed, seed=seed)
+            self.assertIsMaxClique(G, max_clique(G, symmetry=True))
+
+    def test_symmetric_graphs(self):
+        """Symmetric graphs are solved in fewer steps"""
+        for G in (nx.complete_multipartite_graph(3, 3, 3, 3), nx.circulant_graph(30, [1, 2, 5, 7]),
+                  nx.paley_graph(29).to_undirected(), nx.hypercube_graph(5)):
+            max_clq, steps = max_clique_with_steps(G, symmetry=True)
+            self.assertIsMaxClique(G, max_clq)
+            self.assertLess(steps, max_clique_with_steps(G)[1])
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(4)
+        G.add_edges_from([(3, 4), (3, 5), (4, 5)])
+        self.assertEqual({3, 4, 5}, max_clique(G, nodes=[5], symmetry=True))
+        self.assertEqual({0, 1, 2, 3}, max_clique(G, nodes=[0], symmetry=True))
+        G.add_edge(0, 0)
+        self.assertEqual({0, 1, 2, 3}, max_clique(G, nodes=[0], symmetry=True))
+
+    def test_time_budget(self):
+        """A search stopped early still bounds the clique it may have missed"""
+        G = nx.circulant_graph(40, [1, 2, 3, 5, 8, 13])
+        size = max(len(c) for c in nx.find_cliques(G))
+        for budget in (0, 60):
+            max_clq = max_clique(G, time_budget=budget, symmetry=True)
+            self.assertTrue(is_clique(G, max_clq))
+            self.assertGreaterEqual(max_clq.upper_bound, size)
+            self.assertEqual(max_clq.optimal, len(max_clq) == max_clq.upper_bound == size)
+
+    def test_invalid_backend(self):
+        """Only the set backend breaks symmetry"""
+        with self.assertRaises(ValueError):
+            max_clique(nx.complete_graph(3), backend="bitset", symmetry=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.bitset_clique import to_bitsets, iter_bits, color_classes, renumber_classes, inherit_classes
+
+# 18 Tests
+class TestTomitaColoring(unittest.TestCase):
+    """
+    Testing custom_with_greedy(nx.Graph, mode) and custom_with_partial_greedy(nx.Graph, mode)
+    with the "mcq", "mcr" and "mcs" strategies on various edge cases.
+    ---BRANCH AND BOUND ON THE HIGHEST COLOUR CLASS FIRST, COLOURED ON THE SOLVER'S OWN BITSETS---
+    Asserts for each case run through:
+        Confirming the clique the algorithm finds is a valid clique
+        Confirming all nodes exist within the graph
+        A final check for correct max clique length
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertAllStrategies(self, G, size):
+        """
+        Assert that every Tomita strategy finds a valid clique of the given size.
+        Parameters:
+            G (networkX.Graph): The graph
+            size (int): The size of the maximum clique
+        """
+        for mode in TOMITA_STRATEGIES:
+            for func in (custom_with_greedy, custom_with_partial_greedy):
+                max_clq = func(G, mode)
+                self.assertIsClique(G, max_clq)
+                self.assertTrue(set(max_clq).issubset(G.nodes))
+                self.assertEqual(size, len(max_clq), f"{func.__name__} with {mode}")
+
+# 1. Basic Structures
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertAllStrategies(nx.Graph(), 0)
+
+    def test_single_node(self):
+        """networkX Graph with 1 node and 0 edges"""
+        G = nx.Graph()
+        G.add_node(0)
+        self.assertAllStrategies(G, 1)
+
+    def test_graph_with_no_edges(self):
+        """networkX Graph with 5 nodes and 0 edges"""
+        G = nx.Graph()
+        G.add_nodes_from(range(5))
+        self.assertAllStrategies(G, 1)
+
+    def test_k10_graph(self):
+        """networkX 10-node complete Graph"""
+        self.assertAllStrategies(nx.complete_graph(10), 10)
+
+    def test_c10_graph(self):
+        """networkX 10-node cycle Graph"""
+        self.assertAllStrategies(nx.cycle_graph(10), 2)
+
+    def test_4_node_bipartite_graph(self):
+        """networkX complete bipartite Graph K2,2"""
+        self.assertAllStrategies(nx.complete_bipartite_graph(2, 2), 2)
+
+# 2. Complex Structures
+    def test_overlapping_cliques(self):
+        """networkX Graph with two 4-node cliques sharing 2 nodes"""
+        G = nx.complete_graph(4)
+        G.add_edges_from([(2, 4), (2, 5), (3, 4), (3, 5), (4, 5)])
+        self.assertAllStrategies(G, 4)
+
+    def test_large_clique_with_noise(self):
+        """networkX 8-node clique with a random graph attached"""
+        G = nx.complete_graph(8)
+        H = nx.gnp_random_graph(30, 0.3, seed=7)
+        G.add_edges_from((u + 8, v + 8) for u, v in H.edges())
+        G.add_edges_from([(0, 8), (1, 9), (2, 10)])
+        self.assertAllStrategies(G, 8)
+
+    def test_string_node_labels(self):
+        """networkX Graph with strings as node labels"""
+        G = nx.Graph()
+        G.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')])
+        self.assertAllStrategies(G, 3)
+
+    def test_self_loops(self):
+        """networkX Graph with self-loops, which every strategy leaves out"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 0), (5, 1), (6, 5)])
+        G.add_edges_from((u, u) for u in (0, 3, 5))
+        loopless = nx.Graph(G.edges())
+        loopless.remove_edges_from(nx.selfloop_edges(loopless))
+        for mode in TOMITA_STRATEGIES:
+            for func in (custom_with_greedy, custom_with_partial_greedy):
+                max_clq = func(G, mode)
+                self.assertIsClique(loopless, max_clq)
+                self.assertEqual(5, len(max_clq), f"{func.__name__} with {mode}")
+
+# 3. Colouring Helpers
+    def test_color_classes_are_independent(self):
+        """Every colour class from color_classes() is an independent set covering P"""
+        G = nx.gnp_random_graph(40, 0.5, seed=3)
+        node_list, index, adj = to_bitsets(G)
+        P = (1 << len(node_list)) - 1
+        for strategy in (None, "largest_first", "random_sequential"):
+            classes = color_classes(P, adj, strategy)
+            covered = 0
+            for color in classes:
+                self.assertEqual(0, covered & color)
+                covered |= color
+                for v in iter_bits(color):
+                    self.assertEqual(0, adj[v] & color)
+            self.assertEqual(P, covered)
+
+    def test_renumber_keeps_a_valid_colouring(self):
+        """renumber_classes() only produces independent sets and never loses a node"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(30, 0.4, seed=seed)
+            node_list, index, adj = to_bitsets(G)
+            P = (1 << len(node_list)) - 1
+            classes = color_classes(P, adj)
+            renumbered = renumber_classes(classes[:], adj, max(len(classes) - 2, 1))
+            self.assertLessEqual(len(renumbered), len(classes))
+            self.assertEqual(P, sum(renumbered))
+            for color in renumbered:
+                for v in iter_bits(color):
+                    self.assertEqual(0, adj[v] & color)
+
+# 4. Against the Built-in
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs compared against find_cliques()"""
+        for seed in range(40):
+            G = nx.gnp_random_graph(35, 0.2 + 0.015 * seed, seed=seed)
+            self.assertAllStrategies(G, len(max(nx.find_cliques(G), key=len)))
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        for mode in TOMITA_STRATEGIES:
+            self.assertEqual({5, 6, 7}, custom_with_greedy(G, mode, nodes=[5]))
+
+    def test_steps_are_counted(self):
+        """The steps variants report the steps taken by the colour ordered search"""
+        G = nx.gnp_random_graph(40, 0.5, seed=11)
+        for mode in TOMITA_STRATEGIES:
+            max_clq, steps = custom_with_greedy_steps(G, mode)
+            self.assertGreater(steps, 0)
+            self.assertEqual(len(max_clique(G)), len(max_clq))
+
+# 5. Incremental Recolouring
+    def test_incremental_against_built_in(self):
+        """30 random graphs, reusing the parent colouring must not change the clique size"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(35, 0.3 + 0.015 * seed, seed=seed)
+            size = len(max(nx.find_cliques(G), key=len))
+            for mode in TOMITA_STRATEGIES + ("largest_first", "random_sequential", "DSATUR"):
+                for func in (custom_with_greedy, custom_with_partial_greedy):
+                    max_clq = func(G, mode, incremental=True)
+                    self.assertIsClique(G, max_clq)
+                    self.assertEqual(size, len(max_clq), f"{func.__name__} with {mode}")
+
+    def test_incremental_avoids_recolours(self):
+        """The stats of the steps variants report the recolours avoided"""
+        G = nx.gnp_random_graph(60, 0.6, seed=5)
+        for mode in ("largest_first", "mcq"):
+            full, inc = {}, {}
+            custom_with_greedy_steps(G, mode, backend="bitset", stats=full)
+            custom_with_greedy_steps(G, mode, backend="bitset", incremental=True, stats=inc)
+            self.assertEqual(0, full["recolors_avoided"])
+            self.assertGreater(inc["recolors_avoided"], 0)
+            self.assertLess(inc["colorings"], full["colorings"])
+
+    def test_inherit_classes_covers_child(self):
+        """inherit_classes() returns independent sets covering exactly the child candidates"""
+        G = nx.gnp_random_graph(40, 0.5, seed=9)
+        node_list, index, adj = to_bitsets(G)
+        P = (1 << len(node_list)) - 1
+        classes = color_classes(P, adj)
+        for v in range(len(node_list)):
+            inherited = inherit_classes(classes, P & adj[v], adj, 3)
+            self.assertEqual(P & adj[v], sum(inherited))
+            for color in inherited:
+                for u in iter_bits(color):
+                    self.assertEqual(0, adj[u] & color)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import networkx as nx
+import unittest
+import random
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.vertex_cover_kernel import complement, kernelize, lift
+
+# 11 Tests
+class TestVertexCoverKernel(unittest.TestCase):
+    """
+    Testing kernelize() on the complement graph and the kernelize option of max_clique(G).
+    ---A CLIQUE OF G IS AN INDEPENDENT SET OF ITS COMPLEMENT, WHICH THE VERTEX COVER RULES SHRINK---
+    Asserts for each case run through:
+        Confirming the clique mapped back from the kernel is a valid clique
+        Confirming its size matches find_cliques()
+    """
+# Custom Assertions
+    def assertIsMaxClique(self, G, clq):
+        """
+        Assert that clq is a clique as large as the largest of find_cliques().
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (set): Set of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+        self.assertEqual(max((len(c) for c in nx.find_cliques(G)), default=0), len(clq))
+
+    def assertKernelSolves(self, G):
+        """
+        Assert that a maximum clique of the kernel maps back to a maximum clique of G.
+        Parameters:
+            G (networkX.Graph): The graph
+        Returns:
+            stats (dict): The reductions applied
+        """
+        comp = complement({u: set(G[u]) - {u} for u in G})
+        stats = {}
+        taken, folds = kernelize(comp, stats)
+        kernel = nx.Graph()
+        kernel.add_nodes_from(comp)
+        kernel.add_edges_from((u, v) for u in comp for v in comp if u != v and v not in comp[u])
+        clique = max(nx.find_cliques(kernel), key=len) if len(kernel) else []
+        self.assertIsMaxClique(G, lift(clique, taken, folds))
+        return stats
+
+# 1. Reductions
+    def test_complete_graph(self):
+        """The complement of a complete graph has no edges, every node is taken"""
+        stats = self.assertKernelSolves(nx.complete_graph(8))
+        self.assertEqual(8, stats["degree_0"])
+
+    def test_folding(self):
+        """The complement of a long cycle is folded away"""
+        stats = self.assertKernelSolves(nx.complement(nx.cycle_graph(11)))
+        self.assertGreater(stats["folds"], 0)
+
+    def test_crown(self):
+        """The complement of K3,7 is a crown, none of the other rules apply to it"""
+        stats = self.assertKernelSolves(nx.complement(nx.complete_bipartite_graph(3, 7)))
+        self.assertEqual(1, stats["crown"])
+        self.assertEqual(0, stats["dominance"] + stats["folds"])
+
+    def test_random_sparse_complements(self):
+        """100 graphs whose complements are sparse random graphs"""
+        found = dict.fromkeys(("degree_0", "degree_1", "degree_2", "folds", "dominance", "crown"), 0) # Crowns are left to test_crown
+        for seed in range(100):
+            rng = random.Random(seed)
+            H = nx.gnp_random_graph(rng.randint(5, 40), rng.uniform(0.02, 0.3), seed=seed)
+            for rule, count in self.assertKernelSolves(nx.complement(H)).items():
+                found[rule] += count
+        for rule in ("degree_0", "degree_1", "degree_2", "folds", "dominance"):
+            self.assertGreater(found[rule], 0, f"{rule} was never applied")
+
+# 2. Max Clique
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertEqual(set(), max_clique(nx.Graph(), kernelize=True))
+
+    def test_dense_random_graphs(self):
+        """30 random graphs of density 0.85 to 0.99 compared against find_cliques()"""
+        for seed in range(30):
+            G = nx.gnp_random_graph(40, 0.85 + 0.005 * seed, seed=seed)
+            for backend in ("set", "bitset"):
+                self.assertIsMaxClique(G, max_clique(G, backend=backend, kernelize=True))
+
+    def test_opt_in(self):
+        """Kernelization is opt-in, a fully reduced graph needs no search"""
+        G = nx.complement(nx.cycle_graph(30))
+        max_clq, steps = max_clique_with_steps(G, kernelize=True)
+        self.assertIsMaxClique(G, max_clq)
+        self.assertEqual(0, steps)
+        self.assertGreater(max_clique_with_steps(G)[1], 0)
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complement(nx.cycle_graph(12))
+        max_clq = max_clique(G, nodes=[0], kernelize=True)
+        self.assertIn(0, max_clq)
+        self.assertIsMaxClique(G, max_clq)
+        G.add_edge(0, 0)
+        self.assertIn(0, max_clique(G, nodes=[0], kernelize=True))
+
+    def test_time_budget(self):
+        """The upper bound of the kernel carries over to G"""
+        G = nx.gnp_random_graph(60, 0.97, seed=3)
+        size = max(len(c) for c in nx.find_cliques(G))
+        max_clq = max_clique(G, time_budget=60, kernelize=True)
+        self.assertTrue(max_clq.optimal)
+        self.assertEqual(size, len(max_clq))
+        self.assertEqual(size, max_clq.upper_bound)
+
+    def test_tuple_and_large_int_labels(self):
+        """Labels that are equal without being the same object"""
+        H = nx.complement(nx.cycle_graph(14))
+        for relabel in (lambda u: (u, str(u)), lambda u: 10 ** 20 + u):
+            G = nx.relabel_nodes(H, relabel)
+            self.assertIsMaxClique(G, max_clique(G, kernelize=True))
+            self.assertKernelSolves(G)
+
+    def test_invalid_options(self):
+        """Kernelizing does not combine with symmetry or workers"""
+        with self.assertRaises(ValueError):
+            max_clique(nx.complete_graph(3), kernelize=True, symmetry=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.bitset_clique import to_bitsets, eliminate_nodes, pivot_search
+
+# 9 Tests
+class TestVertexElimination(unittest.TestCase):
+    """
+    Testing eliminate_nodes() and max_clique(G, eliminate=True) on various edge cases.
+    ---NODES OF LOW CORE NUMBER OR WITH A NEIGHBOURHOOD OF FEW COLOURS ARE REMOVED FROM THE SEARCH---
+    Asserts for each case run through:
+        Confirming no node of a larger clique is ever removed
+        Confirming the search still finds a maximum clique
+        Confirming sparse graphs need fewer steps
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertAllEliminations(self, G, size):
+        """
+        Assert that max_clique() with eliminate=True finds a valid clique of the given size.
+        Parameters:
+            G (networkX.Graph): The graph
+            size (int): The size of the maximum clique
+        """
+        for backend in ("set", "bitset"):
+            for heuristic in (False, True):
+                max_clq = max_clique(G, backend=backend, heuristic=heuristic, eliminate=True)
+                self.assertIsClique(G, max_clq)
+                self.assertEqual(size, len(max_clq), f"{backend} backend, heuristic={heuristic}")
+
+# 1. Elimination Rules
+    def test_larger_cliques_survive(self):
+        """20 random graphs, every node of a maximum clique survives any k below its size"""
+        for seed in range(20):
+            G = nx.gnp_random_graph(40, 0.1 + 0.04 * seed, seed=seed)
+            node_list, index, adj = to_bitsets(G)
+            cliques = [c for c in nx.find_cliques(G)]
+            size = max(len(c) for c in cliques)
+            for k in range(1, size):
+                alive = eliminate_nodes(adj, (1 << len(node_list)) - 1, k)
+                for clq in cliques:
+                    if len(clq) > k:
+                        for u in clq:
+                            self.assertTrue(alive >> index[u] & 1, f"{u} of {clq} removed for k={k}")
+
+    def test_triangle_free_graph(self):
+        """A 10-node cycle has no triangle, every node is removed when looking for one"""
+        node_list, index, adj = to_bitsets(nx.cycle_graph(10))
+        self.assertEqual(0, eliminate_nodes(adj, (1 << 10) - 1, 2))
+
+    def test_colouring_rule(self):
+        """K3,3 passes the core rule for k=3 but every neighbourhood is independent"""
+        node_list, index, adj = to_bitsets(nx.complete_bipartite_graph(3, 3))
+        self.assertEqual(0, eliminate_nodes(adj, (1 << 6) - 1, 3))
+
+    def test_nothing_removed_for_k_zero(self):
+        """With no clique to beat every node stays"""
+        node_list, index, adj = to_bitsets(nx.path_graph(5))
+        self.assertEqual((1 << 5) - 1, eliminate_nodes(adj, (1 << 5) - 1, 0))
+
+# 2. Against the Built-in
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs compared against find_cliques()"""
+        for seed in range(40):
+            G = nx.gnp_random_graph(35, 0.05 + 0.02 * seed, seed=seed)
+            self.assertAllEliminations(G, len(max(nx.find_cliques(G), key=len)))
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        for backend in ("set", "bitset"):
+            self.assertEqual({5, 6, 7}, max_clique(G, nodes=[5], backend=backend, eliminate=True))
+
+    def test_with_time_budget(self):
+        """Elimination keeps the proven upper bound of a finished search"""
+        G = nx.gnp_random_graph(60, 0.3, seed=2)
+        result = max_clique(G, time_budget=30, heuristic=True, eliminate=True)
+        self.assertTrue(result.optimal)
+        self.assertEqual(len(max(nx.find_cliques(G), key=len)), len(result))
+
+# 3. Sparse Graphs
+    def test_sparse_graph_takes_fewer_steps(self):
+        """A sparse 1000-node random graph, most nodes are removed before the search"""
+        G = nx.erdos_renyi_graph(1000, 0.004, seed=1)
+        size = len(max(nx.find_cliques(G), key=len))
+        for backend in ("set", "bitset"):
+            max_clq, steps = max_clique_with_steps(G, backend=backend)
+            reduced_clq, reduced_steps = max_clique_with_steps(G, backend=backend, heuristic=True, eliminate=True)
+            self.assertEqual(size, len(reduced_clq))
+            self.assertLess(reduced_steps, steps)
+
+    def test_eliminated_nodes_are_counted(self):
+        """pivot_search() reports the number of nodes it eliminated"""
+        G = nx.erdos_renyi_graph(300, 0.02, seed=3)
+        node_list, index, adj = to_bitsets(G)
+        stats = {}
+        clique, steps = pivot_search(adj, (1 << len(node_list)) - 1, stats=stats, eliminate=True)
+        self.assertGreater(stats["eliminated"], 0)
+        self.assertEqual(len(max(nx.find_cliques(G), key=len)), len(clique))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import networkx as nx
+import unittest
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.vertex_ordering import ORDERINGS, vertex_ordering
+
+# 8 Tests
+class TestVertexOrdering(unittest.TestCase):
+    """
+    Testing vertex_ordering() and the ordering option of max_clique() and branch_and_bound() on various edge cases.
+    ---THE SEARCH BRANCHES ON THE NODES IN A FIXED ORDER COMPUTED ONCE BEFORE IT STARTS---
+    Asserts for each case run through:
+        Confirming every ordering is a permutation of the nodes with the promised property
+        Confirming every ordering still finds a maximum clique
+        Confirming the branching loop follows the ordering
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertAllOrderings(self, G, solvers=("set", "bitset", "branch_and_bound")):
+        """
+        Assert that every ordering finds a clique as large as find_cliques() on every solver.
+        Parameters:
+            G (networkX.Graph): The graph
+            solvers (tuple): optional, the max_clique() backends and "branch_and_bound" to run
+        """
+        size = len(max(nx.find_cliques(G), key=len)) if len(G) else 0
+        for ordering in ORDERINGS:
+            for solver in solvers:
+                if solver == "branch_and_bound":
+                    max_clq = branch_and_bound(G, ordering=ordering)
+                else:
+                    max_clq = max_clique(G, backend=solver, ordering=ordering)
+                self.assertIsClique(G, max_clq)
+                self.assertEqual(size, len(max_clq), f"{solver} {ordering}")
+
+# 1. The Orderings
+    def test_orderings_are_permutations(self):
+        """Every ordering lists every node exactly once"""
+        G = nx.gnp_random_graph(60, 0.2, seed=1)
+        for ordering in ORDERINGS:
+            order = vertex_ordering(G, ordering)
+            self.assertEqual(len(G), len(order))
+            self.assertEqual(set(G), set(order))
+
+    def test_max_degree_and_degeneracy(self):
+        """Degrees never increase along max_degree, core numbers never increase along degeneracy"""
+        G = nx.barabasi_albert_graph(200, 3, seed=2)
+        degrees = [len(G[u]) for u in vertex_ordering(G, "max_degree")]
+        self.assertEqual(sorted(degrees, reverse=True), degrees)
+        core = nx.core_number(G)
+        cores = [core[u] for u in vertex_ordering(G, "degeneracy")]
+        self.assertEqual(sorted(cores, reverse=True), cores)
+
+    def test_min_width(self):
+        """No node has more neighbours before it in min_width order than the degeneracy"""
+        G = nx.gnp_random_graph(100, 0.1, seed=3)
+        order = vertex_ordering(G, "min_width")
+        position = {u: i for i, u in enumerate(order)}
+        width = max(sum(position[v] < position[u] for v in G[u]) for u in G)
+        self.assertEqual(max(nx.core_number(G).values()), width)
+
+    def test_unknown_ordering(self):
+        """An unknown ordering raises a ValueError"""
+        with self.assertRaises(ValueError):
+            max_clique(nx.path_graph(3), ordering="random")
+
+# 2. Against the Built-in
+    def test_random_graphs_against_built_in(self):
+        """30 random graphs compared against find_cliques(), branch_and_bound() on the smaller ones"""
+        for seed in range(30):
+            self.assertAllOrderings(nx.gnp_random_graph(40, 0.1 + 0.025 * seed, seed=seed), ("set", "bitset"))
+            self.assertAllOrderings(nx.gnp_random_graph(10, 0.1 + 0.025 * seed, seed=seed))
+
+    def test_edge_cases(self):
+        """Empty graph, single node and a complete graph"""
+        G = nx.Graph()
+        G.add_node(0)
+        for G in (nx.Graph(), G, nx.complete_graph(6)):
+            self.assertAllOrderings(G)
+
+    def test_initial_nodes_and_steps(self):
+        """The `nodes` argument and the steps variant work with every ordering"""
+        G = nx.complete_graph(5)
+        G.add_edges_from([(5, 6), (5, 7), (6, 7)])
+        for ordering in ORDERINGS:
+            for backend in ("set", "bitset"):
+                self.assertEqual({5, 6, 7}, max_clique(G, nodes=[5], backend=backend, ordering=ordering))
+                max_clq, steps = max_clique_with_steps(G, backend=backend, ordering=ordering)
+                self.assertEqual(5, len(max_clq))
+
+# 3. Branching Order
+    def test_first_branch_follows_ordering(self):
+        """Of two equal cliques the search keeps the one holding the highest degree node"""
+        for pendant in (0, 4):
+            G = nx.disjoint_union(nx.complete_graph(4), nx.complete_graph(4))
+            G.add_edge(pendant, 8)
+            expected = set(range(pendant, pendant + 4))
+            for backend in ("set", "bitset"):
+                self.assertEqual(expected, max_clique(G, backend=backend, ordering="max_degree"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import networkx as nx
+import unittest
+import random
+from functions.check_functions import *
+from functions.find_functions import *
+from functions.clique_algorithms import *
+from functions.bitset_clique import to_bitsets, weighted_color_sort
+from functions.read_DIMACS import read_dimacs_clq, set_dimacs_weights
+
+# 9 Tests
+class TestWeightedClique(unittest.TestCase):
+    """
+    Testing weighted_max_clique(nx.Graph) on various edge cases.
+    ---THE COLOURING BOUND ADDS THE HEAVIEST WEIGHT OF EVERY COLOUR CLASS---
+    Asserts for each case run through:
+        Confirming the clique the algorithm finds is a valid clique
+        Confirming its weight matches max_weight_clique() of networkX
+    """
+# Custom Assertions
+    def assertIsClique(self, G, clq):
+        """
+        Assert that clq is a valid clique.
+        Parameters:
+            G (networkX.Graph): The graph
+            clq (list): List of nodes
+        """
+        self.assertTrue(is_clique(G, clq), f"{clq} is not a valid clique")
+
+    def assertHeaviest(self, G):
+        """
+        Assert that weighted_max_clique() finds a clique as heavy as the built-in.
+        Parameters:
+            G (networkX.Graph): The graph, every node has a "weight"
+        """
+        max_clq = weighted_max_clique(G)
+        self.assertIsClique(G, max_clq)
+        expected = nx.max_weight_clique(G)[1]
+        self.assertEqual(expected, sum(G.nodes[u]["weight"] for u in max_clq))
+
+# 1. Basic Structures
+    def test_empty_graph(self):
+        """Empty networkX Graph"""
+        self.assertEqual(set(), weighted_max_clique(nx.Graph()))
+
+    def test_heavy_node_beats_large_clique(self):
+        """A single heavy node outweighs a light K4"""
+        G = nx.complete_graph(4)
+        nx.set_node_attributes(G, 1, "weight")
+        G.add_node(4, weight=10)
+        self.assertEqual({4}, weighted_max_clique(G))
+
+    def test_heavy_edge_beats_triangle(self):
+        """A heavy edge outweighs a light triangle"""
+        G = nx.Graph([(0, 1), (1, 2), (0, 2), (3, 4)])
+        nx.set_node_attributes(G, {0: 2, 1: 2, 2: 2, 3: 4, 4: 3}, "weight")
+        self.assertEqual({3, 4}, weighted_max_clique(G))
+
+    def test_unweighted(self):
+        """weight=None finds a maximum clique"""
+        for seed in range(10):
+            G = nx.gnp_random_graph(40, 0.5, seed=seed)
+            self.assertEqual(len(max_clique(G)), len(weighted_max_clique(G, weight=None)))
+
+    def test_negative_weight(self):
+        """Negative weights are rejected"""
+        G = nx.path_graph(3)
+        nx.set_node_attributes(G, {0: 1, 1: -1, 2: 1}, "weight")
+        with self.assertRaises(ValueError):
+            weighted_max_clique(G)
+
+# 2. Against the Built-in
+    def test_random_graphs_against_built_in(self):
+        """40 random graphs with random integer weights compared against max_weight_clique()"""
+        for seed in range(40):
+            G = nx.gnp_random_graph(30, 0.05 + 0.02 * seed, seed=seed)
+            rng = random.Random(seed)
+            nx.set_node_attributes(G, {u: rng.randint(1, 20) for u in G}, "weight")
+            self.assertHeaviest(G)
+
+    def test_initial_nodes(self):
+        """The `nodes` argument must be part of the returned clique"""
+        G = nx.complete_graph(4)
+        G.add_edges_from([(3, 4), (3, 5), (4, 5)])
+        nx.set_node_attributes(G, 1, "weight")
+        self.assertEqual({3, 4, 5}, weighted_max_clique(G, nodes=[5]))
+
+    def test_dimacs_weights(self):
+        """brock200_2 on 60 nodes with the (i mod 200) + 1 weights"""
+        try:
+            G = read_dimacs_clq("DIMACS_files/brock200_2.txt").subgraph(range(1, 61)).copy()
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        set_dimacs_weights(G)
+        self.assertEqual(61 % 200, G.nodes[60]["weight"])
+        self.assertHeaviest(G)
+
+# 3. Bound
+    def test_bound_is_valid(self):
+        """No clique inside the nodes up to a colour class weighs more than its bound"""
+        G = nx.gnp_random_graph(25, 0.5, seed=4)
+        rng = random.Random(4)
+        weights = [rng.randint(1, 9) for _ in G]
+        node_list, index, adj = to_bitsets(G)
+        verts, bounds = weighted_color_sort((1 << 25) - 1, adj, weights, 0)
+        for i, v in enumerate(verts):
+            H = G.subgraph(verts[:i + 1])
+            nx.set_node_attributes(H, {u: weights[u] for u in H}, "weight")
+            self.assertLessEqual(nx.max_weight_clique(H)[1], bounds[i])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"anytime_gap_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# DIMACS graphs that exceed the 10s limit of the execution time tests
+files = ["keller5", "keller6", "p_hat1500_1", "p_hat700_3", "C500_9", "brock800_2", "DSJC1000_5"]
+time_budget = 10
+
+# (label, solver) pairs, every solver takes the graph and a time_budget
+solvers = [("max_clique (bitset)", lambda G, t: max_clique(G, backend="bitset", time_budget=t)),
+           ("custom_with_greedy - largest_first (bitset)",
+            lambda G, t: custom_with_greedy(G, "largest_first", backend="bitset", time_budget=t)),
+           ("custom_with_greedy - mcq", lambda G, t: custom_with_greedy(G, "mcq", time_budget=t)),
+           ("custom_with_greedy - mcs", lambda G, t: custom_with_greedy(G, "mcs", time_budget=t)),
+           ("custom_with_partial_greedy - mcs", lambda G, t: custom_with_partial_greedy(G, "mcs", time_budget=t))]
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+
+        log_print(f"\n{name} - {G} - time budget {time_budget}s:")
+        log_print("----------------------------------------------------")
+        for label, solver in solvers:
+            start = time.time()
+            result = solver(G, time_budget)
+            runtime = time.time() - start
+            status = "optimal" if result.optimal else f"gap {result.gap}"
+            log_print(f"  {label}:  {runtime:.6f}s  clique size {len(result)}"
+                      f"  upper bound {result.upper_bound}  {status}")
+
+            self.assertTrue(is_clique(G, result))
+            self.assertGreaterEqual(result.upper_bound, len(result))
+
+    return test
+
+class TestAnytimeGap(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestAnytimeGap, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import networkx as nx
+import unittest
+import atexit
+import sys
+import time
+import tracemalloc
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"branch_and_bound_memory_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+def recursive_branch_and_bound(G):
+    """
+    The recursive branch_and_bound() this benchmark compares against, it copies the clique and
+    candidate lists at every level and prunes with one colouring taken at the root.
+    """
+    best_clique = []
+    order = list(G.nodes)
+    coloring = greedy_coloring_heuristic(G, order)
+    order.sort(key=lambda x: coloring[x])
+
+    def extend(clique, candidates):
+        nonlocal best_clique
+        if not candidates:
+            if len(clique) > len(best_clique):
+                best_clique = clique[:]
+            return
+        for node in candidates[:]:
+            new_clique = clique + [node]
+            new_candidates = [n for n in candidates if G.has_edge(node, n)]
+            max_color = max((coloring[n] for n in new_candidates), default=-1)
+            if len(new_clique) + max_color + 1 <= len(best_clique):
+                continue
+            extend(new_clique, new_candidates)
+
+    extend([], order)
+    return set(best_clique)
+
+def measure(solver, G):
+    """
+    Returns:
+        clique (set), runtime (float), peak (float): The clique, seconds taken and peak KiB allocated.
+    """
+    tracemalloc.start()
+    start = time.time()
+    clique = solver(G)
+    runtime = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return clique, runtime, peak
+
+def allocated(solver, G):
+    """
+    Sums every growth of the traced memory between two bytecodes of the solver, so memory freed and
+    allocated again is counted each time. The tracing itself adds a few bytes per bytecode.
+    Returns:
+        allocated (float): Cumulative KiB allocated.
+    """
+    tracemalloc.start()
+    state = [0, tracemalloc.get_traced_memory()[0]]
+
+    def trace(frame, event, arg):
+        frame.f_trace_opcodes = True
+        current = tracemalloc.get_traced_memory()[0]
+        if current > state[1]:
+            state[0] += current - state[1]
+        state[1] = current
+        return trace
+
+    sys.settrace(trace)
+    try:
+        solver(G)
+    finally:
+        sys.settrace(None)
+        tracemalloc.stop()
+    return state[0] / 1024
+
+# Random graphs and DIMACS prefixes (label, graph or (file, size), compare) where compare is None for the
+# largest graphs, which the recursive version can not solve in time, "peak" to run the recursive version
+# too and "allocated" to also trace the cumulative allocations of both (bytecode tracing is slow).
+# The recursive version revisits every ordering of a clique, so it only runs on the sparser graphs.
+cases = [("gnp(30, 0.3)", nx.gnp_random_graph(30, 0.3, seed=30), "allocated"),
+         ("gnp(50, 0.3)", nx.gnp_random_graph(50, 0.3, seed=50), "allocated"),
+         ("gnp(100, 0.1)", nx.gnp_random_graph(100, 0.1, seed=100), "allocated"),
+         ("gnp(100, 0.2)", nx.gnp_random_graph(100, 0.2, seed=100), "allocated"),
+         ("gnp(200, 0.05)", nx.gnp_random_graph(200, 0.05, seed=200), "allocated"),
+         ("gnp(30, 0.5)", nx.gnp_random_graph(30, 0.5, seed=30), "peak"),
+         ("hamming8_4 - first 50 nodes", ("hamming8_4", 50), "allocated"),
+         ("p_hat300_1 - first 50 nodes", ("p_hat300_1", 50), "allocated"),
+         ("p_hat300_1 - first 100 nodes", ("p_hat300_1", 100), "peak"),
+         ("p_hat300_1 - first 200 nodes", ("p_hat300_1", 200), "peak"),
+         ("keller4 - first 50 nodes", ("keller4", 50), "peak"),
+         ("brock200_2 - first 50 nodes", ("brock200_2", 50), "peak"),
+         ("brock200_2 - first 200 nodes", ("brock200_2", 200), None),
+         ("keller4 - first 171 nodes", ("keller4", 171), None),
+         ("hamming8_4 - first 256 nodes", ("hamming8_4", 256), None),
+         ("p_hat300_1 - first 300 nodes", ("p_hat300_1", 300), None),
+         ("p_hat300_2 - first 100 nodes", ("p_hat300_2", 100), None)]
+
+# Dynamically creates test cases when called
+def make_test(label, G, compare):
+    """
+    Parameters:
+        label (str): Name of the graph in the log
+        G (networkx.Graph or tuple): The graph, or the DIMACS file and number of nodes of its subgraph
+        compare (str): None, "peak" or "allocated", see cases
+    """
+    def test(self):
+        H = G
+        if isinstance(G, tuple):
+            name, size = G
+            try:
+                H = read_dimacs_clq(f"DIMACS_files/{name}.txt").subgraph(range(1, size + 1))
+            except (IndexError, FileNotFoundError) as e:
+                self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{label} - {H}:")
+        log_print("----------------------------------------------------")
+        solvers = [("branch_and_bound", branch_and_bound.__wrapped__)]
+        if compare is not None:
+            solvers.append(("recursive_branch_and_bound", recursive_branch_and_bound))
+        sizes = []
+        for name, solver in solvers:
+            clique, runtime, peak = measure(solver, H)
+            line = f"  {name:<27} {runtime:.6f}s  peak {peak:>10.1f} KiB"
+            if compare == "allocated":
+                line += f"  allocated {allocated(solver, H):>12.1f} KiB"
+            log_print(f"{line}  clique size {len(clique)}")
+            self.assertTrue(is_clique(H, clique))
+            sizes.append(len(clique))
+        self.assertEqual(1, len(set(sizes)))
+
+    return test
+
+class TestBranchAndBoundMemory(unittest.TestCase):
+    pass
+
+for i, (label, G, compare) in enumerate(cases):
+    setattr(TestBranchAndBoundMemory, f"test_{i:02d}_{label.split()[0].replace('(', '_').replace(',', '').replace(')', '')}",
+            make_test(label, G, compare))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import networkx as nx
+import unittest
+import os
+import atexit
+import tempfile
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+from functions.clique_cache import CliqueCache, built_in_max_clique
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"clique_cache_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Every subgraph is solved cold (empty cache) then warm (same cache), the cache lives in a temporary file
+directory = "DIMACS_files"
+sizes = [50, 70]
+built_in_density = 0.8 # find_cliques() enumerates too many maximal cliques on denser subgraphs
+cache_directory = tempfile.TemporaryDirectory()
+atexit.register(cache_directory.cleanup)
+cache = CliqueCache(os.path.join(cache_directory.name, "clique_cache.sqlite"))
+atexit.register(cache.close)
+
+solvers = [
+    ("max_clique_with_steps", lambda G: max_clique_with_steps(G, cache=cache)),
+    ("max_clique_with_steps (bitset)", lambda G: max_clique_with_steps(G, backend="bitset", cache=cache)),
+    ("custom_with_greedy_steps (mcs)", lambda G: custom_with_greedy_steps(G, "mcs", cache=cache)),
+    ("built_in_max_clique", lambda G: built_in_max_clique(G, cache=cache)),
+]
+
+# Dynamically creates test cases when called
+def make_test(name, graph):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file and subgraph size
+        graph (networkX.Graph()): The graph
+    """
+    def test(self):
+        log_print(f"\n{name} - {graph}:")
+        log_print("----------------------------------------------------")
+        for label, solver in solvers:
+            if label == "built_in_max_clique" and nx.density(graph) > built_in_density:
+                log_print(f"  {label:<32} skipped, density over {built_in_density}")
+                continue
+            hits = cache.hits
+            start = time.time()
+            cold = solver(graph)
+            cold_time = time.time() - start
+            seen = cache.hits > hits # Same subgraph as an earlier file, e.g. the keller prefixes
+            start = time.time()
+            warm = solver(graph)
+            warm_time = time.time() - start
+            self.assertEqual(hits + 1 + seen, cache.hits)
+            self.assertEqual(cold, warm)
+
+            max_clq = warm[0] if isinstance(warm, tuple) else warm
+            self.assertTrue(is_clique(graph, max_clq))
+            speedup = cold_time / warm_time if warm_time > 0 else float("inf")
+            log_print(f"  {label:<32} cold {cold_time:.6f}s  warm {warm_time:.6f}s  "
+                      f"speedup {speedup:>9.1f}x  clique size {len(max_clq)}" + ("  (cold run hit)" if seen else ""))
+        log_print(f"  Cache: {len(cache)} entries, {cache.total_bytes()} bytes")
+
+    return test
+
+class TestCliqueCache(unittest.TestCase):
+    pass
+
+# One test per DIMACS file and subgraph size
+for file in sorted(os.listdir(directory)):
+    filepath = os.path.join(directory, file)
+    if os.path.isfile(filepath):
+        G = read_dimacs_clq(filepath)
+        for size in sizes:
+            H = G.subgraph(range(1, size + 1))
+            test_name = f"test_{file[:-4]}_{size}v"
+            setattr(TestCliqueCache, test_name, make_test(f"{file[:-4]} ({size}v)", H))
+
+if __name__ == '__main__':
+    unittest.main()
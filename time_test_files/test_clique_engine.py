@@ -0,0 +1,60 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+from functions.search_hooks import SearchHooks, SearchCounters
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"clique_engine_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# DIMACS files solved on their first n nodes, without hooks, with hooks that do nothing and with counters
+files = ["brock200_2", "brock200_4", "keller4", "hamming8_4", "p_hat300_1", "p_hat300_2", "p_hat300_3"]
+n = 60
+str_mode = "largest_first"
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt").subgraph(range(1, n + 1))
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+
+        results = []
+        for label, hooks in (("no hooks", None), ("SearchHooks", SearchHooks()), ("SearchCounters", SearchCounters())):
+            start = time.time()
+            max_clq, steps = custom_with_greedy_steps(G, str_mode, hooks=hooks)
+            log_print(f"  {label:<16} {time.time() - start:.6f}s  clique size {len(max_clq)}  steps {steps}")
+            self.assertTrue(is_clique(G, max_clq))
+            results.append((len(max_clq), steps))
+        self.assertEqual(1, len(set(results)))
+        log_print(f"  counters         {hooks.as_dict()}")
+
+    return test
+
+class TestCliqueEngine(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestCliqueEngine, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
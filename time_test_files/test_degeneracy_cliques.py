@@ -0,0 +1,64 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.sparse_clique import degeneracy_order
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"degeneracy_cliques_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Large graphs of low degeneracy, like the ones in test_sparse_decomposition.py
+graphs = [("barabasi_albert_50000_5", lambda: nx.barabasi_albert_graph(50000, 5, seed=1)),
+          ("gnm_random_50000_250000", lambda: nx.gnm_random_graph(50000, 250000, seed=3)),
+          ("powerlaw_cluster_50000_4", lambda: nx.powerlaw_cluster_graph(50000, 4, 0.5, seed=4)),
+          ("erdos_renyi_5000_0.002", lambda: nx.erdos_renyi_graph(5000, 0.002, seed=5))]
+
+# (label, function counting the maximal cliques) compared on every graph
+runs = [("find_cliques", lambda G: sum(1 for c in nx.find_cliques(G))),
+        ("iter_maximal_cliques set", lambda G: sum(1 for c in iter_maximal_cliques(G))),
+        ("iter_maximal_cliques sparse", lambda G: sum(1 for c in iter_maximal_cliques(G, backend="sparse"))),
+        ("iter_maximal_cliques sparse, 2 workers",
+         lambda G: sum(1 for c in iter_maximal_cliques(G, backend="sparse", workers=2)))]
+
+# Dynamically creates test cases when called
+def make_test(name, build):
+    """
+    Parameters:
+        name (str): Name of the graph
+        build (function): Builds the graph
+    """
+    def test(self):
+        G = build()
+        order, core, later = degeneracy_order({u: set(G[u]) - {u} for u in G})
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+        log_print(f"  Degeneracy {max(core.values(), default=0)}")
+        counts = set()
+        for label, run in runs:
+            start = time.time()
+            count = run(G)
+            log_print(f"  {label:<40} {time.time() - start:.6f}s  maximal cliques {count}")
+            counts.add(count)
+        self.assertEqual(1, len(counts))
+
+    return test
+
+class TestDegeneracyCliques(unittest.TestCase):
+    pass
+
+for name, build in graphs:
+    setattr(TestDegeneracyCliques, f"test_{name}", make_test(name, build))
+
+if __name__ == '__main__':
+    unittest.main()
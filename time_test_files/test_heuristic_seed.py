@@ -0,0 +1,82 @@
+import networkx as nx
+import unittest
+import os
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+from functions.clique_heuristics import heuristic_clique
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"heuristic_seed_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Set of DIMACS subgraphs
+directory = "DIMACS_files"
+sizes = [50, 60, 70, 80, 90]
+
+def run_search(graph, backend, heuristic):
+    """
+    Runs max_clique_with_steps() and times it.
+    Parameters:
+        graph (networkX.Graph): The graph
+        backend (str): "set" or "bitset"
+        heuristic (bool): Seed the search with heuristic_clique()
+    Returns:
+        max_clq (set), steps (int), runtime (float)
+    """
+    start = time.time()
+    max_clq, steps = max_clique_with_steps(graph, backend=backend, heuristic=heuristic)
+    return max_clq, steps, time.time() - start
+
+# Dynamically creates test cases when called
+def make_test(name, graph):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file and subgraph size
+        graph (networkX.Graph()): The graph
+    """
+    def test(self):
+        start = time.time()
+        seed = heuristic_clique(graph)
+        log_print(f"\n{name} - {graph}:")
+        log_print("----------------------------------------------------")
+        log_print(f"  Heuristic clique:  size {len(seed)}  {time.time() - start:.6f}s")
+        for backend in ("set", "bitset"):
+            plain = run_search(graph, backend, False)
+            seeded = run_search(graph, backend, True)
+            saved = 100 * (1 - seeded[1] / plain[1]) if plain[1] else 0
+            log_print(f"  max_clique_with_steps ({backend}):")
+            log_print(f"    Unseeded:  {plain[2]:.6f}s  steps {plain[1]:>8}")
+            log_print(f"    Seeded:    {seeded[2]:.6f}s  steps {seeded[1]:>8}  ({saved:.1f}% fewer steps)")
+
+            self.assertTrue(is_clique(graph, seeded[0]))
+            self.assertEqual(len(plain[0]), len(seeded[0]))
+            self.assertLessEqual(seeded[1], plain[1])
+
+    return test
+
+class TestHeuristicSeed(unittest.TestCase):
+    pass
+
+# One test per DIMACS file and subgraph size
+for file in sorted(os.listdir(directory)):
+    filepath = os.path.join(directory, file)
+    if os.path.isfile(filepath):
+        G = read_dimacs_clq(filepath)
+        for size in sizes:
+            H = G.subgraph(range(1, size + 1))
+            test_name = f"test_{file[:-4]}_{size}v"
+            setattr(TestHeuristicSeed, test_name, make_test(f"{file[:-4]} ({size}v)", H))
+
+if __name__ == '__main__':
+    unittest.main()
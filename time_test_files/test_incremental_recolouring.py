@@ -0,0 +1,82 @@
+import networkx as nx
+import unittest
+import os
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"incremental_recolouring_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Set of DIMACS subgraphs
+directory = "DIMACS_files"
+sizes = [50, 60, 70, 80, 90]
+strategies = ["largest_first", "mcq", "mcs"]
+
+def run_strategy(graph, func, str_mode, incremental):
+    """
+    Runs one greedy variant on the bitset backend and times it.
+    Parameters:
+        graph (networkX.Graph): The graph
+        func (function): custom_with_greedy_steps or custom_with_partial_greedy_steps
+        str_mode (str): The colouring strategy
+        incremental (bool): Reuse the parent colouring
+    Returns:
+        max_clq (set), steps (int), stats (dict), runtime (float)
+    """
+    stats = {}
+    start = time.time()
+    max_clq, steps = func(graph, str_mode, backend="bitset", incremental=incremental, stats=stats)
+    return max_clq, steps, stats, time.time() - start
+
+# Dynamically creates test cases when called
+def make_test(name, graph):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file and subgraph size
+        graph (networkX.Graph()): The graph
+    """
+    def test(self):
+        log_print(f"\n{name} - {graph}:")
+        log_print("----------------------------------------------------")
+        for func in (custom_with_greedy_steps, custom_with_partial_greedy_steps):
+            for str_mode in strategies:
+                full = run_strategy(graph, func, str_mode, False)
+                inc = run_strategy(graph, func, str_mode, True)
+                log_print(f"  {func.__name__} - {str_mode}:")
+                log_print(f"    Full recolour:  {full[3]:.6f}s  steps {full[1]:>8}  colourings {full[2]['colorings']:>8}")
+                log_print(f"    Incremental:    {inc[3]:.6f}s  steps {inc[1]:>8}  colourings {inc[2]['colorings']:>8}"
+                          f"  recolours avoided {inc[2]['recolors_avoided']}")
+
+                self.assertTrue(is_clique(graph, full[0]))
+                self.assertTrue(is_clique(graph, inc[0]))
+                self.assertEqual(len(full[0]), len(inc[0]))
+
+    return test
+
+class TestIncrementalRecolouring(unittest.TestCase):
+    pass
+
+# One test per DIMACS file and subgraph size
+for file in sorted(os.listdir(directory)):
+    filepath = os.path.join(directory, file)
+    if os.path.isfile(filepath):
+        G = read_dimacs_clq(filepath)
+        for size in sizes:
+            H = G.subgraph(range(1, size + 1))
+            test_name = f"test_{file[:-4]}_{size}v"
+            setattr(TestIncrementalRecolouring, test_name, make_test(f"{file[:-4]} ({size}v)", H))
+
+if __name__ == '__main__':
+    unittest.main()
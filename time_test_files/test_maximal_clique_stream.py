@@ -0,0 +1,80 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+import tracemalloc
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"maximal_clique_stream_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Dense graphs with many maximal cliques, solved on the first n nodes.
+# Bron_Kerbosch() does not pivot and takes minutes on 30 of these nodes, so it is left out.
+files = ["C125_9", "brock200_2", "keller4", "p_hat300_2"]
+n = 60
+
+def measure(run):
+    """
+    Runs run() and returns its result, runtime and peak traced memory in KiB.
+    Parameters:
+        run (function): Takes no arguments
+    """
+    tracemalloc.start()
+    start = time.time()
+    result = run()
+    runtime = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return result, runtime, peak
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt").subgraph(range(1, n + 1))
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+
+        found, runtime, peak = measure(lambda: list(nx.find_cliques(G)))
+        log_print(f"  list(find_cliques)          {runtime:.6f}s  peak {peak:>10.1f} KiB  cliques {len(found)}")
+        count, runtime, peak = measure(lambda: sum(1 for c in iter_maximal_cliques(G)))
+        log_print(f"  iter_maximal_cliques        {runtime:.6f}s  peak {peak:>10.1f} KiB  cliques {count}")
+        self.assertEqual(len(found), count)
+        (total, histogram), runtime, peak = measure(lambda: count_maximal_cliques(G))
+        log_print(f"  count_maximal_cliques       {runtime:.6f}s  peak {peak:>10.1f} KiB  cliques {total}")
+        log_print(f"    sizes {histogram}")
+        self.assertEqual(len(found), total)
+
+        size = len(max(found, key=len))
+        max_clq, runtime, peak = measure(lambda: Bron_Kerbosch_Pivoting(G))
+        log_print(f"  Bron_Kerbosch_Pivoting      {runtime:.6f}s  peak {peak:>10.1f} KiB  clique size {len(max_clq)}")
+        self.assertTrue(is_clique(G, max_clq))
+        self.assertEqual(size, len(max_clq))
+
+    return test
+
+class TestMaximalCliqueStream(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestMaximalCliqueStream, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"maxsat_bound_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Dense DIMACS graphs where the colouring bound is loose
+files = ["C125_9", "brock200_2", "brock200_4", "gen200_p09_44", "gen200_p09_55", "MANN_a27",
+         "p_hat300_3", "C250_9", "gen400_p09_55"]
+depths = [None, 1, 2, 4]
+time_budget = 60
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+        for str_mode in ("mcs", "largest_first"):
+            log_print(f"  custom_with_greedy_steps ({str_mode}), {time_budget}s budget:")
+            for depth in depths:
+                stats = {}
+                start = time.time()
+                max_clq, steps = custom_with_greedy_steps(G, str_mode, backend="bitset", stats=stats,
+                                                          time_budget=time_budget, maxsat_depth=depth)
+                runtime = time.time() - start
+                log_print(f"    maxsat_depth {str(depth):<5} {runtime:.6f}s  clique size {len(max_clq)}"
+                          f"  optimal {max_clq.optimal}  steps {steps:>9}  colorings {stats['colorings']:>9}"
+                          f"  maxsat calls {stats.get('maxsat_calls', 0):>7}  prunes {stats.get('maxsat_prunes', 0):>7}")
+                self.assertTrue(is_clique(G, max_clq))
+
+    return test
+
+class TestMaxSATBound(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestMaxSATBound, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
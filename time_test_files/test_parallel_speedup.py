@@ -0,0 +1,72 @@
+import networkx as nx
+import unittest
+import os
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+from functions.parallel_clique import parallel_max_clique
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"parallel_speedup_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Harder DIMACS graphs (keller5 and MANN_a27 have very unbalanced root branches) and the worker counts to compare
+files = ["brock400_2", "brock400_4", "p_hat300_3", "p_hat700_1", "p_hat700_2", "brock800_2", "brock800_4",
+         "keller5", "MANN_a27"]
+worker_counts = [n for n in (1, 2, 4, 8, 16, 32) if n <= os.cpu_count()]
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+
+        start = time.time()
+        serial_clq, serial_steps = max_clique_with_steps(G, backend="bitset")
+        serial_runtime = time.time() - start
+
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+        log_print(f"  Serial (bitset):   {serial_runtime:.6f}s  clique size {len(serial_clq)}  steps {serial_steps}")
+
+        for schedule, depth in (("static", 1), ("static", 2), ("stealing", 1)):
+            for workers in worker_counts:
+                stats = {}
+                start = time.time()
+                max_clq, steps = parallel_max_clique(G, workers=workers, depth=depth, schedule=schedule, stats=stats)
+                runtime = time.time() - start
+                log_print(f"  {workers:>2} workers, {schedule} (depth {depth}):  {runtime:.6f}s"
+                          f"  speedup {serial_runtime / runtime:.2f}x  clique size {len(max_clq)}  steps {steps}")
+                for i, record in enumerate(stats["workers"]):
+                    log_print(f"      worker {i:>2}:  busy {record['busy']:.3f}s  idle {record['idle']:.3f}s"
+                              f"  frames {record['frames']}  donated {record['donated']}")
+
+                self.assertTrue(is_clique(G, max_clq))
+                self.assertEqual(len(serial_clq), len(max_clq))
+
+    return test
+
+class TestParallelSpeedup(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestParallelSpeedup, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
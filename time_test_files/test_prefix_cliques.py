@@ -0,0 +1,66 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"prefix_cliques_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# The prefix series the test and timing suites solve one at a time, solved in one pass and from scratch
+# ("one pass s" and "total s" are both the time taken up to that prefix).
+# The 0.9-density files only get small prefixes.
+files = [("brock200_2", [25, 50, 75, 80, 85, 90, 100, 150, 200]), ("brock200_4", [25, 50, 75, 80, 85, 90, 100, 150]),
+         ("p_hat300_1", [25, 50, 75, 80, 85, 90, 100, 200, 300]), ("p_hat300_2", [25, 50, 75, 80, 85, 90, 100]),
+         ("keller4", [25, 50, 75, 80, 85, 90, 100]), ("hamming8_4", [25, 50, 75, 80, 85, 90, 100]),
+         ("C125_9", [25, 50, 60, 70])]
+
+# Dynamically creates test cases when called
+def make_test(name, sizes):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+        sizes (list): Numbers of nodes of the prefixes
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+        log_print(f"  {'nodes':>5} {'size':>5} {'one pass s':>11} {'steps':>9} {'scratch s':>11} {'total s':>11}")
+
+        total = 0.0
+        for row in prefix_max_cliques(G, sizes):
+            H = G.subgraph(range(1, row["nodes"] + 1))
+            start = time.time()
+            max_clq = max_clique(H)
+            seconds = time.time() - start
+            total += seconds
+            log_print(f"  {row['nodes']:>5} {row['size']:>5} {row['seconds']:>11.6f} {row['steps']:>9} "
+                      f"{seconds:>11.6f} {total:>11.6f}")
+            self.assertTrue(is_clique(H, row["clique"]))
+            self.assertEqual(len(max_clq), row["size"])
+
+    return test
+
+class TestPrefixCliques(unittest.TestCase):
+    pass
+
+for name, sizes in files:
+    setattr(TestPrefixCliques, f"test_{name}", make_test(name, sizes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"ranked_cliques_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# DIMACS files solved on their first n nodes
+files = ["brock200_2", "brock200_4", "keller4", "hamming8_4", "p_hat300_1", "p_hat300_2", "p_hat300_3"]
+n = 80
+k = 10
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt").subgraph(range(1, n + 1))
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+
+        start = time.time()
+        size = len(max_clique(G))
+        log_print(f"  max_clique                  {time.time() - start:.6f}s  clique size {size}")
+
+        stats = {}
+        start = time.time()
+        cliques = all_maximum_cliques(G, stats=stats)
+        log_print(f"  all_maximum_cliques         {time.time() - start:.6f}s  maximum cliques {len(cliques)}"
+                  f"  steps {stats['steps']}")
+        for clq in cliques:
+            self.assertTrue(is_clique(G, clq))
+            self.assertEqual(size, len(clq))
+
+        stats = {}
+        start = time.time()
+        cliques = top_k_cliques(G, k, stats=stats)
+        log_print(f"  top_k_cliques (k={k})        {time.time() - start:.6f}s  sizes {[len(c) for c in cliques]}"
+                  f"  steps {stats['steps']}")
+        self.assertEqual(size, len(cliques[0]))
+
+        start = time.time()
+        count = sum(1 for c in iter_maximal_cliques(G, min_size=size))
+        log_print(f"  iter_maximal_cliques filter {time.time() - start:.6f}s  maximum cliques {count}")
+
+    return test
+
+class TestRankedCliques(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestRankedCliques, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
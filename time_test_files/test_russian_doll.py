@@ -0,0 +1,64 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"russian_doll_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Sparse and medium density DIMACS families solved whole by the colouring engines and the russian doll search
+files = ["p_hat300_1", "p_hat700_1", "brock200_2", "brock200_4", "p_hat300_2", "keller4",
+         "hamming8_4", "DSJC500_5"]
+engines = [("max_clique", {}), ("max_clique bitset", {"backend": "bitset"}),
+           ("russian_doll", {"russian_doll": True}), ("russian_doll min_width", {"russian_doll": True, "ordering": "min_width"})]
+time_budget = 60
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+
+        results = []
+        for label, options in engines:
+            start = time.time()
+            max_clq, steps = max_clique_with_steps(G, time_budget=time_budget, **options)
+            log_print(f"  {label:<24} {time.time() - start:.6f}s  clique size {len(max_clq):>3}  steps {steps:>9}"
+                      f"  upper bound {max_clq.upper_bound:>3}  optimal {max_clq.optimal}")
+            self.assertTrue(is_clique(G, max_clq))
+            results.append(max_clq)
+        # A finished search is exact whatever the other ones found
+        for max_clq in results:
+            for other in results:
+                self.assertLessEqual(len(other), max_clq.upper_bound)
+
+    return test
+
+class TestRussianDoll(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestRussianDoll, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
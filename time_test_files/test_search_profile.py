@@ -0,0 +1,64 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+from functions.search_hooks import SearchProfile
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"search_profile_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# DIMACS files solved on their first n nodes, profiling the full, every third and adaptive colouring schedule
+files = ["brock200_2", "brock200_4", "keller4", "hamming8_4", "p_hat300_1", "p_hat300_2", "p_hat300_3"]
+n = 60
+str_mode = "largest_first"
+solvers = [("custom_with_greedy", custom_with_greedy, {}),
+           ("custom_with_partial_greedy every 3", custom_with_partial_greedy, {"schedule": "partial"}),
+           ("custom_with_partial_greedy adaptive", custom_with_partial_greedy, {"schedule": "adaptive"})]
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt").subgraph(range(1, n + 1))
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+
+        sizes = set()
+        for label, solver, kwargs in solvers:
+            profile = SearchProfile()
+            start = time.time()
+            max_clq = solver(G, str_mode, hooks=profile, **kwargs)
+            log_print(f"  {label} ({str_mode})  {time.time() - start:.6f}s  clique size {len(max_clq)}")
+            log_print(profile.table())
+            self.assertTrue(is_clique(G, max_clq))
+            sizes.add(len(max_clq))
+        self.assertEqual(1, len(sizes))
+
+    return test
+
+class TestSearchProfile(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestSearchProfile, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
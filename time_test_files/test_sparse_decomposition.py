@@ -0,0 +1,81 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.sparse_clique import sparse_max_clique
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"sparse_decomposition_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Large graphs of low degeneracy, the set backend runs on all of them for comparison,
+# the bitset backend only on the smaller ones
+graphs = [("barabasi_albert_100000_5", lambda: nx.barabasi_albert_graph(100000, 5, seed=1)),
+          ("barabasi_albert_200000_3", lambda: nx.barabasi_albert_graph(200000, 3, seed=2)),
+          ("gnm_random_100000_500000", lambda: nx.gnm_random_graph(100000, 500000, seed=3)),
+          ("powerlaw_cluster_100000_4", lambda: nx.powerlaw_cluster_graph(100000, 4, 0.5, seed=4)),
+          ("erdos_renyi_5000_0.002", lambda: nx.erdos_renyi_graph(5000, 0.002, seed=5))]
+whole_graph_limit = 5000
+
+# (label, keyword arguments) of the sparse runs compared on every graph
+runs = [("Serial", {}),
+        ("Serial + heuristic + elimination", {"heuristic": True, "eliminate": True}),
+        ("2 workers", {"workers": 2})]
+
+# Dynamically creates test cases when called
+def make_test(name, build):
+    """
+    Parameters:
+        name (str): Name of the graph
+        build (function): Builds the graph
+    """
+    def test(self):
+        G = build()
+        stats = {}
+        start = time.time()
+        sparse_max_clique(G, stats=stats)
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+        log_print(f"  Degeneracy {stats['degeneracy']}  subproblems searched {stats['subproblems']}"
+                  f"  skipped {stats['skipped']}  ({time.time() - start:.6f}s)")
+        sizes, runtimes = set(), {}
+        for label, kwargs in runs:
+            start = time.time()
+            max_clq, steps = max_clique_with_steps(G, backend="sparse", **kwargs)
+            runtime = time.time() - start
+            runtimes[label] = runtime
+            log_print(f"  sparse {label:<35} {runtime:.6f}s  clique size {len(max_clq)}  steps {steps:>8}")
+            self.assertTrue(is_clique(G, max_clq))
+            sizes.add(len(max_clq))
+        for backend in ("set", "bitset"):
+            if backend == "bitset" and len(G) > whole_graph_limit:
+                continue
+            start = time.time()
+            max_clq, steps = max_clique_with_steps(G, backend=backend)
+            runtime = time.time() - start
+            runtimes[backend] = runtime
+            log_print(f"  {backend:<42} {runtime:.6f}s  clique size {len(max_clq)}  steps {steps:>8}")
+            sizes.add(len(max_clq))
+        log_print(f"  Serial sparse against set: {runtimes['set'] / runtimes['Serial']:.2f}x")
+        self.assertEqual(1, len(sizes))
+
+    return test
+
+class TestSparseDecomposition(unittest.TestCase):
+    pass
+
+for name, build in graphs:
+    setattr(TestSparseDecomposition, f"test_{name}", make_test(name, build))
+
+if __name__ == '__main__':
+    unittest.main()
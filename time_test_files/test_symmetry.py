@@ -0,0 +1,66 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+from functions.symmetry import orbits
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"symmetry_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Symmetric DIMACS families solved whole (prefixes break the symmetry) with and without symmetry breaking
+files = ["keller4", "hamming8_4", "MANN_a27", "keller5"]
+time_budget = 120
+
+# Dynamically creates test cases when called
+def make_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+
+        start = time.time()
+        groups = orbits({u: set(G[u]) - {u} for u in G})
+        log_print(f"  orbits                {time.time() - start:.6f}s  {len(groups)} orbits, largest {max(map(len, groups))}")
+
+        results = []
+        for label, symmetry in (("max_clique", False), ("max_clique symmetry", True)):
+            start = time.time()
+            max_clq, steps = max_clique_with_steps(G, time_budget=time_budget, symmetry=symmetry)
+            log_print(f"  {label:<21} {time.time() - start:.6f}s  clique size {len(max_clq):>3}  steps {steps:>9}"
+                      f"  upper bound {max_clq.upper_bound:>3}  optimal {max_clq.optimal}")
+            self.assertTrue(is_clique(G, max_clq))
+            results.append(max_clq)
+        # A finished search is exact whatever the other one found
+        for max_clq in results:
+            for other in results:
+                self.assertLessEqual(len(other), max_clq.upper_bound)
+
+    return test
+
+class TestSymmetry(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestSymmetry, f"test_{name}", make_test(name))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"vertex_cover_kernel_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# The 0.9-density DIMACS files, whose complements keep a minimum degree near 10 and are left as they are,
+# and denser random graphs, whose complements are sparse enough for the reductions to remove most nodes.
+files = ["C125_9", "gen200_p09_44", "gen200_p09_55", "C250_9"]
+densities = [0.95, 0.97, 0.98, 0.99]
+random_size = 200
+time_budget = 60
+
+def run(G, label):
+    """
+    Solves G with and without the kernel and logs both.
+    Parameters:
+        G (networkX.Graph): The graph
+        label (str): Heading of the log
+    """
+    log_print(f"\n{label} - {G}:")
+    log_print("----------------------------------------------------")
+    stats = {}
+    start = time.time()
+    kernel_clq, steps = kernel_clique(G, backend="bitset", time_budget=time_budget, stats=stats)
+    log_print(f"  kernel    {time.time() - start:.6f}s  size {len(kernel_clq):>3}  bound {kernel_clq.upper_bound:>3}"
+              f"  optimal {kernel_clq.optimal}  steps {steps:>9}  kernel nodes {stats['kernel_nodes']:>4}")
+    log_print("  " + "  ".join(f"{rule} {count}" for rule, count in stats.items() if rule != "kernel_nodes"))
+
+    start = time.time()
+    plain_clq, steps = max_clique_with_steps(G, backend="bitset", time_budget=time_budget, kernelize=False)
+    log_print(f"  plain     {time.time() - start:.6f}s  size {len(plain_clq):>3}  bound {plain_clq.upper_bound:>3}"
+              f"  optimal {plain_clq.optimal}  steps {steps:>9}")
+    return kernel_clq, plain_clq
+
+# Dynamically creates test cases when called
+def make_dimacs_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        kernel_clq, plain_clq = run(G, name)
+        self.assertTrue(is_clique(G, kernel_clq))
+        self.assertTrue(is_clique(G, plain_clq))
+
+    return test
+
+def make_random_test(p):
+    """
+    Parameters:
+        p (float): Edge probability of the random graph
+    """
+    def test(self):
+        G = nx.gnp_random_graph(random_size, p, seed=1)
+        kernel_clq, plain_clq = run(G, f"gnp({random_size}, {p})")
+        self.assertTrue(is_clique(G, kernel_clq))
+        self.assertTrue(is_clique(G, plain_clq))
+        if plain_clq.optimal:
+            self.assertEqual(len(plain_clq), len(kernel_clq))
+
+    return test
+
+class TestVertexCoverKernel(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestVertexCoverKernel, f"test_{name}", make_dimacs_test(name))
+for p in densities:
+    setattr(TestVertexCoverKernel, f"test_gnp_{int(p * 100)}", make_random_test(p))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"vertex_elimination_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Sparse DIMACS graphs and 1000-vertex random graphs like the ones in looped_tests/sparse_bi_test.py
+files = ["p_hat300_1", "p_hat700_1", "p_hat1500_1"]
+random_graphs = [(f"erdos_renyi_1000_{p}", nx.erdos_renyi_graph(1000, p, seed=i))
+                 for i, p in enumerate((0.003, 0.004, 0.005, 0.01, 0.05))]
+
+# (label, keyword arguments) of the runs compared on every graph
+runs = [("No elimination", {}),
+        ("Elimination", {"eliminate": True}),
+        ("Elimination + heuristic seed", {"eliminate": True, "heuristic": True})]
+
+def log_runs(self, G):
+    """
+    Runs max_clique_with_steps() with and without elimination on both backends and logs the results.
+    Parameters:
+        G (networkX.Graph): The graph
+    """
+    for backend in ("set", "bitset"):
+        log_print(f"  max_clique_with_steps ({backend}):")
+        sizes = set()
+        for label, kwargs in runs:
+            start = time.time()
+            max_clq, steps = max_clique_with_steps(G, backend=backend, **kwargs)
+            runtime = time.time() - start
+            log_print(f"    {label:<30} {runtime:.6f}s  clique size {len(max_clq)}  steps {steps:>8}")
+            self.assertTrue(is_clique(G, max_clq))
+            sizes.add(len(max_clq))
+        self.assertEqual(1, len(sizes))
+
+# Dynamically creates test cases when called
+def make_dimacs_test(name):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+        log_runs(self, G)
+
+    return test
+
+def make_random_test(name, G):
+    """
+    Parameters:
+        name (str): Name of the random graph
+        G (networkX.Graph): The graph
+    """
+    def test(self):
+        log_print(f"\n{name} - {G}:")
+        log_print("----------------------------------------------------")
+        log_runs(self, G)
+
+    return test
+
+class TestVertexElimination(unittest.TestCase):
+    pass
+
+for name in files:
+    setattr(TestVertexElimination, f"test_{name}", make_dimacs_test(name))
+for name, G in random_graphs:
+    setattr(TestVertexElimination, f"test_{name}", make_random_test(name, G))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import networkx as nx
+import unittest
+import os
+import atexit
+import multiprocessing
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+from functions.vertex_ordering import ORDERINGS
+
+def wrapper(q, func, args, kwargs):
+    try:
+        start = time.time()
+        res = func(*args, **kwargs)
+        end = time.time()
+        q.put((res, end - start, False))
+    except Exception as e:
+        q.put((None, None, True))
+
+def run_with_timeout(func, *args, timeout=10, **kwargs):
+    q = multiprocessing.Queue()
+    p = multiprocessing.Process(target=wrapper, args=(q, func, args, kwargs))
+    p.start()
+    p.join(timeout)
+    if p.is_alive():
+        p.terminate()
+        p.join()
+        return None, None, True  # timed out
+    else:
+        if not q.empty():
+            return q.get()  # (result, runtime, error_flag)
+        else:
+            return None, None, True  # something went wrong
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"vertex_ordering_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# Set of DIMACS subgraphs, every solver runs on the same prefixes under the same time limit;
+# below 90 nodes most files are solved in milliseconds, the sparse ones only slow down near 300
+directory = "DIMACS_files"
+sizes = [90, 150, 200, 300]
+time_budget = 30
+orderings = (None,) + ORDERINGS
+
+# Dynamically creates test cases when called
+def make_test(name, graph):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file and subgraph size
+        graph (networkX.Graph()): The graph
+    """
+    def test(self):
+        log_print(f"\n{name} - {graph}:")
+        log_print("----------------------------------------------------")
+        sizes = set()
+        for backend in ("set", "bitset"):
+            log_print(f"  max_clique_with_steps ({backend}), {time_budget}s budget:")
+            for ordering in orderings:
+                start = time.time()
+                max_clq, steps = max_clique_with_steps(graph, backend=backend, time_budget=time_budget,
+                                                       ordering=ordering)
+                runtime = time.time() - start
+                log_print(f"    {str(ordering):<12} {runtime:.6f}s  clique size {len(max_clq)}"
+                          f"  optimal {max_clq.optimal}  steps {steps:>9}")
+                self.assertTrue(is_clique(graph, max_clq))
+                if max_clq.optimal:
+                    sizes.add(len(max_clq))
+
+        log_print(f"  branch_and_bound, {time_budget}s limit:")
+        for ordering in orderings:
+            result, runtime, error = run_with_timeout(branch_and_bound, graph, ordering, timeout=time_budget)
+            if error:
+                log_print(f"    {str(ordering):<12} exceeded {time_budget}s")
+            else:
+                log_print(f"    {str(ordering):<12} {runtime:.6f}s  clique size {len(result)}")
+                self.assertTrue(is_clique(graph, result))
+                sizes.add(len(result))
+        self.assertLessEqual(len(sizes), 1)
+
+    return test
+
+class TestVertexOrdering(unittest.TestCase):
+    pass
+
+# One test per DIMACS file and subgraph size
+for file in sorted(os.listdir(directory)):
+    filepath = os.path.join(directory, file)
+    if os.path.isfile(filepath):
+        G = read_dimacs_clq(filepath)
+        for size in sizes:
+            if size > len(G):
+                break
+            H = G.subgraph(range(1, size + 1))
+            test_name = f"test_{file[:-4]}_{size}v"
+            setattr(TestVertexOrdering, test_name, make_test(f"{file[:-4]} ({size}v)", H))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import networkx as nx
+import unittest
+import atexit
+import time
+from datetime import datetime as dt
+from functions.clique_algorithms import *
+from functions.check_functions import *
+from functions.read_DIMACS import *
+
+# Setting up Results File
+now = dt.now().strftime("%Y-%m-%d")
+log_file_path = f"weighted_clique_results_{now}.txt"
+log_file = open(log_file_path, "a")
+
+def log_print(*args, **kwargs):
+    print(*args, **kwargs, file=log_file)
+
+# Closes file on exit
+atexit.register(log_file.close)
+
+# DIMACS files with the standard (i mod 200) + 1 weights, solved on their first nodes.
+# The 0.9-density files are only solved on small prefixes. The built-in is only run on the smaller subgraphs.
+files = [("brock200_2", [50, 100, 200]), ("brock200_4", [50, 100, 200]), ("hamming8_4", [50, 100, 200]),
+         ("keller4", [50, 100, 200]), ("p_hat300_1", [50, 100, 200]), ("p_hat300_2", [50, 100, 200]),
+         ("p_hat300_3", [50, 75, 100]), ("C125_9", [50, 75]), ("gen200_p09_44", [50, 75])]
+built_in_limit = 50
+
+# Dynamically creates test cases when called
+def make_test(name, size):
+    """
+    Parameters:
+        name (str): Name of the DIMACS file
+        size (int): Number of nodes in the subgraph
+    """
+    def test(self):
+        try:
+            G = read_dimacs_clq(f"DIMACS_files/{name}.txt")
+        except (IndexError, FileNotFoundError) as e:
+            self.skipTest(f"Skipping test due to {e}")
+        H = set_dimacs_weights(G.subgraph(range(1, size + 1)).copy())
+        log_print(f"\n{name} - first {size} nodes - {H}:")
+        log_print("----------------------------------------------------")
+
+        stats = {}
+        start = time.time()
+        max_clq = weighted_max_clique(H, stats=stats)
+        weight = sum(H.nodes[u]["weight"] for u in max_clq)
+        log_print(f"  weighted_max_clique    {time.time() - start:.6f}s  weight {weight:>6}  size {len(max_clq):>3}"
+                  f"  steps {stats['steps']:>8}  colorings {stats['colorings']:>8}")
+        self.assertTrue(is_clique(H, max_clq))
+
+        if size <= built_in_limit:
+            start = time.time()
+            built_in = nx.max_weight_clique(H)[1]
+            log_print(f"  nx.max_weight_clique   {time.time() - start:.6f}s  weight {built_in:>6}")
+            self.assertEqual(built_in, weight)
+
+    return test
+
+class TestWeightedClique(unittest.TestCase):
+    pass
+
+for name, sizes in files:
+    for size in sizes:
+        setattr(TestWeightedClique, f"test_{name}_{size}", make_test(name, size))
+
+if __name__ == '__main__':
+    unittest.main()